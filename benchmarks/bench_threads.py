@@ -0,0 +1,146 @@
+# benchmarks/bench_threads.py
+"""
+Multi-threaded throughput benchmark for a shared LocaleData.
+
+Runs a mixed workload (plain lookups, nested list lookups, plural renders and
+misses) from N threads against one LocaleData instance and reports how the
+throughput scales with the number of threads. Most useful on free-threaded
+CPython builds (e.g. 3.13t), where a GIL no longer hides shared-state contention.
+
+Usage (from the project root):
+
+    python -m benchmarks.bench_threads --threads 1 2 4 8 16 32 --ops 20000
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import (
+    Dict,
+    List
+)
+
+import yaml
+
+from src.doti18n import LocaleData
+
+
+def _write_catalog(locales_dir: str, keys: int = 200) -> None:
+    """Writes a small 'en'/'ru' catalog with plain, nested, list and plural keys."""
+    for locale in ('en', 'ru'):
+        data = {
+            'messages': {f'key_{i}': f'{locale} message {i}' for i in range(keys)},
+            'pages': [{'title': f'{locale} page {i}'} for i in range(10)],
+            'cart': {
+                'items': {
+                    'one': '{count} item',
+                    'few': '{count} items (few)',
+                    'many': '{count} items (many)',
+                    'other': '{count} items',
+                }
+            },
+        }
+        if locale == 'ru':
+            # Leave half the messages untranslated, so lookups exercise the fallback path
+            data['messages'] = {k: v for i, (k, v) in enumerate(data['messages'].items()) if i % 2}
+        with open(os.path.join(locales_dir, f'{locale}.yaml'), 'w', encoding='utf-8') as f:
+            yaml.dump(data, f, allow_unicode=True)
+
+
+def _workload(data: LocaleData, ops: int, keys: int) -> None:
+    """The mixed per-thread workload: for every 8 ops, 4 lookups, 2 list lookups, 1 plural and 1 miss."""
+    for i in range(ops // 8):
+        translator = data['ru' if i & 1 else 'en']
+        key = f'key_{i % keys}'
+        getattr(translator.messages, key)
+        getattr(translator.messages, key)
+        getattr(translator.messages, key)
+        getattr(translator.messages, key)
+        translator.pages[i % 10].title
+        translator.pages[(i + 1) % 10].title
+        translator.cart.items(i % 30)
+        translator.messages.does_not_exist
+
+
+def run(thread_counts: List[int], ops: int, keys: int = 200) -> Dict[str, object]:
+    """
+    Runs the workload for every thread count and returns the results.
+
+    :param thread_counts: Thread counts to measure (e.g., [1, 2, 4]).
+    :param ops: Number of operations performed by each thread.
+    :param keys: Number of distinct message keys in the catalog.
+    :return: A JSON-serializable dictionary with per-thread-count throughput.
+    """
+    # Misses are part of the workload, but their warnings would dominate the measurement
+    logging.getLogger(LocaleData.__module__.rpartition('.')[0]).setLevel(logging.ERROR)
+
+    with tempfile.TemporaryDirectory() as locales_dir:
+        _write_catalog(locales_dir, keys)
+        data = LocaleData(locales_dir, default_locale='en')
+        # Warm up translator and plural rule caches, so the first measurement isn't penalized
+        _workload(data, 800, keys)
+
+        results = []
+        baseline = None
+        for threads in thread_counts:
+            barrier = threading.Barrier(threads + 1)
+
+            def worker():
+                barrier.wait()
+                _workload(data, ops, keys)
+
+            pool = [threading.Thread(target=worker) for _ in range(threads)]
+            for thread in pool:
+                thread.start()
+            barrier.wait()
+            start = time.perf_counter()
+            for thread in pool:
+                thread.join()
+            elapsed = time.perf_counter() - start
+
+            throughput = threads * ops / elapsed
+            if baseline is None:
+                baseline = throughput / threads
+            results.append({
+                'threads': threads,
+                'seconds': elapsed,
+                'ops_per_second': throughput,
+                # 1.0 means perfectly linear scaling relative to the first measurement
+                'scaling_efficiency': throughput / (baseline * threads),
+            })
+
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return {
+        'python': sys.version,
+        'gil_enabled': is_gil_enabled() if is_gil_enabled else True,
+        'ops_per_thread': ops,
+        'results': results,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument('--ops', type=int, default=20000, help="operations per thread")
+    parser.add_argument('--json', metavar='PATH', help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    report = run(args.threads, args.ops)
+    print(f"Python {report['python'].split()[0]}, GIL enabled: {report['gil_enabled']}")
+    print(f"{'threads':>8} {'ops/s':>14} {'efficiency':>11}")
+    for row in report['results']:
+        print(f"{row['threads']:>8} {row['ops_per_second']:>14,.0f} {row['scaling_efficiency']:>10.0%}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
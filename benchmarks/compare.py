@@ -0,0 +1,225 @@
+# benchmarks/compare.py
+"""
+Performance regression gate for the benchmark suite.
+
+Compares benchmark results (see benchmarks.run) with a stored baseline and exits
+with status 1 if a benchmark got slower (or bigger) than allowed. A benchmark
+regresses when its median grew by more than the threshold relative to the
+baseline median, and by more than the noise of both runs (the larger of their
+interquartile ranges), so a single noisy sample can't fail the gate.
+
+Usage (from the project root):
+
+    # Run the suite with the baseline's parameters and compare
+    python -m benchmarks.compare --baseline benchmarks/baseline.json --repeat 5
+
+    # Compare two stored results, allowing 25% more load time
+    python -m benchmarks.compare --baseline benchmarks/baseline.json --current results.json --threshold load=0.25
+
+    # Record a new baseline (on the machine that runs the gate)
+    python -m benchmarks.compare --baseline benchmarks/baseline.json --update --repeat 7
+"""
+
+import argparse
+import json
+import statistics
+import sys
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence
+)
+
+# Relative median growth allowed by default
+DEFAULT_THRESHOLD = 0.10
+
+# Parameters that change what is measured; results with different values can't be compared
+_COMPARED_PARAMS = ('locales', 'keys', 'depth', 'list_width', 'plural_density', 'coverage', 'lookups', 'storage')
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    """
+    Returns the median and the interquartile range of benchmark samples.
+
+    :param samples: The samples of one benchmark, at least one.
+    :return: A dictionary with `median`, `q1`, `q3` and `iqr`. With fewer than two
+             samples the quartiles equal the median.
+    """
+    median = statistics.median(samples)
+    if len(samples) < 2:
+        return {'median': median, 'q1': median, 'q3': median, 'iqr': 0.0}
+    q1, _, q3 = statistics.quantiles(samples, n=4, method='inclusive')
+    return {'median': median, 'q1': q1, 'q3': q3, 'iqr': q3 - q1}
+
+
+def compare(
+        baseline: Dict[str, Any],
+        current: Dict[str, Any],
+        threshold: float = DEFAULT_THRESHOLD,
+        thresholds: Optional[Dict[str, float]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Compares two benchmark reports.
+
+    :param baseline: The stored report (the result of `benchmarks.run.run`).
+    :param current: The report to check.
+    :param threshold: The relative median growth allowed, e.g. 0.1 for 10%.
+    :param thresholds: Benchmark name -> threshold, overriding `threshold` for that benchmark.
+    :return: One row per benchmark of either report, in baseline order: `name`, `unit`,
+             `baseline` and `current` (summaries, see `summarize`, or None if the report
+             lacks the benchmark), `change` (relative median change, or None), `allowed`
+             (the absolute median growth tolerated) and `status`: 'ok', 'regression',
+             'improvement', 'new' or 'missing'.
+    """
+    thresholds = thresholds or {}
+    names = list(baseline['benchmarks'])
+    names += [name for name in current['benchmarks'] if name not in baseline['benchmarks']]
+
+    rows = []
+    for name in names:
+        base_result = baseline['benchmarks'].get(name)
+        current_result = current['benchmarks'].get(name)
+        row: Dict[str, Any] = {
+            'name': name,
+            'unit': (base_result or current_result)['unit'],
+            'baseline': summarize(base_result['samples']) if base_result else None,
+            'current': summarize(current_result['samples']) if current_result else None,
+            'change': None,
+            'allowed': None,
+        }
+        if base_result is None:
+            row['status'] = 'new'
+        elif current_result is None:
+            row['status'] = 'missing'
+        else:
+            base, cur = row['baseline'], row['current']
+            delta = cur['median'] - base['median']
+            noise = max(base['iqr'], cur['iqr'])
+            allowed = max(thresholds.get(name, threshold) * base['median'], noise)
+            row['change'] = delta / base['median'] if base['median'] else None
+            row['allowed'] = allowed
+            if delta > allowed:
+                row['status'] = 'regression'
+            elif -delta > allowed:
+                row['status'] = 'improvement'
+            else:
+                row['status'] = 'ok'
+        rows.append(row)
+    return rows
+
+
+def params_mismatch(baseline: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, tuple]:
+    """
+    Returns the catalog and workload parameters that differ between two reports.
+
+    :return: Parameter name -> (baseline value, current value).
+    """
+    return {
+        name: (baseline['params'].get(name), current['params'].get(name))
+        for name in _COMPARED_PARAMS
+        if baseline['params'].get(name) != current['params'].get(name)
+    }
+
+
+def format_rows(rows: List[Dict[str, Any]]) -> str:
+    """Formats the result of `compare` as a table, one line per benchmark."""
+    def value(summary: Optional[Dict[str, float]], unit: str) -> str:
+        if summary is None:
+            return '-'
+        return f"{summary['median']:,.3f} {unit} ±{summary['iqr']:,.3f}"
+
+    header = ('benchmark', 'baseline (median ±IQR)', 'current (median ±IQR)', 'change', 'status')
+    lines = [header]
+    for row in rows:
+        change = f"{row['change']:+.1%}" if row['change'] is not None else '-'
+        status = row['status'].upper() if row['status'] == 'regression' else row['status']
+        lines.append((
+            row['name'], value(row['baseline'], row['unit']), value(row['current'], row['unit']), change, status
+        ))
+    widths = [max(len(line[column]) for line in lines) for column in range(len(header))]
+    return '\n'.join(
+        '  '.join(cell.ljust(width) if column == 0 else cell.rjust(width)
+                  for column, (cell, width) in enumerate(zip(line, widths))).rstrip()
+        for line in lines
+    )
+
+
+def _parse_thresholds(values: List[str]) -> tuple:
+    """Splits `--threshold` values into the default threshold and per-benchmark overrides."""
+    default, overrides = DEFAULT_THRESHOLD, {}
+    for item in values:
+        name, sep, number = item.rpartition('=')
+        if sep:
+            overrides[name] = float(number)
+        else:
+            default = float(number)
+    return default, overrides
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--baseline', required=True, help="the stored baseline JSON")
+    parser.add_argument('--current', help="results JSON to check; if omitted, the suite is run "
+                                          "with the baseline's parameters")
+    parser.add_argument('--repeat', type=int, help="repetitions when running the suite "
+                                                   "(default: as in the baseline)")
+    parser.add_argument('--threshold', action='append', default=[], metavar='[NAME=]RATIO',
+                        help=f"allowed relative median growth, default {DEFAULT_THRESHOLD}; "
+                             f"NAME=RATIO sets it for one benchmark (repeatable)")
+    parser.add_argument('--update', action='store_true', help="write the current results as the new baseline")
+    parser.add_argument('--json', metavar='PATH', help="also write the current results to this JSON file")
+    args = parser.parse_args(argv)
+    threshold, thresholds = _parse_thresholds(args.threshold)
+
+    baseline = None
+    if not args.update or args.current is None:
+        try:
+            with open(args.baseline, encoding='utf-8') as f:
+                baseline = json.load(f)
+        except FileNotFoundError:
+            if not args.update:
+                print(f"Baseline '{args.baseline}' not found, pass --update to create it.", file=sys.stderr)
+                return 2
+
+    if args.current:
+        with open(args.current, encoding='utf-8') as f:
+            current = json.load(f)
+    else:
+        from .run import run
+
+        params = dict(baseline['params']) if baseline else {}
+        if args.repeat is not None:
+            params['repeat'] = args.repeat
+        current = run(**params)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+    if args.update:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+            f.write('\n')
+        print(f"Wrote the baseline to {args.baseline}")
+        return 0
+
+    mismatch = params_mismatch(baseline, current)
+    if mismatch:
+        for name, (base_value, current_value) in mismatch.items():
+            print(f"Parameter {name!r} differs: baseline {base_value!r}, current {current_value!r}", file=sys.stderr)
+        print("The results are not comparable.", file=sys.stderr)
+        return 2
+
+    rows = compare(baseline, current, threshold, thresholds)
+    print(format_rows(rows))
+    regressions = [row['name'] for row in rows if row['status'] == 'regression']
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed: {', '.join(regressions)}")
+        return 1
+    print("\nNo regressions.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
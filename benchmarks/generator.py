@@ -0,0 +1,174 @@
+# benchmarks/generator.py
+"""
+Synthetic catalog generator for the benchmarks.
+
+Writes one YAML file per locale into a directory and returns the paths the
+benchmarks need (plain leaves, list items, plural keys, fallback paths), so
+every benchmark works on any generated shape.
+
+Usage (from the project root):
+
+    python -m benchmarks.generator /tmp/catalog --locales 10 --keys 50000 --depth 4
+"""
+
+import argparse
+import os
+import random
+import sys
+from typing import (
+    Any,
+    Dict,
+    List,
+    Union
+)
+
+import yaml
+
+Path = List[Union[str, int]]
+
+PLURAL_FORMS = {
+    'one': '{count} item',
+    'few': '{count} items (few)',
+    'many': '{count} items (many)',
+    'other': '{count} items',
+}
+
+
+def _locale_codes(count: int) -> List[str]:
+    """'en' first, then real-looking codes, so plural rules and fallbacks behave like in production."""
+    known = ['en', 'ru', 'de', 'fr', 'es', 'pt', 'pt-br', 'it', 'pl', 'uk', 'ja', 'zh', 'ar', 'cs', 'nl', 'sv']
+    return known[:count] + [f'x{index}' for index in range(count - len(known))]
+
+
+def _set_path(tree: Dict[str, Any], path: Path, value: Any) -> None:
+    node: Any = tree
+    for key, next_key in zip(path, path[1:]):
+        if isinstance(key, int):
+            while len(node) <= key:
+                node.append({})
+            node = node[key]
+        else:
+            node = node.setdefault(key, [] if isinstance(next_key, int) else {})
+    last = path[-1]
+    if isinstance(last, int):
+        while len(node) <= last:
+            node.append(None)
+    node[last] = value
+
+
+def generate_catalog(
+        locales_dir: str,
+        locales: int = 3,
+        keys: int = 1000,
+        depth: int = 3,
+        list_width: int = 5,
+        plural_density: float = 0.1,
+        coverage: float = 0.8,
+        seed: int = 0
+) -> Dict[str, Any]:
+    """
+    Writes a synthetic catalog and describes it.
+
+    Leaves are spread over nested namespaces `depth` levels deep (the leaf key included).
+    Every tenth group of leaves lives in a list of `list_width` items instead of a dict.
+    A `plural_density` fraction of the leaves are plural dicts. The default locale ('en')
+    has every leaf; every other locale has each leaf with probability `coverage`, the
+    rest falls back to the default locale.
+
+    :param locales_dir: The directory to write the locale files to (created if needed).
+    :param locales: The number of locales.
+    :param keys: The number of leaves of the default locale.
+    :param depth: The number of path segments of a leaf outside lists (at least 1).
+    :param list_width: The number of items of each list.
+    :param plural_density: The fraction of leaves that are plural dicts.
+    :param coverage: The fraction of leaves translated in the non-default locales.
+    :param seed: Seed of the random generator, the same arguments always give the same catalog.
+    :return: A dictionary with `locales` (codes, the default first), `leaves` (paths of plain
+             string leaves), `list_leaves`, `plural_leaves` and `fallback_leaves` (locale code ->
+             paths of plain leaves that locale doesn't translate).
+    """
+    rng = random.Random(seed)
+    codes = _locale_codes(locales)
+    depth = max(depth, 1)
+    fanout = max(2, round(keys ** (1 / depth))) if depth > 1 else keys
+
+    leaves: List[Path] = []
+    list_leaves: List[Path] = []
+    plural_leaves: List[Path] = []
+    for index in range(keys):
+        # Positional namespaces: ns_<a>.grp_<b>...key_<index>
+        prefix: Path = []
+        rest = index // fanout
+        for level in range(depth - 1):
+            if level == depth - 2:
+                # The top level takes whatever is left, so that distinct groups never share a prefix
+                prefix.insert(0, f'ns_{rest}')
+            else:
+                prefix.insert(0, f'grp_{rest % fanout}')
+                rest //= fanout
+        if prefix and (index // fanout) % 10 == 9:
+            # Every tenth group becomes a list of items
+            path = prefix + [index % list_width, f'key_{index // list_width % fanout}']
+            list_leaves.append(path)
+        elif rng.random() < plural_density:
+            path = prefix + [f'key_{index}']
+            plural_leaves.append(path)
+        else:
+            path = prefix + [f'key_{index}']
+            leaves.append(path)
+
+    os.makedirs(locales_dir, exist_ok=True)
+    dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+    fallback_leaves: Dict[str, List[Path]] = {}
+    for locale in codes:
+        tree: Dict[str, Any] = {}
+        missing: List[Path] = []
+        for kind, paths in (('leaf', leaves), ('list', list_leaves), ('plural', plural_leaves)):
+            for path in paths:
+                if locale != codes[0] and rng.random() >= coverage:
+                    if kind == 'leaf':
+                        missing.append(path)
+                    continue
+                if kind == 'plural':
+                    value: Any = {form: f'{locale} {template}' for form, template in PLURAL_FORMS.items()}
+                else:
+                    value = f'{locale} text for {".".join(map(str, path))}'
+                _set_path(tree, path, value)
+        fallback_leaves[locale] = missing
+        with open(os.path.join(locales_dir, f'{locale}.yaml'), 'w', encoding='utf-8') as f:
+            yaml.dump(tree, f, Dumper=dumper, allow_unicode=True)
+
+    return {
+        'locales': codes,
+        'leaves': leaves,
+        'list_leaves': list_leaves,
+        'plural_leaves': plural_leaves,
+        'fallback_leaves': fallback_leaves,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('locales_dir')
+    parser.add_argument('--locales', type=int, default=3)
+    parser.add_argument('--keys', type=int, default=1000, help="leaves of the default locale")
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--list-width', type=int, default=5)
+    parser.add_argument('--plural-density', type=float, default=0.1)
+    parser.add_argument('--coverage', type=float, default=0.8)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    info = generate_catalog(
+        args.locales_dir, args.locales, args.keys, args.depth,
+        args.list_width, args.plural_density, args.coverage, args.seed
+    )
+    print(
+        f"Wrote {len(info['locales'])} locales to {args.locales_dir}: {len(info['leaves'])} plain, "
+        f"{len(info['list_leaves'])} list and {len(info['plural_leaves'])} plural leaves per full locale."
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
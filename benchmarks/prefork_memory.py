@@ -0,0 +1,116 @@
+# benchmarks/prefork_memory.py
+"""
+Measures how much of a LocaleData stays shared between forked worker processes.
+
+Loads a synthetic catalog in the parent, optionally calls `LocaleData.freeze()`,
+forks workers that each resolve every key once, and reports the shared and
+private memory of every worker as seen in /proc/<pid>/smaps_rollup.
+Linux only.
+
+Usage (from the project root):
+
+    python -m benchmarks.prefork_memory --keys 50000 --workers 4
+"""
+
+import argparse
+import gc
+import logging
+import os
+import sys
+import tempfile
+from typing import (
+    Dict,
+    List
+)
+
+import yaml
+
+from src.doti18n import LocaleData
+
+
+def _write_catalog(locales_dir: str, locales: int, keys: int) -> None:
+    """Writes `locales` locale files with `keys` leaves each, spread over 100 namespaces."""
+    for index in range(locales):
+        locale = 'en' if index == 0 else f'l{index}'
+        data: Dict[str, Dict[str, str]] = {}
+        for key in range(keys):
+            data.setdefault(f'ns_{key % 100}', {})[f'key_{key}'] = f'{locale} translation for key number {key}'
+        with open(os.path.join(locales_dir, f'{locale}.yaml'), 'w', encoding='utf-8') as f:
+            yaml.dump(data, f, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper))
+
+
+def _memory_kb() -> Dict[str, int]:
+    """Returns the Shared/Private totals (in kB) of the current process."""
+    totals = {'shared': 0, 'private': 0}
+    with open('/proc/self/smaps_rollup', encoding='ascii') as f:
+        for line in f:
+            name, _, value = line.partition(':')
+            if name.startswith('Shared_'):
+                totals['shared'] += int(value.split()[0])
+            elif name.startswith('Private_'):
+                totals['private'] += int(value.split()[0])
+    return totals
+
+
+def _touch_everything(data: LocaleData, keys: int) -> None:
+    """Resolves every key of every locale once, like a long-lived worker eventually does."""
+    for locale in data.loaded_locales:
+        translator = data[locale]
+        for key in range(keys):
+            getattr(getattr(translator, f'ns_{key % 100}'), f'key_{key}')
+    gc.collect()
+
+
+def measure(data: LocaleData, keys: int, workers: int) -> List[Dict[str, int]]:
+    """Forks `workers` children, lets each touch the whole catalog and collects their memory totals."""
+    results = []
+    for _ in range(workers):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # Child
+            os.close(read_fd)
+            _touch_everything(data, keys)
+            usage = _memory_kb()
+            os.write(write_fd, f"{usage['shared']} {usage['private']}".encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        with os.fdopen(read_fd) as pipe:
+            shared, private = map(int, pipe.read().split())
+        os.waitpid(pid, 0)
+        results.append({'shared_kb': shared, 'private_kb': private})
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--locales', type=int, default=3)
+    parser.add_argument('--keys', type=int, default=20000, help="leaves per locale")
+    parser.add_argument('--workers', type=int, default=2)
+    args = parser.parse_args(argv)
+
+    if not os.path.exists('/proc/self/smaps_rollup'):
+        print("This benchmark needs Linux with /proc/<pid>/smaps_rollup.", file=sys.stderr)
+        return 1
+
+    logging.getLogger(LocaleData.__module__.rpartition('.')[0]).setLevel(logging.ERROR)
+    with tempfile.TemporaryDirectory() as locales_dir:
+        _write_catalog(locales_dir, args.locales, args.keys)
+        for frozen in (False, True):
+            data = LocaleData(locales_dir, default_locale='en')
+            if frozen:
+                data.freeze()
+            results = measure(data, args.keys, args.workers)
+            if frozen and hasattr(gc, 'unfreeze'):
+                gc.unfreeze()
+
+            print(f"freeze() {'called' if frozen else 'not called'}:")
+            for index, row in enumerate(results):
+                print(f"  worker {index}: shared {row['shared_kb']:>9,} kB   private {row['private_kb']:>9,} kB")
+            del data
+            gc.collect()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,208 @@
+# benchmarks/run.py
+"""
+Single-process benchmark suite for LocaleData.
+
+Generates a synthetic catalog (see benchmarks.generator) and measures load time,
+first and repeated lookup latency, fallback lookups, list lookups, plural renders,
+misses in strict and non-strict mode, and the memory of the loaded catalog.
+Every benchmark is run `--repeat` times; all samples and their median are
+written as JSON, so runs can be compared (see benchmarks.compare).
+
+Usage (from the project root):
+
+    python -m benchmarks.run --keys 20000 --locales 5 --json results.json
+"""
+
+import argparse
+import gc
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Union
+)
+
+from src.doti18n import LocaleData
+from .generator import generate_catalog
+
+Path = List[Union[str, int]]
+
+# Benchmark name -> unit. Lookup latencies are per operation.
+BENCHMARKS = {
+    'load': 's',
+    'first_lookup': 'us',
+    'repeated_lookup': 'us',
+    'fallback_lookup': 'us',
+    'list_lookup': 'us',
+    'plural_render': 'us',
+    'miss_non_strict': 'us',
+    'miss_strict': 'us',
+    'memory': 'bytes',
+}
+
+
+def _resolve(translator: Any, path: Path) -> Any:
+    value = translator
+    for key in path:
+        value = value[key] if isinstance(key, int) else getattr(value, key)
+    return value
+
+
+def _per_op_us(func: Callable[[], int]) -> float:
+    """Runs `func`, which returns the number of operations it performed, and returns microseconds per op."""
+    start = time.perf_counter()
+    ops = func()
+    return (time.perf_counter() - start) / max(ops, 1) * 1e6
+
+
+def _sample(locales_dir: str, info: Dict[str, Any], lookups: int, **options: Any) -> Dict[str, float]:
+    """Measures every benchmark once, on a freshly loaded LocaleData."""
+    results: Dict[str, float] = {}
+    default, other = info['locales'][0], info['locales'][-1]
+    leaves = info['leaves'][:lookups]
+    list_leaves = info['list_leaves'][:lookups]
+    plural_leaves = info['plural_leaves'][:lookups]
+    fallback_leaves = info['fallback_leaves'][other][:lookups]
+    missing = [leaf[:-1] + [f'missing_{index}'] for index, leaf in enumerate(leaves)]
+
+    gc.collect()
+    start = time.perf_counter()
+    data = LocaleData(locales_dir, default_locale=default, **options)
+    results['load'] = time.perf_counter() - start
+    strict_data = LocaleData(locales_dir, default_locale=default, strict=True, **options)
+
+    def lookup_all(translator_of: Callable[[], Any], paths: List[Path]) -> Callable[[], int]:
+        def run() -> int:
+            for path in paths:
+                _resolve(translator_of(), path)
+            return len(paths)
+        return run
+
+    def render_all() -> int:
+        translator = data[other]
+        for count, path in enumerate(plural_leaves):
+            _resolve(translator, path)(count)
+        return len(plural_leaves)
+
+    def miss_strict() -> int:
+        translator = strict_data[default]
+        for path in missing:
+            try:
+                _resolve(translator, path)
+            except AttributeError:
+                pass
+        return len(missing)
+
+    # The first lookups include building the translator, like the first request of a worker
+    results['first_lookup'] = _per_op_us(lookup_all(lambda: data[default], leaves))
+    results['repeated_lookup'] = _per_op_us(lookup_all(lambda: data[default], leaves))
+    results['fallback_lookup'] = _per_op_us(lookup_all(lambda: data[other], fallback_leaves))
+    results['list_lookup'] = _per_op_us(lookup_all(lambda: data[default], list_leaves))
+    results['plural_render'] = _per_op_us(render_all)
+    results['miss_non_strict'] = _per_op_us(lookup_all(lambda: data[default], missing))
+    results['miss_strict'] = _per_op_us(miss_strict)
+    del data, strict_data
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        data = LocaleData(locales_dir, default_locale=default, **options)
+        gc.collect()
+        results['memory'] = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return results
+
+
+def run(
+        locales: int = 3,
+        keys: int = 5000,
+        depth: int = 3,
+        list_width: int = 5,
+        plural_density: float = 0.1,
+        coverage: float = 0.8,
+        repeat: int = 3,
+        lookups: int = 2000,
+        storage: str = 'dict'
+) -> Dict[str, Any]:
+    """
+    Generates a catalog, runs every benchmark `repeat` times and returns the results.
+
+    :param locales: The number of locales of the generated catalog.
+    :param keys: The number of leaves of the default locale.
+    :param depth: The nesting depth of the leaves.
+    :param list_width: The number of items of each list.
+    :param plural_density: The fraction of leaves that are plural dicts.
+    :param coverage: The fraction of leaves translated in the non-default locales.
+    :param repeat: How many times every benchmark is run.
+    :param lookups: The maximum number of paths used by each lookup benchmark.
+    :param storage: The `storage` argument of LocaleData.
+    :return: A JSON-serializable dictionary: environment, parameters and, per benchmark,
+             its `unit`, all `samples` and their `median`.
+    """
+    params = {
+        'locales': locales, 'keys': keys, 'depth': depth, 'list_width': list_width,
+        'plural_density': plural_density, 'coverage': coverage, 'repeat': repeat,
+        'lookups': lookups, 'storage': storage,
+    }
+    # Misses are benchmarked, their warnings would only measure the logging setup
+    logging.getLogger(LocaleData.__module__.rpartition('.')[0]).setLevel(logging.ERROR)
+
+    samples: Dict[str, List[float]] = {name: [] for name in BENCHMARKS}
+    with tempfile.TemporaryDirectory() as locales_dir:
+        info = generate_catalog(locales_dir, locales, keys, depth, list_width, plural_density, coverage)
+        for _ in range(repeat):
+            for name, value in _sample(locales_dir, info, lookups, storage=storage).items():
+                samples[name].append(value)
+
+    return {
+        'python': sys.version,
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'params': params,
+        'benchmarks': {
+            name: {'unit': unit, 'samples': samples[name], 'median': statistics.median(samples[name])}
+            for name, unit in BENCHMARKS.items()
+        },
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--locales', type=int, default=3)
+    parser.add_argument('--keys', type=int, default=5000, help="leaves of the default locale")
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--list-width', type=int, default=5)
+    parser.add_argument('--plural-density', type=float, default=0.1)
+    parser.add_argument('--coverage', type=float, default=0.8)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--lookups', type=int, default=2000, help="paths per lookup benchmark")
+    parser.add_argument('--storage', choices=['dict', 'compact'], default='dict')
+    parser.add_argument('--json', metavar='PATH', help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    report = run(
+        args.locales, args.keys, args.depth, args.list_width, args.plural_density,
+        args.coverage, args.repeat, args.lookups, args.storage
+    )
+    print(f"Python {report['python'].split()[0]}, {args.keys} keys x {args.locales} locales, {args.storage} storage")
+    for name, result in report['benchmarks'].items():
+        print(f"{name:>16} {result['median']:>14,.3f} {result['unit']}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
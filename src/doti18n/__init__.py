@@ -1,2 +1,17 @@
 from .locale_translator import LocaleTranslator
 from .locale_data import LocaleData
+from .instrumentation import (
+    Instrumentation,
+    LookupObserver,
+    SlowLookupSampler
+)
+from .misses import MissReporter
+from .usage import UsageTracker
+from .context import (
+    current_translator,
+    reset_locale,
+    set_locale,
+    set_locale_data,
+    t,
+    use_locale
+)
@@ -0,0 +1,7 @@
+# doti18n/__main__.py
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,224 @@
+# doti18n/artifact.py
+
+import pickle
+import time
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+
+from .utils import (
+    _DICT_TYPES,
+    _LIST_TYPES,
+    _get_value_by_path_single,
+    _is_plural_dict
+)
+
+# First bytes of every artifact, checked before anything is unpickled
+ARTIFACT_MAGIC = b'doti18n-catalog\n'
+# Bumped whenever the layout of the artifact changes
+ARTIFACT_VERSION = 1
+# Entries every artifact has
+_ARTIFACT_KEYS = ('version', 'created', 'default_locale', 'fallback_chains', 'translations', 'indexes', 'intern_stats')
+
+Path = Tuple[Union[str, int], ...]
+# Path -> (value, code of the locale it was found in)
+Index = Dict[Path, Tuple[Any, str]]
+# Path of a plural dict -> plural category -> template, already resolved along the fallback chain
+PluralTemplates = Dict[Path, Dict[str, Any]]
+
+
+def _iter_nodes(data: Any, path: Path = ()) -> Iterator[Tuple[Path, Any]]:
+    """
+    Yields the path and value of every node `_get_value_by_path_single` can reach below `data`.
+
+    Unlike `_iter_leaves`, containers are yielded too and plural dicts are walked into,
+    as `apples.one` is a valid path. Dict keys that aren't strings can't be reached.
+    """
+    if isinstance(data, _DICT_TYPES):
+        for key, value in data.items():
+            if isinstance(key, str):
+                yield path + (key,), value
+                yield from _iter_nodes(value, path + (key,))
+    elif isinstance(data, _LIST_TYPES):
+        for index, value in enumerate(data):
+            yield path + (index,), value
+            yield from _iter_nodes(value, path + (index,))
+
+
+def _resolve_plural_templates(
+        path: Path,
+        plural_dict: Dict[str, Any],
+        found_locale_code: str,
+        resolution_order: Tuple[Tuple[str, Dict[str, Any]], ...]
+) -> Dict[str, Any]:
+    """
+    Returns the template of every plural category, as `LocaleTranslator._get_plural_template` would find it.
+
+    A category missing from `plural_dict` falls back to its 'other' form, then to the plural
+    dicts at the same path in the locales after `found_locale_code`. Categories that no dict
+    mentions end up at the 'other' entry, so a lookup is `merged.get(category)` or `merged.get('other')`.
+    """
+    codes = [code for code, _ in resolution_order]
+    chain = [plural_dict]
+    for _, data in resolution_order[codes.index(found_locale_code) + 1:]:
+        fallback_plural_dict = _get_value_by_path_single(list(path), data)
+        if _is_plural_dict(fallback_plural_dict):
+            chain.append(fallback_plural_dict)
+
+    merged = {}
+    for category in {key for candidate in chain for key in candidate} | {'other'}:
+        for candidate in chain:
+            template = candidate.get(category)
+            if template is None:
+                template = candidate.get('other')
+            if template is not None:
+                merged[category] = template
+                break
+    # Complete plural dicts are common, share them instead of a copy
+    return plural_dict if merged == plural_dict else merged
+
+
+def build_index(
+        resolution_order: Tuple[Tuple[str, Dict[str, Any]], ...],
+        paths: Optional[Dict[Path, Path]] = None,
+        entries: Optional[Dict[Tuple[int, str], Tuple[Any, str]]] = None
+) -> Tuple[Index, PluralTemplates]:
+    """
+    Flattens the lookup of one translator into a dict, fallback locales merged in.
+
+    :param resolution_order: The (locale_code, data) pairs of the translator, in lookup order.
+    :type resolution_order: Tuple[Tuple[str, Dict[str, Any]], ...]
+    :param paths: Shared path tuples, pass the same dict for all locales to store each path once.
+    :type paths: Optional[Dict[Path, Path]]
+    :param entries: Shared index entries, pass the same dict for all locales.
+    :type entries: Optional[Dict[Tuple[int, str], Tuple[Any, str]]]
+    :return: The index (path -> (value, found locale code)) and the resolved templates of its plural dicts.
+    :rtype: Tuple[Index, PluralTemplates]
+    """
+    paths = {} if paths is None else paths
+    entries = {} if entries is None else entries
+    index: Index = {}
+    for locale_code, data in resolution_order:
+        for path, value in _iter_nodes(data):
+            path = paths.setdefault(path, path)
+            if path not in index:
+                # `data` stays alive while the index is built, so ids can't be reused
+                index[path] = entries.setdefault((id(value), locale_code), (value, locale_code))
+
+    plural_templates: PluralTemplates = {
+        path: _resolve_plural_templates(path, value, locale_code, resolution_order)
+        for path, (value, locale_code) in index.items()
+        if isinstance(value, _DICT_TYPES) and _is_plural_dict(value)
+    }
+    return index, plural_templates
+
+
+def compile_catalog(
+        locales_dir: str,
+        default_locale: str = 'en',
+        fallback_chains: Optional[Dict[str, List[str]]] = None,
+        aliases: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """
+    Loads a localization directory and precomputes everything translators need at runtime.
+
+    The catalog is loaded by LocaleData with `deduplicate=True`, so keys are interned and
+    equal values and subtrees shared. For every loaded locale, the artifact holds a flat
+    index of all reachable paths with the fallback locales merged in, and the templates of
+    every plural dict resolved along the fallback chain.
+
+    :param locales_dir: The localization directory.
+    :type locales_dir: str
+    :param default_locale: The code of the default locale.
+    :type default_locale: str
+    :param fallback_chains: See `LocaleData`.
+    :type fallback_chains: Optional[Dict[str, List[str]]]
+    :param aliases: See `LocaleData`.
+    :type aliases: Optional[Dict[str, str]]
+    :return: The artifact, to be written with `write_artifact`.
+    :rtype: Dict[str, Any]
+    """
+    from .locale_data import LocaleData
+
+    data = LocaleData(
+        locales_dir, default_locale, fallback_chains=fallback_chains, aliases=aliases, deduplicate=True
+    )
+    paths: Dict[Path, Path] = {}
+    entries: Dict[Tuple[int, str], Tuple[Any, str]] = {}
+    indexes = {
+        locale_code: build_index(data[locale_code]._resolution_order, paths, entries)
+        for locale_code in data.loaded_locales
+    }
+    return {
+        'version': ARTIFACT_VERSION,
+        'created': time.time(),
+        'default_locale': data.default_locale,
+        'fallback_chains': data.fallback_chains,
+        'translations': dict(data._raw_translations),
+        'indexes': indexes,
+        'intern_stats': data.intern_stats,
+    }
+
+
+def write_artifact(artifact: Dict[str, Any], filepath: str) -> int:
+    """
+    Writes an artifact made by `compile_catalog`.
+
+    :param artifact: The artifact.
+    :type artifact: Dict[str, Any]
+    :param filepath: The file to write.
+    :type filepath: str
+    :return: The size of the written file in bytes.
+    :rtype: int
+    """
+    with open(filepath, 'wb') as f:
+        f.write(ARTIFACT_MAGIC)
+        pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return f.tell()
+
+
+def read_artifact(filepath: str) -> Dict[str, Any]:
+    """
+    Reads an artifact written by `write_artifact`.
+
+    Artifacts are pickles: only load the ones you built yourself. The header and layout checks
+    catch mistakes, not tampering.
+
+    :param filepath: The artifact file.
+    :type filepath: str
+    :return: The artifact.
+    :rtype: Dict[str, Any]
+    :raises OSError: If the file can't be read.
+    :raises ValueError: If the file is not an artifact or was written by an incompatible version.
+    :raises Exception: Whatever unpickling a corrupted file raises (EOFError, AttributeError, ...).
+    """
+    with open(filepath, 'rb') as f:
+        if f.read(len(ARTIFACT_MAGIC)) != ARTIFACT_MAGIC:
+            raise ValueError(f"'{filepath}' is not a compiled doti18n catalog.")
+        artifact = pickle.load(f)
+    if not isinstance(artifact, dict):
+        raise ValueError(f"'{filepath}' is not a compiled doti18n catalog: it holds a {type(artifact).__name__}.")
+    if artifact.get('version') != ARTIFACT_VERSION:
+        raise ValueError(
+            f"'{filepath}' was compiled in format version {artifact.get('version')!r}, "
+            f"expected {ARTIFACT_VERSION}. Compile it again."
+        )
+    missing = [key for key in _ARTIFACT_KEYS if key not in artifact]
+    if missing or not isinstance(artifact['translations'], dict) or not isinstance(artifact['indexes'], dict):
+        raise ValueError(f"'{filepath}' is a corrupted compiled doti18n catalog.")
+    return artifact
+
+
+__all__ = [
+    "ARTIFACT_VERSION",
+    "build_index",
+    "compile_catalog",
+    "read_artifact",
+    "write_artifact",
+]
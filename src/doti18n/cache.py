@@ -0,0 +1,170 @@
+# doti18n/cache.py
+
+import threading
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Union
+)
+
+
+class LRUCache:
+    """
+    A small bounded mapping with least-recently-used eviction.
+
+    Keeps hit/miss counters so the effectiveness of the cache can be observed.
+    All operations are guarded by a lock because an LRU lookup reorders entries.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Initializes an LRUCache.
+
+        :param maxsize: The maximum number of entries kept. Must be positive.
+        :type maxsize: int
+        :raises ValueError: If `maxsize` is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError(f"LRUCache maxsize must be positive, got {maxsize}.")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the cached value for `key`, or `default` if it is not cached.
+
+        :param key: The cache key.
+        :type key: Hashable
+        :param default: The value returned on a miss.
+        :type default: Any
+        :return: The cached value or `default`.
+        :rtype: Any
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Stores `value` under `key`, evicting the least recently used entry if the cache is full.
+
+        :param key: The cache key.
+        :type key: Hashable
+        :param value: The value to store.
+        :type value: Any
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all entries and resets the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Returns a snapshot of the cache counters.
+
+        :return: A dictionary with `size`, `maxsize`, `hits`, `misses` and `hit_rate`.
+        :rtype: Dict[str, Union[int, float]]
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+
+class RenderCache(LRUCache):
+    """
+    Caches fully rendered strings keyed by (locale, path, count, keyword arguments).
+
+    Entries are (rendered string, plural category, template) tuples, so observers of a
+    cached render learn how it was made without resolving it again.
+
+    Only calls whose keyword argument values are hashable are cached; other calls
+    bypass the cache and are counted as `uncacheable`.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        super().__init__(maxsize)
+        self.uncacheable = 0
+
+    def make_key(
+            self,
+            locale_code: str,
+            path: List[Union[str, int]],
+            count: int,
+            kwargs: Dict[str, Any]
+    ) -> Optional[tuple]:
+        """
+        Builds the cache key for a render, or returns None if the arguments are not hashable.
+
+        :param locale_code: The locale code of the translator performing the render.
+        :type locale_code: str
+        :param path: The path to the rendered key.
+        :type path: List[Union[str, int]]
+        :param count: The count passed to the plural handler.
+        :type count: int
+        :param kwargs: Additional formatting arguments.
+        :type kwargs: Dict[str, Any]
+        :return: A hashable key, or None if the render must not be cached.
+        :rtype: Optional[tuple]
+        """
+        try:
+            # Values that are equal but render differently (1, True, 1.0) must not share a key
+            key = (
+                locale_code, tuple(path), type(count), count,
+                frozenset((name, type(value), value) for name, value in kwargs.items()) if kwargs else None
+            )
+            hash(key)
+        except TypeError:
+            with self._lock:
+                self.uncacheable += 1
+            return None
+        return key
+
+    def clear(self) -> None:
+        with self._lock:
+            self.uncacheable = 0
+        super().clear()
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        stats = super().stats()
+        stats['uncacheable'] = self.uncacheable
+        return stats
+
+
+__all__ = [
+    "LRUCache",
+    "RenderCache",
+]
@@ -0,0 +1,209 @@
+# doti18n/cli.py
+"""
+Command line interface: `doti18n <command>` or `python -m doti18n <command>`.
+
+Commands:
+
+    compile   Compile a localization directory into an optimized catalog artifact.
+    lint      Check every locale against the default locale.
+    coverage  Report the translation coverage of every locale (requires NumPy).
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from typing import (
+    Dict,
+    List,
+    Optional
+)
+
+from .artifact import (
+    compile_catalog,
+    write_artifact
+)
+from .coverage import CoverageMatrix
+from .lint import (
+    ISSUE_KINDS,
+    lint_catalog
+)
+from .locale_data import LocaleData
+
+
+def _parse_mapping(values: List[str]) -> Dict[str, str]:
+    """Parses repeated 'KEY=VALUE' arguments."""
+    mapping = {}
+    for item in values:
+        key, sep, value = item.partition('=')
+        if not sep or not key or not value:
+            raise argparse.ArgumentTypeError(f"expected KEY=VALUE, got '{item}'")
+        mapping[key] = value
+    return mapping
+
+
+def _add_catalog_arguments(parser: argparse.ArgumentParser, fallback: bool = True) -> None:
+    """Adds the arguments LocaleData needs to load a localization directory."""
+    parser.add_argument('locales_dir', help="the localization directory")
+    parser.add_argument('--default-locale', default='en', help="the default locale (default: en)")
+    if fallback:
+        parser.add_argument('--fallback', action='append', default=[], metavar='LOCALE=A,B',
+                            help="explicit fallback chain of a locale, e.g. pt-br=pt,es (repeatable)")
+    parser.add_argument('--alias', action='append', default=[], metavar='ALIAS=LOCALE',
+                        help="locale code alias, e.g. no=nb (repeatable)")
+
+
+def _compile(args: argparse.Namespace) -> int:
+    start = time.perf_counter()
+    artifact = compile_catalog(
+        args.locales_dir,
+        args.default_locale,
+        fallback_chains={
+            code: fallbacks.split(',') for code, fallbacks in _parse_mapping(args.fallback).items()
+        },
+        aliases=_parse_mapping(args.alias)
+    )
+    if not artifact['indexes']:
+        print(f"No locales could be loaded from '{args.locales_dir}'.", file=sys.stderr)
+        return 1
+
+    size = write_artifact(artifact, args.output)
+    indexes = artifact['indexes']
+    print(
+        f"Compiled {len(indexes)} locales ({', '.join(sorted(indexes))}) into '{args.output}' "
+        f"in {time.perf_counter() - start:.2f} s: {size:,} bytes, "
+        f"{sum(len(index) for index, _ in indexes.values()):,} index entries, "
+        f"{sum(len(plurals) for _, plurals in indexes.values()):,} plural keys."
+    )
+    return 0
+
+
+def _lint(args: argparse.Namespace) -> int:
+    start = time.perf_counter()
+    try:
+        issues = lint_catalog(args.locales_dir, args.default_locale, _parse_mapping(args.alias), args.jobs)
+    except FileNotFoundError as e:
+        print(f"Localization directory '{args.locales_dir}' not found: {e}", file=sys.stderr)
+        return 2
+    issues = [issue for issue in issues if issue['kind'] not in args.ignore]
+
+    if args.json:
+        print(json.dumps(issues, ensure_ascii=False, indent=2))
+    else:
+        for issue in issues:
+            print(f"{issue['locale']}: {issue['kind']}: {issue['path'] or '<root>'}: {issue['message']}")
+        counts = {kind: sum(1 for issue in issues if issue['kind'] == kind) for kind in ISSUE_KINDS}
+        summary = ', '.join(f"{count} {kind}" for kind, count in counts.items() if count) or "no issues"
+        print(f"{summary} ({time.perf_counter() - start:.2f} s)", file=sys.stderr)
+    return 1 if issues else 0
+
+
+def _coverage(args: argparse.Namespace) -> int:
+    start = time.perf_counter()
+    data = LocaleData(args.locales_dir, args.default_locale, aliases=_parse_mapping(args.alias))
+    if data.default_locale not in data.loaded_locales:
+        print(f"The default locale '{data.default_locale}' could not be loaded from '{args.locales_dir}'.",
+              file=sys.stderr)
+        return 1
+    try:
+        matrix = CoverageMatrix.from_locale_data(data)
+    except ImportError as e:
+        print(e, file=sys.stderr)
+        return 2
+    summary = matrix.summary()
+
+    if args.json:
+        print(json.dumps({'keys': len(matrix.keys), 'locales': summary}, ensure_ascii=False, indent=2))
+        return 0
+
+    rows = [('locale', 'translated', 'missing', 'extra', 'complete', 'identical', 'most fallbacks')]
+    for locale_code, stats in summary.items():
+        worst = sorted(
+            ((rate, namespace) for namespace, rate in stats['fallback_rates'].items() if rate),
+            key=lambda item: (-item[0], item[1])
+        )[:args.top]
+        rows.append((
+            locale_code, f"{stats['translated']:,}", f"{stats['missing']:,}", f"{stats['extra']:,}",
+            f"{stats['completeness']:.1%}", f"{stats['identical']:,}",
+            ', '.join(f"{namespace} {rate:.0%}" for rate, namespace in worst),
+        ))
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+    for row in rows:
+        print('  '.join(
+            cell.ljust(width) if column in (0, len(row) - 1) else cell.rjust(width)
+            for column, (cell, width) in enumerate(zip(row, widths))
+        ).rstrip())
+    print(
+        f"{len(matrix.keys):,} keys in {len(matrix.locales)} locales, {len(matrix.namespaces)} namespaces "
+        f"({time.perf_counter() - start:.2f} s)",
+        file=sys.stderr
+    )
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the command line interface.
+
+    :param argv: The arguments, `sys.argv[1:]` if None.
+    :type argv: Optional[List[str]]
+    :return: The exit status.
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(prog='doti18n', description="doti18n command line tools.")
+    parser.add_argument('-v', '--verbose', action='store_true', help="log loading details")
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+
+    compile_parser = commands.add_parser(
+        'compile',
+        help="compile a localization directory into an optimized catalog",
+        description="Compile a localization directory into an artifact LocaleData loads directly: "
+                    "interned data, a flat index of every path with fallbacks merged in and "
+                    "plural templates resolved along the fallback chain. Load it with "
+                    "LocaleData('<output>', compiled=True, ...) using the same default locale and fallback chains."
+    )
+    _add_catalog_arguments(compile_parser)
+    compile_parser.add_argument('-o', '--output', required=True, help="the artifact file to write")
+    compile_parser.set_defaults(handler=_compile)
+
+    lint_parser = commands.add_parser(
+        'lint',
+        help="check every locale against the default locale",
+        description="Check every locale against the default locale, in parallel: missing and extra keys, "
+                    "type mismatches, placeholder mismatches, plural dicts lacking CLDR categories and "
+                    "keys dot access can't reach. Exits with 1 if there are issues."
+    )
+    _add_catalog_arguments(lint_parser, fallback=False)
+    lint_parser.add_argument('-j', '--jobs', type=int, help="worker processes (default: number of CPUs)")
+    lint_parser.add_argument('--ignore', action='append', default=[], choices=ISSUE_KINDS,
+                             help="don't report issues of this kind (repeatable)")
+    lint_parser.add_argument('--json', action='store_true', help="print the issues as JSON")
+    lint_parser.set_defaults(handler=_lint)
+
+    coverage_parser = commands.add_parser(
+        'coverage',
+        help="report the translation coverage of every locale (requires NumPy)",
+        description="Build a keys × locales coverage matrix of the catalog and report, per locale, "
+                    "the translated, missing and extra keys, the completeness against the default locale, "
+                    "the keys identical to the default locale and the namespaces falling back the most."
+    )
+    _add_catalog_arguments(coverage_parser, fallback=False)
+    coverage_parser.add_argument('--top', type=int, default=3,
+                                 help="namespaces listed per locale by fallback rate (default: 3)")
+    coverage_parser.add_argument('--json', action='store_true',
+                                 help="print every statistic, including all fallback rates, as JSON")
+    coverage_parser.set_defaults(handler=_coverage)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format='%(levelname)s: %(message)s')
+    try:
+        return args.handler(args)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+
+
+__all__ = [
+    "main",
+]
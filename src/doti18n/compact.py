@@ -0,0 +1,424 @@
+# doti18n/compact.py
+
+import sys
+from array import array
+from bisect import bisect_left
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+
+
+# Node kinds. Dicts that look like plural forms get their own kind, so that
+# classifying them at lookup time doesn't cost a key search per plural category.
+_DICT = 0
+_PLURAL_DICT = 1
+_LIST = 2
+_STR = 3
+_SCALAR = 4
+
+_PLURAL_CATEGORIES = ('zero', 'one', 'two', 'few', 'many', 'other')
+
+# Returned by lookups when a path does not exist (unless the caller passes its own default)
+_MISSING = object()
+
+
+class CompactKeyPool:
+    """
+    Deduplicated pool of dictionary keys, shared by the CompactTrees of all locales.
+
+    Every distinct key string is stored once and referred to by its integer id.
+    """
+
+    __slots__ = ('keys', 'ids')
+
+    def __init__(self):
+        self.keys: List[str] = []
+        self.ids: Dict[str, int] = {}
+
+    def add(self, key: str) -> int:
+        """Returns the id of `key`, adding it to the pool if needed."""
+        key_id = self.ids.get(key)
+        if key_id is None:
+            key_id = self.ids[key] = len(self.keys)
+            self.keys.append(key)
+        return key_id
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+class CompactTree:
+    """
+    Read-only, array-packed representation of one locale's nested dicts and lists.
+
+    Each node is a position in three parallel arrays (`kind`, `first`, `count`).
+    The children of a dict or list node occupy `count` consecutive slots, starting at
+    `first`, of the edge arrays (`edge_keys` holds key ids sorted for binary search,
+    `edge_nodes` the child node ids). String values live in one UTF-8 blob, deduplicated,
+    and are addressed by (offset, length). Other scalars (numbers, booleans, None) are
+    kept in a small list.
+
+    Only string keys are stored, as only they are reachable through dot access.
+    """
+
+    __slots__ = ('_pool', '_kinds', '_first', '_count', '_edge_keys', '_edge_nodes', '_values', '_scalars')
+
+    def __init__(self, data: Dict[str, Any], pool: Optional[CompactKeyPool] = None):
+        """
+        Packs `data` into a CompactTree.
+
+        :param data: The raw localization data of one locale.
+        :type data: Dict[str, Any]
+        :param pool: A key pool to share with the trees of other locales. A new one is created if None.
+        :type pool: Optional[CompactKeyPool]
+        """
+        self._pool = pool if pool is not None else CompactKeyPool()
+        self._kinds = array('B')
+        self._first = array('I')
+        self._count = array('I')
+        self._edge_keys = array('I')
+        self._edge_nodes = array('I')
+        self._scalars: List[Any] = []
+
+        blob = bytearray()
+        value_offsets: Dict[str, Tuple[int, int]] = {}
+        self._add_node(data, blob, value_offsets)
+        self._values = bytes(blob)
+
+    def _add_node(self, value: Any, blob: bytearray, value_offsets: Dict[str, Tuple[int, int]]) -> int:
+        node = len(self._kinds)
+        if isinstance(value, dict):
+            children = sorted(
+                (self._pool.add(key), child) for key, child in value.items() if isinstance(key, str)
+            ) if value else []
+            is_plural = any(isinstance(value.get(category), str) for category in _PLURAL_CATEGORIES)
+            self._append_container(_PLURAL_DICT if is_plural else _DICT, children, blob, value_offsets)
+        elif isinstance(value, list):
+            self._append_container(_LIST, list(enumerate(value)), blob, value_offsets)
+        elif isinstance(value, str):
+            position = value_offsets.get(value)
+            if position is None:
+                encoded = value.encode('utf-8')
+                position = value_offsets[value] = (len(blob), len(encoded))
+                blob += encoded
+            self._append(_STR, *position)
+        else:
+            self._append(_SCALAR, len(self._scalars), 0)
+            self._scalars.append(value)
+        return node
+
+    def _append(self, kind: int, first: int, count: int) -> None:
+        self._kinds.append(kind)
+        self._first.append(first)
+        self._count.append(count)
+
+    def _append_container(
+            self,
+            kind: int,
+            children: List[Tuple[int, Any]],
+            blob: bytearray,
+            value_offsets: Dict[str, Tuple[int, int]]
+    ) -> None:
+        start = len(self._edge_keys)
+        self._append(kind, start, len(children))
+        # Reserve the contiguous edge slots first, children append their own edges after them
+        self._edge_keys.extend([0] * len(children))
+        self._edge_nodes.extend([0] * len(children))
+        for offset, (key, child) in enumerate(children):
+            self._edge_keys[start + offset] = key
+            self._edge_nodes[start + offset] = self._add_node(child, blob, value_offsets)
+
+    @property
+    def root(self) -> 'CompactDict':
+        """The root node as a read-only dict-like view."""
+        return CompactDict(self, 0)
+
+    def _child(self, node: int, key: Union[str, int]) -> int:
+        """Returns the child node id of `node` at `key`, or -1 if there is none."""
+        kind = self._kinds[node]
+        if kind <= _PLURAL_DICT:
+            if not isinstance(key, str):
+                return -1
+            key_id = self._pool.ids.get(key)
+            if key_id is None:
+                return -1
+            start = self._first[node]
+            end = start + self._count[node]
+            position = bisect_left(self._edge_keys, key_id, start, end)
+            if position == end or self._edge_keys[position] != key_id:
+                return -1
+            return self._edge_nodes[position]
+        if kind == _LIST:
+            if not isinstance(key, int) or not 0 <= key < self._count[node]:
+                return -1
+            return self._edge_nodes[self._first[node] + key]
+        return -1
+
+    def _value(self, node: int) -> Any:
+        """Materializes a node: strings and scalars are returned as is, containers as views."""
+        kind = self._kinds[node]
+        if kind == _STR:
+            start = self._first[node]
+            return self._values[start:start + self._count[node]].decode('utf-8')
+        if kind == _SCALAR:
+            return self._scalars[self._first[node]]
+        if kind <= _PLURAL_DICT:
+            return CompactDict(self, node)
+        return CompactList(self, node)
+
+    def lookup(self, path: List[Union[str, int]], node: int = 0, default: Any = _MISSING) -> Any:
+        """
+        Returns the value at `path` below `node`, or `default` if the path does not exist.
+
+        Mirrors `utils._get_value_by_path_single`: dict levels need str keys, list levels
+        need in-range int indices, and scalars can't be traversed.
+
+        :param path: The list of keys/indices.
+        :type path: List[Union[str, int]]
+        :param node: The node to start from (the root by default).
+        :type node: int
+        :param default: The value returned if the path does not exist.
+        :type default: Any
+        :return: The value, a CompactDict/CompactList view, or `default`.
+        :rtype: Any
+        """
+        # `_child` inlined, this is the hot path of every lookup
+        kinds, first, count = self._kinds, self._first, self._count
+        edge_keys, edge_nodes, key_ids = self._edge_keys, self._edge_nodes, self._pool.ids
+        for key in path:
+            kind = kinds[node]
+            if kind <= _PLURAL_DICT:
+                if not isinstance(key, str):
+                    return default
+                key_id = key_ids.get(key)
+                if key_id is None:
+                    return default
+                start = first[node]
+                end = start + count[node]
+                position = bisect_left(edge_keys, key_id, start, end)
+                if position == end or edge_keys[position] != key_id:
+                    return default
+                node = edge_nodes[position]
+            elif kind == _LIST:
+                if not isinstance(key, int) or not 0 <= key < count[node]:
+                    return default
+                node = edge_nodes[first[node] + key]
+            else:
+                return default
+        return self._value(node)
+
+    def nbytes(self, node: int = 0) -> int:
+        """
+        Returns the approximate memory used by this tree, excluding the shared key pool.
+
+        :param node: If given, only the subtree below this node is measured.
+                     Strings are then counted at every use, even if stored once.
+        :type node: int
+        :return: The size in bytes.
+        :rtype: int
+        """
+        if node == 0:
+            arrays = (self._kinds, self._first, self._count, self._edge_keys, self._edge_nodes)
+            return (
+                sum(a.itemsize * len(a) for a in arrays) + len(self._values)
+                + sys.getsizeof(self._scalars) + sum(sys.getsizeof(value) for value in self._scalars)
+            )
+
+        node_size = self._kinds.itemsize + self._first.itemsize + self._count.itemsize
+        edge_size = self._edge_keys.itemsize + self._edge_nodes.itemsize
+        total = 0
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            total += node_size
+            kind = self._kinds[node]
+            if kind == _STR:
+                total += self._count[node]
+            elif kind == _SCALAR:
+                total += sys.getsizeof(self._scalars[self._first[node]])
+            else:
+                start = self._first[node]
+                total += edge_size * self._count[node]
+                stack.extend(self._edge_nodes[start:start + self._count[node]])
+        return total
+
+    def pool_nbytes(self) -> int:
+        """
+        Returns the approximate memory used by the key pool, which may be shared with other trees.
+
+        :return: The size in bytes.
+        :rtype: int
+        """
+        pool = self._pool
+        return (
+            sys.getsizeof(pool.keys) + sys.getsizeof(pool.ids)
+            + sum(sys.getsizeof(key) for key in pool.keys)
+        )
+
+    def __len__(self) -> int:
+        return len(self._kinds)
+
+
+class CompactDict:
+    """Read-only dict-like view of a dict node of a CompactTree."""
+
+    __slots__ = ('_tree', '_node')
+
+    def __init__(self, tree: CompactTree, node: int):
+        self._tree = tree
+        self._node = node
+
+    @property
+    def tree(self) -> CompactTree:
+        """The CompactTree this view belongs to."""
+        return self._tree
+
+    @property
+    def is_plural(self) -> bool:
+        """Whether this dict holds plural forms, see `utils._is_plural_dict` (classified when packing)."""
+        return self._tree._kinds[self._node] == _PLURAL_DICT
+
+    def nbytes(self) -> int:
+        """Returns the approximate memory used by this node and its children. See `CompactTree.nbytes`."""
+        return self._tree.nbytes(self._node)
+
+    def lookup(self, path: List[Union[str, int]], default: Any = _MISSING) -> Any:
+        """Returns the value at `path` below this node, or `default`. See `CompactTree.lookup`."""
+        return self._tree.lookup(path, self._node, default)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        child = self._tree._child(self._node, key)
+        return default if child < 0 else self._tree._value(child)
+
+    def __getitem__(self, key: str) -> Any:
+        child = self._tree._child(self._node, key)
+        if child < 0:
+            raise KeyError(key)
+        return self._tree._value(child)
+
+    def __contains__(self, key: Any) -> bool:
+        return self._tree._child(self._node, key) >= 0
+
+    def __len__(self) -> int:
+        return self._tree._count[self._node]
+
+    def __iter__(self) -> Iterator[str]:
+        tree = self._tree
+        start = tree._first[self._node]
+        for position in range(start, start + tree._count[self._node]):
+            yield tree._pool.keys[tree._edge_keys[position]]
+
+    def keys(self) -> List[str]:
+        return list(self)
+
+    def values(self) -> List[Any]:
+        return [value for _, value in self.items()]
+
+    def items(self) -> List[Tuple[str, Any]]:
+        tree = self._tree
+        start = tree._first[self._node]
+        return [
+            (tree._pool.keys[tree._edge_keys[position]], tree._value(tree._edge_nodes[position]))
+            for position in range(start, start + tree._count[self._node])
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns a deep copy of this node as regular dicts and lists."""
+        return {key: _to_builtin(value) for key, value in self.items()}
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, CompactDict):
+            other = other.to_dict()
+        return isinstance(other, dict) and self.to_dict() == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"CompactDict({self.to_dict()!r})"
+
+
+class CompactList:
+    """Read-only list-like view of a list node of a CompactTree."""
+
+    __slots__ = ('_tree', '_node')
+
+    def __init__(self, tree: CompactTree, node: int):
+        self._tree = tree
+        self._node = node
+
+    def nbytes(self) -> int:
+        """Returns the approximate memory used by this node and its children. See `CompactTree.nbytes`."""
+        return self._tree.nbytes(self._node)
+
+    def __getitem__(self, index: int) -> Any:
+        length = len(self)
+        if index < 0:
+            index += length
+        child = self._tree._child(self._node, index)
+        if child < 0:
+            raise IndexError("CompactList index out of range")
+        return self._tree._value(child)
+
+    def __len__(self) -> int:
+        return self._tree._count[self._node]
+
+    def __iter__(self) -> Iterator[Any]:
+        tree = self._tree
+        start = tree._first[self._node]
+        for position in range(start, start + tree._count[self._node]):
+            yield tree._value(tree._edge_nodes[position])
+
+    def to_list(self) -> List[Any]:
+        """Returns a deep copy of this node as regular lists and dicts."""
+        return [_to_builtin(value) for value in self]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, CompactList):
+            other = other.to_list()
+        return isinstance(other, list) and self.to_list() == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"CompactList({self.to_list()!r})"
+
+
+def _to_builtin(value: Any) -> Any:
+    if isinstance(value, CompactDict):
+        return value.to_dict()
+    if isinstance(value, CompactList):
+        return value.to_list()
+    return value
+
+
+def compact_translations(
+        translations: Dict[str, Optional[Dict[str, Any]]]
+) -> Dict[str, Optional[CompactDict]]:
+    """
+    Converts the raw data of all locales to CompactTrees sharing one key pool.
+
+    :param translations: Normalized locale codes mapped to raw data (or None).
+    :type translations: Dict[str, Optional[Dict[str, Any]]]
+    :return: The same mapping with every dict replaced by the root view of its CompactTree.
+    :rtype: Dict[str, Optional[CompactDict]]
+    """
+    pool = CompactKeyPool()
+    return {
+        code: CompactTree(data, pool).root if isinstance(data, dict) else data
+        for code, data in translations.items()
+    }
+
+
+__all__ = [
+    "CompactDict",
+    "CompactKeyPool",
+    "CompactList",
+    "CompactTree",
+    "compact_translations",
+]
@@ -0,0 +1,147 @@
+# doti18n/context.py
+
+from contextlib import contextmanager
+from contextvars import (
+    ContextVar,
+    Token
+)
+from typing import (
+    Any,
+    Iterator,
+    Optional,
+    Union,
+    TYPE_CHECKING
+)
+
+from .locale_translator import LocaleTranslator
+
+if TYPE_CHECKING:
+    from .locale_data import LocaleData
+
+
+# The translator active in the current thread / asyncio task
+_current_translator: ContextVar[Optional[LocaleTranslator]] = ContextVar('doti18n_current_translator', default=None)
+# LocaleData used to resolve locale codes when none is passed explicitly
+_default_locale_data: Optional['LocaleData'] = None
+
+
+def set_locale_data(data: Optional['LocaleData']) -> None:
+    """
+    Sets the process-wide LocaleData used by `use_locale` and `set_locale` to resolve locale codes.
+
+    :param data: The LocaleData instance, or None to unset it.
+    :type data: Optional[LocaleData]
+    """
+    global _default_locale_data
+    _default_locale_data = data
+
+
+def _resolve_translator(locale: Union[str, LocaleTranslator], data: Optional['LocaleData']) -> LocaleTranslator:
+    if isinstance(locale, LocaleTranslator):
+        return locale
+
+    data = data if data is not None else _default_locale_data
+    if data is None:
+        raise LookupError(
+            f"Cannot resolve locale '{locale}': no LocaleData was passed and none was set "
+            "with doti18n.set_locale_data()."
+        )
+    return data[locale]
+
+
+def set_locale(locale: Union[str, LocaleTranslator], data: Optional['LocaleData'] = None) -> Token:
+    """
+    Makes the given locale current for this thread / asyncio task.
+
+    The translator is resolved once here; later lookups through `t` cost a single
+    context variable read. Use `reset_locale` with the returned token to undo it.
+
+    :param locale: A locale code or an already resolved LocaleTranslator.
+    :type locale: Union[str, LocaleTranslator]
+    :param data: The LocaleData to resolve a locale code with. Defaults to the one set via `set_locale_data`.
+    :type data: Optional[LocaleData]
+    :return: A token for `reset_locale`.
+    :rtype: Token
+    :raises LookupError: If a locale code is given but there is no LocaleData to resolve it with.
+    """
+    return _current_translator.set(_resolve_translator(locale, data))
+
+
+def reset_locale(token: Token) -> None:
+    """
+    Restores the locale that was current before the matching `set_locale` call.
+
+    :param token: The token returned by `set_locale`.
+    :type token: Token
+    """
+    _current_translator.reset(token)
+
+
+@contextmanager
+def use_locale(
+        locale: Union[str, LocaleTranslator],
+        data: Optional['LocaleData'] = None
+) -> Iterator[LocaleTranslator]:
+    """
+    Context manager making the given locale current for the enclosed block.
+
+    Example: ``with doti18n.use_locale(request.locale): render(doti18n.t.messages.greeting)``
+
+    :param locale: A locale code or an already resolved LocaleTranslator.
+    :type locale: Union[str, LocaleTranslator]
+    :param data: The LocaleData to resolve a locale code with. Defaults to the one set via `set_locale_data`.
+    :type data: Optional[LocaleData]
+    :return: The now current LocaleTranslator.
+    :rtype: Iterator[LocaleTranslator]
+    """
+    token = set_locale(locale, data)
+    try:
+        yield _current_translator.get()
+    finally:
+        reset_locale(token)
+
+
+def current_translator() -> Optional[LocaleTranslator]:
+    """
+    Returns the translator that is current for this thread / asyncio task, if any.
+
+    :return: The current LocaleTranslator, or None if no locale is active.
+    :rtype: Optional[LocaleTranslator]
+    """
+    return _current_translator.get()
+
+
+class CurrentTranslatorProxy:
+    """
+    Forwards attribute access to the translator that is current in the calling context.
+
+    The module-level instance `t` lets deep code do `t.messages.greeting` without
+    passing translators around.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        translator = _current_translator.get()
+        if translator is None:
+            raise LookupError(
+                f"Cannot access '{name}': no locale is active. Wrap the code in doti18n.use_locale(...)."
+            )
+        return getattr(translator, name)
+
+    def __repr__(self) -> str:
+        return f"<CurrentTranslatorProxy for {_current_translator.get()!r}>"
+
+
+t = CurrentTranslatorProxy()
+
+
+__all__ = [
+    "CurrentTranslatorProxy",
+    "current_translator",
+    "reset_locale",
+    "set_locale",
+    "set_locale_data",
+    "t",
+    "use_locale",
+]
@@ -0,0 +1,240 @@
+# doti18n/coverage.py
+
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TYPE_CHECKING
+)
+
+from .utils import (
+    _DICT_TYPES,
+    _LIST_TYPES,
+    _is_plural_dict
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    from .locale_data import LocaleData
+
+
+def _flatten(
+        data: Any,
+        parent: int,
+        children: Dict[int, Dict[Any, int]],
+        names: List[str],
+        leaves: List[int],
+        values: List[Any]
+) -> None:
+    """
+    Appends the node and value of every leaf below `data` (the leaves of `_iter_leaves`) to `leaves` and `values`.
+
+    Nodes are shared by all locales: `children` maps a node to its keys and their nodes, and
+    `names` holds the dotted path of every node, so each path is only built once however
+    many locales have it. The root is node -1.
+    """
+    table = children.get(parent)
+    if table is None:
+        table = children[parent] = {}
+    for key, value in (enumerate(data) if isinstance(data, _LIST_TYPES) else data.items()):
+        node = table.get(key)
+        if node is None:
+            node = table[key] = len(names)
+            names.append(f"{names[parent]}.{key}" if parent >= 0 else str(key))
+        if type(value) is not str and (
+                isinstance(value, _LIST_TYPES) or (isinstance(value, _DICT_TYPES) and not _is_plural_dict(value))
+        ):
+            _flatten(value, node, children, names, leaves, values)
+        else:
+            leaves.append(node)
+            values.append(value)
+
+
+class CoverageMatrix:
+    """
+    Translation coverage of a catalog as a keys × locales boolean matrix (NumPy required).
+
+    All locales are flattened into one key universe: the dotted leaf paths (see
+    `LocaleData.key_paths`) of every locale, in `keys`, grouped by top-level namespace.
+    Column 0 of every matrix is the default locale, the others follow in `locales` order.
+    Each locale is walked once; every statistic is then computed with array operations,
+    not per key and locale.
+    """
+
+    def __init__(self, translations: Mapping[str, Any], default_locale: str):
+        """
+        Builds the matrices.
+
+        :param translations: Locale code -> raw data, e.g. a LocaleData snapshot. Locales whose
+                             data isn't a dict are skipped.
+        :type translations: Mapping[str, Any]
+        :param default_locale: The code of the default locale, the reference of all statistics.
+        :type default_locale: str
+        :raises ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError("CoverageMatrix requires NumPy. Install it with `pip install doti18n[coverage]`.")
+
+        self.default_locale = default_locale
+        self.locales: List[str] = [default_locale] + sorted(
+            code for code, data in translations.items() if code != default_locale and isinstance(data, _DICT_TYPES)
+        )
+
+        # Flatten once: per locale, the nodes of its leaves and their values
+        children: Dict[int, Dict[Any, int]] = {}
+        names: List[str] = []
+        flattened: List[Tuple[Any, List[Any]]] = []
+        for locale_code in self.locales:
+            data = translations.get(locale_code)
+            leaves: List[int] = []
+            leaf_values: List[Any] = []
+            if isinstance(data, _DICT_TYPES):
+                _flatten(data, -1, children, names, leaves, leaf_values)
+            flattened.append((np.array(leaves, dtype=np.intp), leaf_values))
+
+        # Nodes with the same dotted path (a list index and a '0' key) share a row
+        leaf_nodes = np.unique(np.concatenate([leaves for leaves, _ in flattened]))
+        universe = {names[node] for node in leaf_nodes.tolist()}
+        self.keys: List[str] = sorted(universe, key=lambda key: (key.partition('.')[0], key))
+        self.key_index: Dict[str, int] = {key: row for row, key in enumerate(self.keys)}
+        node_rows = np.full(len(names), -1, dtype=np.intp)
+        node_rows[leaf_nodes] = [self.key_index[names[node]] for node in leaf_nodes.tolist()]
+
+        shape = (len(self.keys), len(self.locales))
+        # keys × locales: the locale has its own value (possibly an explicit null)
+        self.translated = np.zeros(shape, dtype=bool)
+        values = np.full(shape, None, dtype=object)
+        for column, (leaves, leaf_values) in enumerate(flattened):
+            if leaf_values:
+                rows = node_rows[leaves]
+                self.translated[rows, column] = True
+                column_values = np.empty(len(leaf_values), dtype=object)
+                column_values[:] = leaf_values
+                values[rows, column] = column_values
+
+        # keys: the default locale has the key, the reference set of all rates
+        self.in_default = self.translated[:, 0]
+        # keys × locales: translated with the default locale's value
+        self.identical = self.translated & self.in_default[:, None] & (values == values[:, :1]).astype(bool)
+        self.identical[:, 0] = False
+
+        namespaces = [key.partition('.')[0] for key in self.keys]
+        # Keys are grouped by namespace, so each one is a contiguous block of rows starting here
+        self._namespace_starts = np.array(
+            [row for row, namespace in enumerate(namespaces) if row == 0 or namespace != namespaces[row - 1]],
+            dtype=np.int64
+        )
+        self.namespaces: List[str] = [namespaces[row] for row in self._namespace_starts]
+
+    @classmethod
+    def from_locale_data(cls, locale_data: 'LocaleData') -> 'CoverageMatrix':
+        """
+        Builds the coverage of a loaded catalog. Evicted locales are reloaded.
+
+        :param locale_data: The catalog.
+        :type locale_data: LocaleData
+        :return: Its coverage.
+        :rtype: CoverageMatrix
+        """
+        translations = locale_data._load_evicted(locale_data.loaded_locales)
+        return cls(translations, locale_data.default_locale)
+
+    def _per_locale(self, values: Any) -> Dict[str, Any]:
+        return {locale_code: values[column].item() for column, locale_code in enumerate(self.locales)}
+
+    def completeness(self) -> Dict[str, float]:
+        """
+        Returns the fraction of the default locale's keys each locale translates itself.
+
+        :return: Locale code -> completeness between 0 and 1. 1 for the default locale, and for every
+                 locale if the default locale has no keys, as nothing can be missing then.
+        :rtype: Dict[str, float]
+        """
+        reference = int(self.in_default.sum())
+        if not reference:
+            return {locale_code: 1.0 for locale_code in self.locales}
+        return self._per_locale((self.translated & self.in_default[:, None]).sum(axis=0) / reference)
+
+    def fallback_rates(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns, per locale and top-level namespace, the fraction of the default locale's keys
+        the locale doesn't translate, i.e. that are looked up in a fallback locale.
+
+        :return: Locale code -> namespace -> rate between 0 and 1. Namespaces the default
+                 locale has no keys in are left out.
+        :rtype: Dict[str, Dict[str, float]]
+        """
+        falls_back = self.in_default[:, None] & ~self.translated
+        counts = np.add.reduceat(falls_back, self._namespace_starts, axis=0)
+        totals = np.add.reduceat(self.in_default.astype(np.int64), self._namespace_starts)
+        present = totals > 0
+        rates = counts[present] / totals[present][:, None]
+        namespaces = [namespace for namespace, keep in zip(self.namespaces, present) if keep]
+        return {
+            locale_code: dict(zip(namespaces, rates[:, column].tolist()))
+            for column, locale_code in enumerate(self.locales)
+        }
+
+    def identical_to_default(self) -> Dict[str, int]:
+        """
+        Returns how many keys each locale "translates" with exactly the default locale's value,
+        usually strings copied over and never translated.
+
+        :return: Locale code -> number of keys (0 for the default locale).
+        :rtype: Dict[str, int]
+        """
+        return self._per_locale(self.identical.sum(axis=0))
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the statistics of every locale.
+
+        :return: Locale code -> `translated` (keys with an own value), `missing` (keys of the default
+                 locale it lacks), `extra` (keys the default locale lacks), `completeness`,
+                 `identical` (see `identical_to_default`) and `fallback_rates` (see `fallback_rates`).
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        in_default = self.in_default[:, None]
+        translated = self._per_locale(self.translated.sum(axis=0))
+        missing = self._per_locale((in_default & ~self.translated).sum(axis=0))
+        extra = self._per_locale((~in_default & self.translated).sum(axis=0))
+        completeness = self.completeness()
+        identical = self.identical_to_default()
+        fallback_rates = self.fallback_rates()
+        return {
+            locale_code: {
+                'translated': translated[locale_code],
+                'missing': missing[locale_code],
+                'extra': extra[locale_code],
+                'completeness': completeness[locale_code],
+                'identical': identical[locale_code],
+                'fallback_rates': fallback_rates[locale_code],
+            }
+            for locale_code in self.locales
+        }
+
+    def column(self, locale_code: str) -> Optional[int]:
+        """
+        Returns the matrix column of a locale.
+
+        :param locale_code: The canonical locale code.
+        :type locale_code: str
+        :return: The column, or None if the locale is not part of the matrix.
+        :rtype: Optional[int]
+        """
+        try:
+            return self.locales.index(locale_code)
+        except ValueError:
+            return None
+
+
+__all__ = [
+    "CoverageMatrix",
+]
@@ -0,0 +1,285 @@
+# doti18n/instrumentation.py
+
+import heapq
+import itertools
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+
+
+class LookupObserver:
+    """
+    Base class for objects notified about lookups and plural renders.
+
+    Register instances with `LocaleData.add_observer`. All methods are no-ops here,
+    subclasses override the ones they need. They are called synchronously on the
+    lookup path, from any thread, so they must be fast and thread-safe.
+
+    Translators without observers only pay for one attribute check per lookup.
+    """
+
+    def on_lookup(
+            self,
+            locale_code: str,
+            path: List[Union[str, int]],
+            found_locale_code: Optional[str],
+            seconds: float
+    ) -> None:
+        """
+        Called after a translator resolved a path to a value, or didn't find it.
+
+        Namespaces and lists reached on the way (`messages` in `t.messages.greeting`)
+        are not reported, so each access counts as one lookup.
+
+        :param locale_code: The locale of the translator.
+        :type locale_code: str
+        :param path: The looked up path. Must not be modified.
+        :type path: List[Union[str, int]]
+        :param found_locale_code: The locale the value was found in (differs from `locale_code`
+                                  for fallback hits), or None if the path was not found.
+        :type found_locale_code: Optional[str]
+        :param seconds: The time spent resolving the path.
+        :type seconds: float
+        """
+
+    def on_render(
+            self,
+            locale_code: str,
+            path: List[Union[str, int]],
+            category: str,
+            result: Optional[str],
+            seconds: float,
+            template: Optional[str] = None,
+            found_locale_code: Optional[str] = None
+    ) -> None:
+        """
+        Called after a plural handler rendered a string, or failed to.
+
+        :param locale_code: The locale of the translator.
+        :type locale_code: str
+        :param path: The path of the plural key. Must not be modified.
+        :type path: List[Union[str, int]]
+        :param category: The CLDR plural category used ('one', 'few', 'other', ...).
+        :type category: str
+        :param result: The rendered string, or None if rendering raised an exception.
+        :type result: Optional[str]
+        :param seconds: The time spent rendering, including the render cache lookup.
+        :type seconds: float
+        :param template: The template that was formatted, or None if there was none.
+        :type template: Optional[str]
+        :param found_locale_code: The locale the plural dict was found in (differs from
+                                  `locale_code` for fallback hits).
+        :type found_locale_code: Optional[str]
+        """
+
+
+class ObserverGroup(LookupObserver):
+    """Forwards every notification to several observers, in order."""
+
+    def __init__(self, observers: List[LookupObserver]):
+        self.observers = list(observers)
+
+    def on_lookup(self, locale_code, path, found_locale_code, seconds):
+        for observer in self.observers:
+            observer.on_lookup(locale_code, path, found_locale_code, seconds)
+
+    def on_render(self, locale_code, path, category, result, seconds, template=None, found_locale_code=None):
+        for observer in self.observers:
+            observer.on_render(locale_code, path, category, result, seconds, template, found_locale_code)
+
+
+class Instrumentation(LookupObserver):
+    """
+    Counts lookups, misses, fallback hits and plural renders, and sums resolution time.
+
+    `snapshot()` returns plain dicts, ready to be exported to a metrics system.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Resets all counters."""
+        with self._lock:
+            self._lookups = 0
+            self._misses = 0
+            self._fallback_hits: Dict[str, int] = {}
+            self._plural_renders: Dict[str, int] = {}
+            self._plural_errors = 0
+            self._namespace_seconds: Dict[str, float] = {}
+            self._render_seconds = 0.0
+
+    def on_lookup(self, locale_code, path, found_locale_code, seconds):
+        namespace = str(path[0]) if path else ''
+        with self._lock:
+            self._lookups += 1
+            if found_locale_code is None:
+                self._misses += 1
+            elif found_locale_code != locale_code:
+                self._fallback_hits[found_locale_code] = self._fallback_hits.get(found_locale_code, 0) + 1
+            self._namespace_seconds[namespace] = self._namespace_seconds.get(namespace, 0.0) + seconds
+
+    def on_render(self, locale_code, path, category, result, seconds, template=None, found_locale_code=None):
+        with self._lock:
+            if result is None:
+                self._plural_errors += 1
+            else:
+                self._plural_renders[category] = self._plural_renders.get(category, 0) + 1
+            self._render_seconds += seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns a copy of the current counters.
+
+        :return: A dictionary with:
+                 - `lookups`: the number of resolved paths;
+                 - `misses`: how many of them were not found in any locale;
+                 - `fallback_hits`: source locale code -> lookups answered by that fallback locale;
+                 - `plural_renders`: plural category -> number of renders;
+                 - `plural_errors`: the number of renders that raised an exception;
+                 - `resolution_seconds`: top-level namespace -> cumulative resolution time;
+                 - `render_seconds`: cumulative plural render time.
+        :rtype: Dict[str, Any]
+        """
+        with self._lock:
+            return {
+                'lookups': self._lookups,
+                'misses': self._misses,
+                'fallback_hits': dict(self._fallback_hits),
+                'plural_renders': dict(self._plural_renders),
+                'plural_errors': self._plural_errors,
+                'resolution_seconds': dict(self._namespace_seconds),
+                'render_seconds': self._render_seconds,
+            }
+
+
+class SlowLookupSampler(LookupObserver):
+    """
+    Keeps the slowest lookups and renders of each time interval.
+
+    Per interval, the `top_n` slowest events are kept with their locale, path, depth,
+    fallback/miss status, and template and rendered length. Optionally `callback` is called with the
+    record of every event slower than `threshold` seconds, from the thread of the lookup.
+    Events faster than everything kept cost one comparison under a lock.
+    """
+
+    def __init__(
+            self,
+            top_n: int = 10,
+            interval: float = 60.0,
+            threshold: Optional[float] = None,
+            callback: Optional[Callable[[Dict[str, Any]], None]] = None
+    ):
+        """
+        Initializes a SlowLookupSampler.
+
+        :param top_n: How many of the slowest events are kept per interval.
+        :type top_n: int
+        :param interval: The length of an interval in seconds.
+        :type interval: float
+        :param threshold: Events slower than this many seconds are passed to `callback`.
+        :type threshold: Optional[float]
+        :param callback: Called with the record (see `slowest`) of each event slower than `threshold`.
+        :type callback: Optional[Callable[[Dict[str, Any]], None]]
+        """
+        self.top_n = top_n
+        self.interval = interval
+        self.threshold = threshold
+        self.callback = callback
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+        self._window_start = time.monotonic()
+        # Min-heap of (seconds, sequence number, event), the fastest kept event on top
+        self._heap: List[Tuple[float, int, tuple]] = []
+        self._previous: List[Dict[str, Any]] = []
+
+    def on_lookup(self, locale_code, path, found_locale_code, seconds):
+        self._record(seconds, 'lookup', locale_code, path, found_locale_code, None, None)
+
+    def on_render(self, locale_code, path, category, result, seconds, template=None, found_locale_code=None):
+        length = len(result) if result is not None else None
+        template_length = len(template) if isinstance(template, str) else None
+        self._record(seconds, 'render', locale_code, path, category, (length, template_length), found_locale_code)
+
+    def _record(self, seconds: float, *event: Any) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if now - self._window_start >= self.interval:
+                self._previous = self._records()
+                self._heap = []
+                self._window_start = now
+
+            heap = self._heap
+            if len(heap) < self.top_n:
+                heapq.heappush(heap, (seconds, next(self._counter), event))
+            elif seconds > heap[0][0]:
+                heapq.heapreplace(heap, (seconds, next(self._counter), event))
+
+        if self.threshold is not None and seconds > self.threshold and self.callback is not None:
+            self.callback(self._make_record(seconds, event))
+
+    @staticmethod
+    def _make_record(seconds: float, event: tuple) -> Dict[str, Any]:
+        kind, locale_code, path, detail, lengths, found_locale_code = event
+        record = {
+            'kind': kind,
+            'locale': locale_code,
+            'path': '.'.join(map(str, path)),
+            'depth': len(path),
+            'seconds': seconds,
+        }
+        if kind == 'lookup':
+            record['found_locale'] = detail
+            record['miss'] = detail is None
+            record['fallback'] = detail is not None and detail != locale_code
+        else:
+            record['category'] = detail
+            record['error'] = lengths[0] is None
+            record['length'] = lengths[0]
+            record['template_length'] = lengths[1]
+            record['found_locale'] = found_locale_code
+            record['fallback'] = found_locale_code is not None and found_locale_code != locale_code
+        return record
+
+    def _records(self) -> List[Dict[str, Any]]:
+        return [self._make_record(seconds, event) for seconds, _, event in sorted(self._heap, reverse=True)]
+
+    def slowest(self) -> List[Dict[str, Any]]:
+        """
+        Returns the slowest events of the current interval, slowest first.
+
+        :return: A list of records: `kind` ('lookup' or 'render'), `locale`, `path` (dotted),
+                 `depth`, `seconds`, and for lookups `found_locale`, `miss` and `fallback`,
+                 for renders `category`, `error`, `length` (of the rendered string, None on error),
+                 `template_length`, `found_locale` (of the plural dict) and `fallback`.
+        :rtype: List[Dict[str, Any]]
+        """
+        with self._lock:
+            return self._records()
+
+    def previous(self) -> List[Dict[str, Any]]:
+        """
+        Returns the slowest events of the last completed interval, see `slowest`.
+
+        :return: A list of records, slowest first.
+        :rtype: List[Dict[str, Any]]
+        """
+        with self._lock:
+            return list(self._previous)
+
+
+__all__ = [
+    "Instrumentation",
+    "LookupObserver",
+    "ObserverGroup",
+    "SlowLookupSampler",
+]
@@ -0,0 +1,155 @@
+# doti18n/interning.py
+
+import sys
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Optional,
+    Tuple
+)
+
+
+class Interner:
+    """
+    Deduplicates loaded localization data across all locales.
+
+    Dictionary keys are passed through `sys.intern`, equal scalar values are replaced
+    by one shared object, and equal dicts/lists (subtrees) are shared too. Trees are
+    processed bottom-up, so once children are shared, a duplicate parent only costs
+    its own container.
+
+    The result shares objects between locales, so it must be treated as read-only.
+    """
+
+    def __init__(self):
+        # (type, value) -> canonical scalar. The type keeps 1, 1.0 and True apart.
+        self._scalars: Dict[Tuple[type, Any], Any] = {}
+        # signature -> canonical dict/list
+        self._subtrees: Dict[Hashable, Any] = {}
+        # id(canonical object) -> its signature, for building the signatures of parents
+        self._signatures: Dict[int, Hashable] = {}
+        self.keys_interned = 0
+        self.values_deduplicated = 0
+        self.subtrees_deduplicated = 0
+        self.bytes_saved = 0
+
+    def intern(self, data: Any) -> Any:
+        """
+        Returns the deduplicated equivalent of `data`.
+
+        :param data: Raw localization data (dicts, lists and scalars).
+        :type data: Any
+        :return: An equal value, sharing objects with everything interned before.
+        :rtype: Any
+        """
+        if isinstance(data, dict):
+            items = []
+            for key, value in data.items():
+                if isinstance(key, str):
+                    interned_key = sys.intern(key)
+                    if interned_key is not key:
+                        self.keys_interned += 1
+                        self.bytes_saved += sys.getsizeof(key)
+                    key = interned_key
+                items.append((key, self.intern(value)))
+            signature = ('d', tuple((key, self._signature(value)) for key, value in items))
+            return self._share(signature, data, lambda: dict(items))
+
+        if isinstance(data, list):
+            values = [self.intern(value) for value in data]
+            signature = ('l', tuple(self._signature(value) for value in values))
+            return self._share(signature, data, lambda: values)
+
+        try:
+            scalar_key = (type(data), data)
+            canonical = self._scalars.setdefault(scalar_key, data)
+        except TypeError:
+            return data  # Unhashable scalars are kept as they are
+        if canonical is not data:
+            self.values_deduplicated += 1
+            self.bytes_saved += sys.getsizeof(data)
+        return canonical
+
+    def adopt(self, data: Any) -> Any:
+        """
+        Registers already deduplicated data as canonical, without copying it.
+
+        Later `intern` calls then share its objects, e.g. when one locale is loaded
+        again next to the resident ones. Nothing is counted in the statistics.
+
+        :param data: Data returned by `intern`, possibly by another Interner.
+        :type data: Any
+        :return: `data` itself.
+        :rtype: Any
+        """
+        if isinstance(data, dict):
+            signature = ('d', tuple((key, self._signature(self.adopt(value))) for key, value in data.items()))
+        elif isinstance(data, list):
+            signature = ('l', tuple(self._signature(self.adopt(value)) for value in data))
+        else:
+            try:
+                self._scalars.setdefault((type(data), data), data)
+            except TypeError:
+                pass
+            return data
+        self._subtrees.setdefault(signature, data)
+        self._signatures[id(data)] = signature
+        return data
+
+    def _signature(self, value: Any) -> Hashable:
+        signature = self._signatures.get(id(value))
+        if signature is not None:
+            return signature
+        try:
+            hash(value)
+        except TypeError:
+            return ('id', id(value))
+        return (type(value), value)
+
+    def _share(self, signature: Hashable, original: Any, build: Any) -> Any:
+        canonical = self._subtrees.get(signature)
+        if canonical is not None:
+            self.subtrees_deduplicated += 1
+            self.bytes_saved += sys.getsizeof(original)
+            return canonical
+        canonical = self._subtrees[signature] = build()
+        self._signatures[id(canonical)] = signature
+        return canonical
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns what the interning has saved so far.
+
+        :return: A dictionary with `keys_interned`, `values_deduplicated`,
+                 `subtrees_deduplicated` and the approximate `bytes_saved`.
+        :rtype: Dict[str, int]
+        """
+        return {
+            'keys_interned': self.keys_interned,
+            'values_deduplicated': self.values_deduplicated,
+            'subtrees_deduplicated': self.subtrees_deduplicated,
+            'bytes_saved': self.bytes_saved,
+        }
+
+
+def intern_translations(
+        translations: Dict[str, Optional[Dict[str, Any]]]
+) -> Tuple[Dict[str, Optional[Dict[str, Any]]], Dict[str, int]]:
+    """
+    Deduplicates keys, scalar values and subtrees across the raw data of all locales.
+
+    :param translations: Normalized locale codes mapped to raw data (or None).
+    :type translations: Dict[str, Optional[Dict[str, Any]]]
+    :return: The deduplicated mapping and the statistics of `Interner.stats`.
+    :rtype: Tuple[Dict[str, Optional[Dict[str, Any]]], Dict[str, int]]
+    """
+    interner = Interner()
+    interned = {code: interner.intern(data) if data is not None else None for code, data in translations.items()}
+    return interned, interner.stats()
+
+
+__all__ = [
+    "Interner",
+    "intern_translations",
+]
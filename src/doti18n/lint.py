@@ -0,0 +1,307 @@
+# doti18n/lint.py
+
+import os
+import re
+import string
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union
+)
+
+import yaml
+
+from .locale_data import _YAML_LOADER
+from .locale_translator import _get_plural_rule
+from .utils import (
+    _DEFAULT_LOCALE_ALIASES,
+    _canonical_locale_code,
+    _is_plural_dict,
+    _normalize_locale_code
+)
+
+# Issue kinds, in report order
+ISSUE_KINDS = ('error', 'type', 'missing', 'extra', 'placeholder', 'plural', 'key')
+
+# libyaml parses the same documents an order of magnitude faster than the pure Python loader
+_LINT_LOADER = getattr(yaml, 'CSafeLoader', _YAML_LOADER)
+
+Path = Tuple[Union[str, int], ...]
+# Path -> (kind, detail). Kinds are 'namespace', 'list', 'plural' and 'scalar'. The detail is the
+# number of leaves below a container, the placeholder names of a string (None for other scalars),
+# or the (categories, placeholder names) of a plural dict.
+Nodes = Dict[Path, Tuple[str, Any]]
+
+_FIELD_NAME = re.compile(r'[.\[]')
+
+_KIND_NAMES = {'namespace': 'namespace', 'list': 'list', 'plural': 'plural dict', 'scalar': 'value'}
+
+# The flattened default locale, set in each worker process by `_init_worker`
+_reference: Optional[Nodes] = None
+
+
+def _issue(locale_code: str, path: Path, kind: str, message: str) -> Dict[str, str]:
+    return {'locale': locale_code, 'path': '.'.join(map(str, path)), 'kind': kind, 'message': message}
+
+
+def _placeholders(template: str) -> FrozenSet[str]:
+    """
+    Returns the names of the replacement fields of a `str.format` template ('' for positional ones).
+
+    :raises ValueError: If the template is malformed.
+    """
+    return frozenset(
+        _FIELD_NAME.split(field, 1)[0]
+        for _, field, _, _ in string.Formatter().parse(template)
+        if field is not None
+    )
+
+
+def _flatten(data: Any, locale_code: str, issues: List[Dict[str, str]]) -> Nodes:
+    """
+    Flattens a locale into its nodes, reporting malformed templates and unreachable keys to `issues`.
+    """
+    nodes: Nodes = {}
+
+    def visit(value: Any, path: Path) -> int:
+        """Adds `value` and everything below it, returns its number of leaves."""
+        if isinstance(value, dict) and _is_plural_dict(value):
+            names: Set[str] = set()
+            for category, template in value.items():
+                if isinstance(template, str):
+                    try:
+                        names |= _placeholders(template)
+                    except ValueError as e:
+                        issues.append(_issue(locale_code, path + (category,), 'placeholder', f"invalid template: {e}"))
+            nodes[path] = ('plural', (frozenset(value), frozenset(names)))
+            return 1
+        if isinstance(value, dict):
+            leaves = 0
+            for key, item in value.items():
+                if isinstance(key, str):
+                    leaves += visit(item, path + (key,))
+                else:
+                    issues.append(_issue(
+                        locale_code, path + (key,), 'key',
+                        f"{type(key).__name__} key {key!r} can't be looked up, quote it to make it a string"
+                    ))
+            if path:
+                nodes[path] = ('namespace', leaves)
+            return leaves
+        if isinstance(value, list):
+            leaves = sum(visit(item, path + (index,)) for index, item in enumerate(value))
+            nodes[path] = ('list', leaves)
+            return leaves
+
+        names = None
+        if isinstance(value, str):
+            try:
+                names = _placeholders(value)
+            except ValueError as e:
+                issues.append(_issue(locale_code, path, 'placeholder', f"invalid template: {e}"))
+        nodes[path] = ('scalar', names)
+        return 1
+
+    visit(data, ())
+    return nodes
+
+
+def _check_plurals(locale_code: str, nodes: Nodes) -> List[Dict[str, str]]:
+    """Reports plural dicts lacking a CLDR category the locale's plural rule uses."""
+    try:
+        required = set(_get_plural_rule(locale_code).tags) | {'other'}
+    except Exception:
+        # Unknown to Babel, or Babel not installed
+        return []
+
+    issues = []
+    for path, (kind, detail) in nodes.items():
+        if kind != 'plural':
+            continue
+        missing = required - detail[0]
+        if missing:
+            consequence = (
+                "rendered with 'other'" if 'other' in detail[0]
+                else "no 'other' form, rendering fails unless a fallback locale has one"
+            )
+            issues.append(_issue(
+                locale_code, path, 'plural',
+                f"lacks plural categories {', '.join(sorted(missing))} ({consequence})"
+            ))
+    return issues
+
+
+def _compare(locale_code: str, nodes: Nodes, reference: Nodes, default_locale: str) -> List[Dict[str, str]]:
+    """Reports the differences between a locale and the default locale."""
+    issues = []
+    mismatched: Set[Path] = set()
+    for path, (kind, detail) in nodes.items():
+        reference_node = reference.get(path)
+        if reference_node is None:
+            continue
+        reference_kind, reference_detail = reference_node
+        if kind != reference_kind:
+            mismatched.add(path)
+            issues.append(_issue(
+                locale_code, path, 'type',
+                f"is a {_KIND_NAMES[kind]}, but a {_KIND_NAMES[reference_kind]} in '{default_locale}'; "
+                f"lookups through it fall back to '{default_locale}' or fail"
+            ))
+            continue
+
+        if kind == 'plural':
+            # Forms like 'one' often spell the number out, so a missing {count} is fine
+            names, reference_names = detail[1], reference_detail[1]
+            dropped = reference_names - names - {'count'}
+        elif kind == 'scalar' and detail is not None and reference_detail is not None:
+            names, reference_names = detail, reference_detail
+            dropped = reference_names - names
+        else:
+            continue
+        unknown = names - reference_names
+        if unknown:
+            issues.append(_issue(
+                locale_code, path, 'placeholder',
+                f"uses placeholders {_format_names(unknown)} that '{default_locale}' doesn't pass"
+            ))
+        if dropped:
+            issues.append(_issue(
+                locale_code, path, 'placeholder', f"drops placeholders {_format_names(dropped)} of '{default_locale}'"
+            ))
+
+    def topmost(path: Path, present: Nodes) -> bool:
+        """Whether `path` is the first missing node on its branch, and not below a type mismatch."""
+        parents = [path[:length] for length in range(1, len(path))]
+        return (not parents or parents[-1] in present) and not any(parent in mismatched for parent in parents)
+
+    for path, node in reference.items():
+        if path not in nodes and topmost(path, nodes):
+            issues.append(_issue(locale_code, path, 'missing', f"{_describe(node)} of '{default_locale}' is missing"))
+    for path, node in nodes.items():
+        if path not in reference and topmost(path, reference):
+            issues.append(_issue(locale_code, path, 'extra', f"{_describe(node)} not in '{default_locale}'"))
+    return issues
+
+
+def _describe(node: Tuple[str, Any]) -> str:
+    kind, detail = node
+    if kind in ('namespace', 'list'):
+        return f"{kind} ({detail} {'key' if detail == 1 else 'keys'})"
+    return _KIND_NAMES[kind]
+
+
+def _format_names(names: FrozenSet[str]) -> str:
+    return ', '.join('{' + name + '}' for name in sorted(names))
+
+
+def _lint_file(
+        locale_code: str,
+        filepath: str,
+        default_locale: str,
+        reference: Optional[Nodes]
+) -> Tuple[List[Dict[str, str]], Optional[Nodes]]:
+    """Lints one locale file, returns its issues and its nodes (None if it can't be loaded)."""
+    try:
+        with open(filepath, encoding='utf-8') as f:
+            data = yaml.load(f, Loader=_LINT_LOADER)
+    except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+        return [_issue(locale_code, (), 'error', f"can't be loaded from '{filepath}': {' '.join(str(e).split())}")], None
+    if not isinstance(data, dict):
+        return [_issue(locale_code, (), 'error', f"the root of '{filepath}' is not a dictionary")], None
+
+    issues: List[Dict[str, str]] = []
+    nodes = _flatten(data, locale_code, issues)
+    issues += _check_plurals(locale_code, nodes)
+    if reference is not None:
+        issues += _compare(locale_code, nodes, reference, default_locale)
+    return issues, nodes
+
+
+def _init_worker(reference: Optional[Nodes]) -> None:
+    global _reference
+    _reference = reference
+
+
+def _lint_in_worker(args: Tuple[str, str, str]) -> List[Dict[str, str]]:
+    locale_code, filepath, default_locale = args
+    return _lint_file(locale_code, filepath, default_locale, _reference)[0]
+
+
+def lint_catalog(
+        locales_dir: str,
+        default_locale: str = 'en',
+        aliases: Optional[Dict[str, str]] = None,
+        jobs: Optional[int] = None
+) -> List[Dict[str, str]]:
+    """
+    Validates every locale of a localization directory against the default locale.
+
+    Reports, per locale:
+    - `error`: the file can't be loaded or its root is not a dictionary;
+    - `type`: a path that is a namespace, list, plural dict or scalar where the default locale has
+      another kind, so lookups through it fall back to the default locale (or fail);
+    - `missing` and `extra`: paths only the default locale, or only the locale, has. Only the
+      topmost path of a missing or extra branch is reported;
+    - `placeholder`: `str.format` fields not matching the default locale's, and malformed templates;
+    - `plural`: plural dicts lacking a CLDR category the locale's plural rule uses (needs Babel);
+    - `key`: keys that aren't strings (e.g. `404:`), which dot access can't reach.
+
+    The default locale is parsed first, then the other locales in parallel worker processes.
+    Files are parsed with libyaml when PyYAML has it.
+
+    :param locales_dir: The localization directory.
+    :type locales_dir: str
+    :param default_locale: The code of the default locale.
+    :type default_locale: str
+    :param aliases: Locale code aliases, see `LocaleData`.
+    :type aliases: Optional[Dict[str, str]]
+    :param jobs: The number of worker processes, `os.cpu_count()` if None. 1 lints in this process.
+    :type jobs: Optional[int]
+    :return: The issues, dicts with `locale`, `path` (dotted), `kind` and `message`,
+             sorted by locale, kind and path.
+    :rtype: List[Dict[str, str]]
+    :raises FileNotFoundError: If the directory doesn't exist.
+    """
+    aliases = {
+        _normalize_locale_code(alias): _normalize_locale_code(target)
+        for alias, target in {**_DEFAULT_LOCALE_ALIASES, **(aliases or {})}.items()
+    }
+    default_locale = _canonical_locale_code(default_locale, aliases)
+    files: Dict[str, str] = {}
+    for filename in sorted(os.listdir(locales_dir)):
+        if filename.lower().endswith((".yaml", ".yml")):
+            files[_canonical_locale_code(os.path.splitext(filename)[0], aliases)] = os.path.join(locales_dir, filename)
+
+    if default_locale in files:
+        issues, reference = _lint_file(default_locale, files.pop(default_locale), default_locale, None)
+    else:
+        issues, reference = [_issue(default_locale, (), 'error', "no file for the default locale")], None
+
+    tasks = [(locale_code, filepath, default_locale) for locale_code, filepath in files.items()]
+    jobs = min(jobs or os.cpu_count() or 1, len(tasks))
+    if jobs <= 1:
+        _init_worker(reference)
+        try:
+            results = [_lint_in_worker(task) for task in tasks]
+        finally:
+            _init_worker(None)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(reference,)) as executor:
+            results = list(executor.map(_lint_in_worker, tasks))
+
+    for locale_issues in results:
+        issues += locale_issues
+    order = {kind: position for position, kind in enumerate(ISSUE_KINDS)}
+    return sorted(issues, key=lambda issue: (issue['locale'], order[issue['kind']], issue['path']))
+
+
+__all__ = [
+    "ISSUE_KINDS",
+    "lint_catalog",
+]
@@ -1,20 +1,76 @@
 # doti18n/locale_data.py
 
+import functools
+import gc
+import itertools
 import os
+import sys
+import threading
+from concurrent.futures import Executor
+from types import MappingProxyType
 from typing import (
     Dict,
     Optional,
     Any,
-    List
+    List,
+    Mapping,
+    ContextManager,
+    Iterable,
+    Set,
+    Tuple,
+    Union
 )
 
 import yaml
-from .locale_translator import LocaleTranslator
+from .locale_translator import (
+    LocaleTranslator,
+    _get_plural_rule
+)
+from .compact import (
+    CompactDict,
+    CompactTree,
+    compact_translations
+)
+from .interning import (
+    Interner,
+    intern_translations
+)
+from .artifact import read_artifact
+from .misses import MissReporter
+from .instrumentation import (
+    LookupObserver,
+    ObserverGroup
+)
+from .utils import (
+    _DEFAULT_LOCALE_ALIASES,
+    _DICT_TYPES,
+    _canonical_locale_code,
+    _deep_sizeof,
+    _freeze,
+    _iter_leaves,
+    _normalize_locale_code
+)
+from .cache import (
+    LRUCache,
+    RenderCache
+)
+from .negotiation import (
+    match_locale,
+    parse_accept_language
+)
+from .context import use_locale
 import logging
 
 
 logger = logging.getLogger(__name__)
 
+# Stands in the raw data snapshot for a locale that was evicted (see `max_resident_locales`)
+# and is reloaded from its file on next use
+_EVICTED = object()
+
+# The loader of the locale files. Reported by `python -m doti18n.profile_load`.
+_YAML_LOADER = yaml.SafeLoader
+
 
 class LocaleData:
     """
@@ -23,50 +79,208 @@ class LocaleData:
     Supports a 'strict' mode which is passed to created LocaleTranslator instances.
     """
 
-    def __init__(self, locales_dir: str, default_locale: str = 'en', strict: bool = False):
+    def __init__(
+            self,
+            locales_dir: str,
+            default_locale: str = 'en',
+            strict: bool = False,
+            render_cache_size: Optional[int] = None,
+            negotiation_cache_size: int = 256,
+            fallback_chains: Optional[Dict[str, List[str]]] = None,
+            aliases: Optional[Dict[str, str]] = None,
+            storage: str = 'dict',
+            deduplicate: bool = False,
+            max_resident_locales: Optional[int] = None,
+            max_resident_bytes: Optional[int] = None,
+            miss_reporter: Optional[MissReporter] = None,
+            compiled: bool = False
+    ):
         """
         Initializes the LocaleData manager.
 
         Loads all YAML localization files from the specified directory.
 
-        :param locales_dir: The path to the directory containing locale YAML files.
+        :param locales_dir: The path to the directory containing locale YAML files, or to a catalog
+                            compiled by `doti18n compile` if `compiled` is `True`.
         :type locales_dir: str
         :param default_locale: The code of the default locale. Defaults to 'en'.
         :type default_locale: str
         :param strict: If `True`, all created LocaleTranslator instances will be in strict mode.
                        If `False` (default), they will be in non-strict mode.
         :type strict: bool
+        :param render_cache_size: If set, enables a shared LRU cache of rendered plural strings
+                                  holding at most this many entries. Disabled by default.
+        :type render_cache_size: Optional[int]
+        :param negotiation_cache_size: How many distinct `Accept-Language` values `negotiate` remembers.
+        :type negotiation_cache_size: int
+        :param fallback_chains: Explicit fallback locales per locale code, e.g. `{'pt': ['es']}`.
+                                Locales without an entry fall back to their parent code
+                                ('zh-hant-hk' -> 'zh-hant' -> 'zh'). The default locale always comes last.
+        :type fallback_chains: Optional[Dict[str, List[str]]]
+        :param aliases: Locale code aliases, e.g. `{'no': 'nb'}`, added to the built-in table of
+                        deprecated codes (`iw` -> `he`, `in` -> `id`, ...). An alias of a language
+                        also applies to its regional variants (`iw-il` -> `he-il`).
+        :type aliases: Optional[Dict[str, str]]
+        :param storage: How loaded data is kept in memory: 'dict' (default) keeps the nested dicts and
+                        lists produced by the YAML parser, 'compact' packs them into read-only arrays
+                        (see `compact.CompactTree`), which takes far less memory for large catalogs.
+        :type storage: str
+        :param deduplicate: If `True`, every load interns all keys and shares equal values and
+                            subtrees across locales (see `interning.Interner`). The loaded data must
+                            then be treated as read-only. The outcome is kept in `intern_stats`.
+                            Ignored with 'compact' storage, which stores each key only once anyway.
+        :type deduplicate: bool
+        :param max_resident_locales: If set, locales that were not used for the longest time are evicted
+                                     from memory once more than this many are resident, and reloaded from
+                                     their files on next use. The default locale and its fallback chain
+                                     are never evicted, but count towards the limit.
+        :type max_resident_locales: Optional[int]
+        :param max_resident_bytes: Like `max_resident_locales`, but limits the approximate size of the
+                                   resident data (see `memory_report`). Both limits can be combined.
+        :type max_resident_bytes: Optional[int]
+        :param miss_reporter: Collects the misses of all translators in non-strict mode and logs each
+                              unique one once (see `misses.MissReporter`). Pass your own instance to
+                              re-log at an interval or to track more keys. Kept across reloads.
+        :type miss_reporter: Optional[MissReporter]
+        :param compiled: If `True`, `locales_dir` is a catalog compiled by `doti18n compile` (see
+                         `artifact.compile_catalog`). Compiled catalogs are pickles: only load the
+                         ones you built yourself.
+        :type compiled: bool
+        :raises ValueError: If `storage` is not one of the supported values.
         """
 
         self.logger = logger
+        if storage not in ('dict', 'compact'):
+            raise ValueError(f"Unknown storage '{storage}', expected 'dict' or 'compact'.")
+
         self.locales_dir = locales_dir
-        self.default_locale = default_locale.lower()
+        self.compiled = compiled
+        self.storage = storage
+        self.deduplicate = deduplicate
+        # Statistics of the last interning pass (see `deduplicate`), None if it never ran
+        self.intern_stats: Optional[Dict[str, int]] = None
+        self.aliases: Dict[str, str] = {
+            _normalize_locale_code(alias): _normalize_locale_code(target)
+            for alias, target in {**_DEFAULT_LOCALE_ALIASES, **(aliases or {})}.items()
+        }
+        # Memoized results of `canonical_locale_code`: any spelling -> canonical code
+        self._canonical_codes: Dict[str, str] = {}
+        self.default_locale = self.canonical_locale_code(default_locale)
         self._strict = strict
-        # Dictionary to store raw loaded data: normalized_locale_code -> data (or None)
-        self._raw_translations: Dict[str, Optional[Dict[str, Any]]] = {}
+        self.fallback_chains: Dict[str, List[str]] = {
+            self.canonical_locale_code(code): [self.canonical_locale_code(fallback) for fallback in fallbacks]
+            for code, fallbacks in (fallback_chains or {}).items()
+        }
+        # Immutable snapshot of raw loaded data: normalized_locale_code -> data (or None).
+        # It is never mutated after publication; reloads replace it as a whole.
+        self._raw_translations: Mapping[str, Optional[Dict[str, Any]]] = MappingProxyType({})
         # Cache for LocaleTranslator instances: normalized_locale_code -> LocaleTranslator
         self._locale_translators_cache: Dict[str, LocaleTranslator] = {}
-        self._load_all_translations()
+        # Optional cache of rendered plural strings shared by all translators
+        self.render_cache: Optional[RenderCache] = RenderCache(render_cache_size) if render_cache_size else None
+        # The render cache of the published snapshot, paired with it: a translator only gets the
+        # cache if it was built from that very snapshot, so renders of another catalog can't leak in
+        self._snapshot_render_cache: Tuple[Mapping[str, Any], Optional[RenderCache]] = (
+            self._raw_translations, self.render_cache
+        )
+        # Results of `negotiate`: header value (or tuple of codes) -> matched locale code
+        self._negotiation_cache = LRUCache(negotiation_cache_size)
+        # Number of lookups of locale codes that were not loaded, see `translator_cache_info`
+        self._unknown_locale_lookups = 0
+        # Eviction of idle locales, disabled if both limits are None
+        self.max_resident_locales = max_resident_locales
+        self.max_resident_bytes = max_resident_bytes
+        # locale code -> tick of its last use, None if eviction is disabled (the hot path checks just that)
+        self._last_used: Optional[Dict[str, int]] = (
+            {} if max_resident_locales is not None or max_resident_bytes is not None else None
+        )
+        self._clock = itertools.count()
+        # locale code -> approximate size of its resident data, computed when needed
+        self._resident_bytes: Dict[str, int] = {}
+        # locale code -> file its data was loaded from, to reload evicted locales
+        self._locale_files: Dict[str, str] = {}
+        # locale code -> (its data, index, plural templates) precomputed by a compiled catalog
+        self._compiled_indexes: Dict[str, tuple] = {}
+        self._evictions = 0
+        # Set while `freeze` builds the translators, so it doesn't evict the data it just froze
+        self._eviction_paused = False
+        # Locales whose pinned fallback chain alone exceeds max_resident_locales, warned about once
+        self._oversized_chains: Set[str] = set()
+        self.miss_reporter = miss_reporter if miss_reporter is not None else MissReporter()
+        # Lookup observers, and what translators are given: None, the only observer or an ObserverGroup
+        self._observers: List[LookupObserver] = []
+        self._observer: Optional[LookupObserver] = None
+        # Serializes writers (reloads, evictions). Readers never take it.
+        self._write_lock = threading.Lock()
+        self._publish(self._read_all_translations())
+
+    def canonical_locale_code(self, locale_code: str) -> str:
+        """
+        Returns the canonical form of a locale code, used for lookups, file names and caches.
+
+        Normalizes the spelling ('pt_BR', 'PT-br' -> 'pt-br') and resolves aliases
+        ('iw' -> 'he', 'iw_IL' -> 'he-il'). Results are memoized.
+
+        :param locale_code: The locale code in any spelling.
+        :type locale_code: str
+        :return: The canonical locale code.
+        :rtype: str
+        """
+        canonical = self._canonical_codes.get(locale_code)
+        if canonical is not None:
+            return canonical
+
+        canonical = _canonical_locale_code(locale_code, self.aliases)
+        # Spellings may come from request headers, so stop memoizing new ones at some point
+        if len(self._canonical_codes) < 4096:
+            self._canonical_codes[locale_code] = canonical
+        return canonical
+
+    def _read_all_translations(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Reads and parses all YAML localization files from the directory.
+
+        Does not touch the state of this instance (apart from `intern_stats`, the index of locale
+        files and the indexes of a compiled catalog), so it is safe to call concurrently with lookups.
+        The result is meant to be passed to `_publish`.
 
-    def _load_all_translations(self):
-        """Loads all YAML localization files from the directory."""
+        :return: A new mapping of normalized locale codes to their raw data (or None).
+        :rtype: Dict[str, Optional[Dict[str, Any]]]
+        """
+        translations: Dict[str, Optional[Dict[str, Any]]] = {}
+        files: Dict[str, str] = {}
         if not os.path.exists(self.locales_dir):
             self.logger.error(f"Localization directory '{self.locales_dir}' not found.")
-            return
+            return translations
+
+        if self.compiled:
+            translations = self._read_artifact()
+            filenames = []
+        elif not os.path.isdir(self.locales_dir):
+            self.logger.error(
+                f"Localization directory '{self.locales_dir}' is not a directory. "
+                "Pass compiled=True to load a catalog compiled by `doti18n compile`."
+            )
+            return translations
+        else:
+            filenames = os.listdir(self.locales_dir)
 
-        loaded_any = False
-        for filename in os.listdir(self.locales_dir):
+        loaded_any = bool(translations)
+        for filename in filenames:
             if filename.lower().endswith((".yaml", ".yml")):
                 locale_code_raw = os.path.splitext(filename)[0]
-                locale_code_normalized = locale_code_raw.lower()
+                locale_code_normalized = self.canonical_locale_code(locale_code_raw)
                 filepath = os.path.join(self.locales_dir, filename)
+                if locale_code_normalized in translations:
+                    self.logger.warning(
+                        f"Locale file '{filename}' overrides another file of locale '{locale_code_normalized}'."
+                    )
                 try:
-                    with open(filepath, encoding='utf-8') as f:
-                        data = yaml.safe_load(f)
-                        # Store the loaded data under the normalized locale code.
-                        # If the loaded data is not a dictionary at the root, store None.
-                        self._raw_translations[locale_code_normalized] = data if isinstance(data, dict) else None
-                        loaded_any = True
+                    # Store the loaded data under the normalized locale code.
+                    # If the loaded data is not a dictionary at the root, store None.
+                    translations[locale_code_normalized] = self._parse_locale_file(filepath)
+                    files[locale_code_normalized] = filepath
+                    loaded_any = True
                     self.logger.info(f"Loaded locale data for: '{locale_code_normalized}' from '{filename}'")
                 except FileNotFoundError:
                     self.logger.error(f"Locale file '{filepath}' not found during load.")
@@ -75,22 +289,406 @@ class LocaleData:
                 except Exception as e:
                     self.logger.error(f"Unknown error loading '{filepath}': {e}", exc_info=True)
 
+        self._locale_files = files
         if not loaded_any:
             self.logger.warning(f"No localization files found or successfully loaded from '{self.locales_dir}'.")
 
-        default_data = self._raw_translations.get(self.default_locale)
+        default_data = translations.get(self.default_locale)
         if not isinstance(default_data, dict):
-            if self.default_locale not in self._raw_translations:
-                self._raw_translations[self.default_locale] = None  # Ensure entry exists
-            elif not isinstance(default_data, dict):
-                self._raw_translations[self.default_locale] = None  # None if not a dict
-
+            translations[self.default_locale] = None  # Ensure entry exists, None if not a dict
             self.logger.critical(
                 f"Default locale file for '{self.default_locale}.yaml/.yml' not found or root is not a dictionary "
                 f"({type(default_data).__name__ if default_data is not None else 'NoneType'}). "
                 "Fallback to default locale will be limited or impossible."
             )
 
+        if self.storage == 'compact':
+            translations = compact_translations(translations)
+            if self._compiled_indexes:
+                self.logger.info("The indexes of the compiled catalog are not used with 'compact' storage.")
+        elif self.deduplicate and not self.compiled:
+            translations, self.intern_stats = intern_translations(translations)
+            self.logger.info(
+                f"Interned locale data: {self.intern_stats['bytes_saved']} bytes saved "
+                f"({self.intern_stats['keys_interned']} keys, {self.intern_stats['values_deduplicated']} values, "
+                f"{self.intern_stats['subtrees_deduplicated']} subtrees)."
+            )
+        return translations
+
+    def _read_artifact(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Reads a catalog compiled by `artifact.compile_catalog` from `locales_dir`.
+
+        Its indexes are kept in `_compiled_indexes` if it was compiled with the same default
+        locale and fallback chains, otherwise translators traverse the data as usual.
+        Compiled locales can't be evicted, they have no file to be reloaded from.
+
+        :return: A new mapping of normalized locale codes to their raw data (or None),
+                 empty if the artifact can't be read.
+        :rtype: Dict[str, Optional[Dict[str, Any]]]
+        """
+        self._compiled_indexes = {}
+        try:
+            artifact = read_artifact(self.locales_dir)
+            translations = {
+                self.canonical_locale_code(code): data for code, data in artifact['translations'].items()
+            }
+        except Exception as e:
+            # Anything may come out of a corrupted pickle
+            self.logger.error(f"Error reading compiled catalog '{self.locales_dir}': {e}")
+            return {}
+
+        self.intern_stats = artifact['intern_stats']
+        if (
+                artifact['default_locale'] != self.default_locale
+                or artifact['fallback_chains'] != self.fallback_chains
+                or set(translations) != set(artifact['translations'])  # Different aliases
+        ):
+            self.logger.warning(
+                f"Compiled catalog '{self.locales_dir}' was built for default locale "
+                f"'{artifact['default_locale']}', fallback chains {artifact['fallback_chains']} and other "
+                f"aliases, its precomputed indexes are not used."
+            )
+        else:
+            self._compiled_indexes = {
+                code: (translations.get(code), index, plural_templates)
+                for code, (index, plural_templates) in artifact['indexes'].items()
+            }
+        self.logger.info(f"Loaded compiled catalog '{self.locales_dir}' with locales: {', '.join(translations)}")
+        return translations
+
+    @staticmethod
+    def _parse_locale_file(filepath: str) -> Optional[Dict[str, Any]]:
+        """
+        Parses one YAML localization file.
+
+        :param filepath: The path to the file.
+        :type filepath: str
+        :return: The parsed data, or None if its root is not a dictionary.
+        :rtype: Optional[Dict[str, Any]]
+        :raises OSError: If the file can't be read.
+        :raises yaml.YAMLError: If the file is not valid YAML.
+        """
+        with open(filepath, encoding='utf-8') as f:
+            data = yaml.load(f, Loader=_YAML_LOADER)
+        return data if isinstance(data, dict) else None
+
+    def _publish(self, translations: Dict[str, Optional[Dict[str, Any]]]) -> None:
+        """
+        Atomically replaces the loaded catalog with `translations`.
+
+        The raw data snapshot is published before the fresh translator cache, so a
+        reader that sees the new cache is guaranteed to also see the new data.
+        Translators built from the previous snapshot stay valid for whoever holds them.
+
+        :param translations: The new mapping of normalized locale codes to raw data.
+        :type translations: Dict[str, Optional[Dict[str, Any]]]
+        """
+        with self._write_lock:
+            # A fresh render cache for the new catalog
+            render_cache = RenderCache(self.render_cache.maxsize) if self.render_cache is not None else None
+            self._set_snapshot(MappingProxyType(translations), render_cache)
+            self._locale_translators_cache = {}
+            # Matches depend on the set of loaded locales
+            self._negotiation_cache = LRUCache(self._negotiation_cache.maxsize)
+            self._resident_bytes = {}
+        self._evict_idle()
+
+    def _set_snapshot(self, snapshot: Mapping[str, Any], render_cache: Optional[RenderCache]) -> None:
+        """
+        Publishes a data snapshot with the render cache of its catalog. Called under `_write_lock`.
+
+        The data is published before the pair, see `__getitem__` for how they are matched.
+        """
+        self._raw_translations = snapshot
+        self.render_cache = render_cache
+        self._snapshot_render_cache = (snapshot, render_cache)
+
+    def _load_evicted(self, locale_codes: List[str]) -> Mapping[str, Optional[Dict[str, Any]]]:
+        """
+        Reloads the given locales from their files if they were evicted.
+
+        The new data is published as a copy of the current snapshot with the reloaded
+        entries replaced, so concurrent lookups keep working on either of them.
+
+        :param locale_codes: The normalized locale codes that must be resident.
+        :type locale_codes: List[str]
+        :return: The published snapshot, containing all of `locale_codes` that have data.
+        :rtype: Mapping[str, Optional[Dict[str, Any]]]
+        """
+        with self._write_lock:
+            translations = self._raw_translations
+            evicted = [code for code in locale_codes if translations.get(code) is _EVICTED]
+            if not evicted:
+                return translations
+
+            reloaded: Dict[str, Optional[Dict[str, Any]]] = {}
+            interner: Optional[Interner] = None
+            for locale_code in evicted:
+                filepath = self._locale_files.get(locale_code)
+                try:
+                    data = self._parse_locale_file(filepath)
+                except Exception as e:
+                    self.logger.error(f"Error reloading evicted locale '{locale_code}' from '{filepath}': {e}")
+                    data = None
+                if data is not None and self.storage == 'compact':
+                    # Share the key pool of the resident locales
+                    pool_owner = next((d for d in translations.values() if isinstance(d, CompactDict)), None)
+                    data = CompactTree(data, pool_owner.tree._pool if pool_owner is not None else None).root
+                elif data is not None and self.deduplicate:
+                    if interner is None:
+                        # Share keys, values and subtrees with the resident locales, like the initial load
+                        interner = Interner()
+                        for resident in translations.values():
+                            if isinstance(resident, _DICT_TYPES):
+                                interner.adopt(resident)
+                    data = interner.intern(data)
+                reloaded[locale_code] = data
+                self._resident_bytes.pop(locale_code, None)
+                self.logger.info(f"Reloaded evicted locale '{locale_code}' from '{filepath}'")
+
+            translations = MappingProxyType({**translations, **reloaded})
+            # Same catalog, same renders
+            self._set_snapshot(translations, self.render_cache)
+            return translations
+
+    def _evict_idle(self, keep: Optional[str] = None) -> None:
+        """
+        Evicts the least recently used locales until the resident ones fit the configured limits.
+
+        Evicted entries are replaced by a marker in a new snapshot, and translators using
+        their data are dropped from the cache. Translators held elsewhere keep working.
+
+        :param keep: A locale code that must stay resident with its whole fallback chain,
+                     usually the one just loaded.
+        :type keep: Optional[str]
+        """
+        last_used = self._last_used
+        if last_used is None or self._eviction_paused:
+            return
+
+        with self._write_lock:
+            translations = self._raw_translations
+            resident = [code for code, data in translations.items() if isinstance(data, _DICT_TYPES)]
+            pinned = {self.default_locale, *self._fallback_locales(self.default_locale)}
+            if keep is not None:
+                # The translator of `keep` uses its whole chain, evicting any of it would drop
+                # the translator and reload the locale on the next lookup
+                chain = self.fallback_chain(keep)
+                pinned.update(chain)
+                resident_chain = [code for code in chain if isinstance(translations.get(code), _DICT_TYPES)]
+                if (self.max_resident_locales is not None and len(resident_chain) > self.max_resident_locales
+                        and keep not in self._oversized_chains):
+                    self._oversized_chains.add(keep)
+                    self.logger.warning(
+                        f"The fallback chain of '{keep}' ({', '.join(chain)}) needs more locales than "
+                        f"max_resident_locales={self.max_resident_locales}, keeping it resident anyway."
+                    )
+            # Approximate LRU: ticks are written without synchronization
+            candidates = sorted(
+                (code for code in resident if code not in pinned and code in self._locale_files),
+                key=lambda code: last_used.get(code, -1)
+            )
+
+            def resident_bytes(code: str) -> int:
+                size = self._resident_bytes.get(code)
+                if size is None:
+                    size = self._resident_bytes[code] = _deep_sizeof(translations[code])
+                return size
+
+            count = len(resident)
+            size = sum(resident_bytes(code) for code in resident) if self.max_resident_bytes is not None else 0
+            evicted = set()
+            for code in candidates:
+                over_count = self.max_resident_locales is not None and count > self.max_resident_locales
+                over_bytes = self.max_resident_bytes is not None and size > self.max_resident_bytes
+                if not (over_count or over_bytes):
+                    break
+                evicted.add(code)
+                count -= 1
+                if self.max_resident_bytes is not None:
+                    size -= self._resident_bytes.pop(code)
+            if not evicted:
+                return
+
+            # Data before translators, see `_publish` for the ordering guarantee
+            self._set_snapshot(
+                MappingProxyType({code: _EVICTED if code in evicted else data for code, data in translations.items()}),
+                self.render_cache
+            )
+            self._locale_translators_cache = {
+                code: translator for code, translator in self._locale_translators_cache.items()
+                if not any(used_code in evicted for used_code, _ in translator._resolution_order)
+            }
+            self._evictions += len(evicted)
+        self.logger.info(f"Evicted idle locales: {', '.join(sorted(evicted))}")
+
+    def reload(self) -> None:
+        """
+        Re-reads all localization files and atomically swaps in the new catalog.
+
+        Lookups running concurrently keep using the previous catalog until the swap,
+        they never observe a partially loaded state.
+        """
+        self._publish(self._read_all_translations())
+
+    def freeze(self) -> None:
+        """
+        Prepares the loaded catalog to be shared by forked worker processes.
+
+        Call it in the master process right before forking. It replaces the raw data
+        with read-only copies, builds the translators of all loaded locales, warms the
+        plural rule cache and finally moves every object tracked by the garbage collector
+        into the permanent generation (`gc.freeze()`), so collections in the children
+        don't write to the shared pages.
+
+        A later `reload` publishes regular (unfrozen) data again.
+
+        With `max_resident_locales` or `max_resident_bytes`, nothing is evicted while freezing,
+        and only the translators whose whole fallback chain is resident are built: the others
+        would reload evicted locales unfrozen. They are built on first use, like after an eviction.
+        """
+        memo: Dict[int, Any] = {}
+        translations = {code: _freeze(data, memo) for code, data in self._raw_translations.items()}
+        self._publish(translations)
+        if self._compiled_indexes:
+            # Point the indexes at the frozen data, which the memo shares with `translations`
+            entries: Dict[int, tuple] = {}
+
+            def freeze_entry(entry: tuple) -> tuple:
+                frozen = entries.get(id(entry))
+                if frozen is None:
+                    frozen = entries[id(entry)] = (_freeze(entry[0], memo), entry[1])
+                return frozen
+
+            self._compiled_indexes = {
+                code: (
+                    translations.get(code),
+                    {path: freeze_entry(entry) for path, entry in index.items()},
+                    {path: _freeze(templates, memo) for path, templates in plural_templates.items()},
+                )
+                for code, (_, index, plural_templates) in self._compiled_indexes.items()
+            }
+
+        self._eviction_paused = True
+        try:
+            for locale_code, data in translations.items():
+                if all(translations.get(code) is not _EVICTED for code in self.fallback_chain(locale_code)):
+                    self[locale_code]
+                try:
+                    _get_plural_rule(locale_code)
+                except Exception as e:
+                    self.logger.debug(f"No plural rules to warm up for locale '{locale_code}': {e}")
+        finally:
+            self._eviction_paused = False
+
+        gc.collect()
+        if hasattr(gc, 'freeze'):
+            gc.freeze()
+
+    @classmethod
+    async def aload(
+            cls,
+            locales_dir: str,
+            default_locale: str = 'en',
+            strict: bool = False,
+            executor: Optional[Executor] = None,
+            **kwargs: Any
+    ) -> 'LocaleData':
+        """
+        Asynchronously creates a LocaleData without blocking the event loop.
+
+        Reading and parsing the files happens in `executor` (the loop's default
+        executor if None). Accepts the same arguments as the constructor.
+
+        :param locales_dir: The path to the directory containing locale YAML files.
+        :type locales_dir: str
+        :param default_locale: The code of the default locale. Defaults to 'en'.
+        :type default_locale: str
+        :param strict: Whether created translators are in strict mode.
+        :type strict: bool
+        :param executor: The executor to run the loading in.
+        :type executor: Optional[Executor]
+        :return: The fully loaded LocaleData instance.
+        :rtype: LocaleData
+        """
+        # Imported here: asyncio is slow to import and only needed by the async API
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor,
+            functools.partial(cls, locales_dir, default_locale, strict, **kwargs)
+        )
+
+    async def areload(self, executor: Optional[Executor] = None) -> None:
+        """
+        Asynchronous version of `reload`.
+
+        Files are read and parsed in `executor` (the loop's default executor if None),
+        then the new catalog is published atomically. Lookups are never blocked.
+
+        :param executor: The executor to run the loading in.
+        :type executor: Optional[Executor]
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        translations = await loop.run_in_executor(executor, self._read_all_translations)
+        self._publish(translations)
+
+    def _fallback_locales(
+            self,
+            locale_code: str,
+            raw_translations: Optional[Mapping[str, Optional[Dict[str, Any]]]] = None
+    ) -> List[str]:
+        """
+        Computes the loaded locales searched after `locale_code` and before the default locale.
+
+        Follows the explicit `fallback_chains` entry of a code if there is one, otherwise its
+        parent code, recursively. Codes without data are passed through but not included,
+        so 'zh-hant-hk' still reaches a loaded 'zh' through a missing 'zh-hant'. Evicted
+        locales are included.
+
+        :param locale_code: The normalized locale code.
+        :type locale_code: str
+        :param raw_translations: The snapshot to look at, the published one if None.
+        :type raw_translations: Optional[Mapping[str, Optional[Dict[str, Any]]]]
+        :return: The intermediate locale codes, in lookup order.
+        :rtype: List[str]
+        """
+        if raw_translations is None:
+            raw_translations = self._raw_translations
+        chain: List[str] = []
+        seen = {locale_code, self.default_locale}
+
+        def visit(code: str) -> None:
+            explicit = self.fallback_chains.get(code)
+            parents = explicit if explicit is not None else [code.rpartition('-')[0]]
+            for parent in parents:
+                if not parent or parent in seen:
+                    continue
+                seen.add(parent)
+                if _is_available(raw_translations.get(parent)):
+                    chain.append(parent)
+                visit(parent)
+
+        visit(locale_code)
+        return chain
+
+    def fallback_chain(self, locale_code: str) -> List[str]:
+        """
+        Returns the full lookup order for a locale: the locale itself, its fallbacks and the default locale.
+
+        :param locale_code: The code of the locale (e.g., 'pt-BR').
+        :type locale_code: str
+        :return: The locale codes in lookup order, e.g. ['pt-br', 'pt', 'es', 'en'].
+        :rtype: List[str]
+        """
+        normalized_locale_code = self.canonical_locale_code(locale_code)
+        chain = [normalized_locale_code, *self._fallback_locales(normalized_locale_code), self.default_locale]
+        return list(dict.fromkeys(chain))
+
     def __getitem__(self, locale_code: str) -> LocaleTranslator:
         """
         Returns the LocaleTranslator object for the specified locale code.
@@ -99,30 +697,279 @@ class LocaleData:
         same locale. Normalizes the locale code to lowercase. The 'strict'
         setting of this LocaleData instance is passed to the translator.
 
+        Codes that were not loaded (e.g., taken from an `Accept-Language` header)
+        are not cached: they get the translator of their first loaded fallback
+        locale ('en-us' -> 'en') or the default locale, so the cache can't grow
+        beyond the number of locale files.
+
+        Safe to call from multiple threads without locking: if two threads race
+        on an uncached locale, both build a translator but only the first one
+        stored is ever returned.
+
         :param locale_code: The code of the desired locale (e.g., 'en', 'FR').
         :type locale_code: str
         :return: The LocaleTranslator instance for the requested locale.
         :rtype: LocaleTranslator
         """
 
-        normalized_locale_code = locale_code.lower()
-        if normalized_locale_code in self._locale_translators_cache:
-            return self._locale_translators_cache[normalized_locale_code]
+        normalized_locale_code = self.canonical_locale_code(locale_code)
+        # Read the cache before the data, see `_publish` for the ordering guarantee
+        cache = self._locale_translators_cache
+        translator = cache.get(normalized_locale_code)
+        if translator is not None:
+            if self._last_used is not None:
+                self._last_used[normalized_locale_code] = next(self._clock)
+            return translator
+
+        raw_translations = self._raw_translations
+        if normalized_locale_code not in raw_translations and normalized_locale_code != self.default_locale:
+            # Counted without synchronization, the value is approximate under heavy concurrency
+            self._unknown_locale_lookups += 1
+            fallbacks = self._fallback_locales(normalized_locale_code)
+            return self[fallbacks[0] if fallbacks else self.default_locale]
+
+        fallback_codes = self._fallback_locales(normalized_locale_code, raw_translations)
+        if self._last_used is not None:
+            chain = [normalized_locale_code, *fallback_codes, self.default_locale]
+            for code in chain:
+                self._last_used[code] = next(self._clock)
+            # The translator would silently skip the data of an evicted locale, so load the chain
+            # until the snapshot read has all of it (a concurrent reload may change the chain)
+            while any(raw_translations.get(code) is _EVICTED for code in chain):
+                raw_translations = self._load_evicted(chain)
+                fallback_codes = self._fallback_locales(normalized_locale_code, raw_translations)
+                chain = [normalized_locale_code, *fallback_codes, self.default_locale]
 
-        current_locale_data = self._raw_translations.get(normalized_locale_code)
-        default_locale_data = self._raw_translations.get(self.default_locale)
+        current_locale_data = raw_translations.get(normalized_locale_code)
+        default_locale_data = raw_translations.get(self.default_locale)
+        fallback_locales = [(code, raw_translations[code]) for code in fallback_codes]
+        # The indexes of a compiled catalog hold only while its data is the published one
+        index = plural_templates = None
+        compiled = self._compiled_indexes.get(normalized_locale_code)
+        if compiled is not None and compiled[0] is current_locale_data:
+            _, index, plural_templates = compiled
+
+        snapshot, render_cache = self._snapshot_render_cache
+        if snapshot is not raw_translations:
+            # Another snapshot was published since the data was read, maybe of a reloaded catalog:
+            # go without a render cache rather than fill the new catalog's with renders of this one
+            render_cache = None
 
         translator = LocaleTranslator(
             normalized_locale_code,
             current_locale_data,
             default_locale_data,
             self.default_locale,
-            strict=self._strict
+            strict=self._strict,
+            render_cache=render_cache,
+            fallback_locales=fallback_locales,
+            observer=self._observer,
+            miss_reporter=self.miss_reporter,
+            index=index,
+            plural_templates=plural_templates
         )
 
-        self._locale_translators_cache[normalized_locale_code] = translator
+        # dict.setdefault is atomic, so concurrent builders agree on a single instance
+        translator = cache.setdefault(normalized_locale_code, translator)
+        # In case observers changed while it was built
+        translator._observer = self._observer
+        self._evict_idle(keep=normalized_locale_code)
         return translator
 
+    def negotiate(self, header_or_list: Union[str, Iterable[str]]) -> LocaleTranslator:
+        """
+        Returns the translator of the loaded locale that best matches the client's preferences.
+
+        Accepts a raw `Accept-Language` value (q-weights are honoured) or an iterable of
+        locale codes in order of preference. See `negotiation.match_locale` for the
+        matching rules; if nothing matches, the default locale's translator is returned.
+        Results are cached per distinct input, as real traffic repeats a few hundred values.
+
+        :param header_or_list: An `Accept-Language` header value or a list of locale codes.
+        :type header_or_list: Union[str, Iterable[str]]
+        :return: The best matching LocaleTranslator.
+        :rtype: LocaleTranslator
+        """
+
+        key = header_or_list if isinstance(header_or_list, str) else tuple(header_or_list)
+        cache = self._negotiation_cache
+        locale_code = cache.get(key)
+        if locale_code is None:
+            if isinstance(key, str):
+                candidates = [language for language, _ in parse_accept_language(key)]
+            else:
+                candidates = list(key)
+            candidates = [self.canonical_locale_code(code) for code in candidates]
+            locale_code = match_locale(candidates, self.loaded_locales) or self.default_locale
+            cache.put(key, locale_code)
+        return self[locale_code]
+
+    def translator_cache_info(self) -> Dict[str, int]:
+        """
+        Returns metrics of the translator cache, e.g. for alerting.
+
+        :return: A dictionary with the number of cached translators (`size`), the number of
+                 locale codes that can be cached (`max_size`) and the number of lookups of
+                 codes that were not loaded and got the default translator (`unknown_lookups`) and the
+                 number of locales evicted so far (`evictions`, see `max_resident_locales`).
+        :rtype: Dict[str, int]
+        """
+        return {
+            'size': len(self._locale_translators_cache),
+            'max_size': len(set(self._raw_translations) | {self.default_locale}),
+            'unknown_lookups': self._unknown_locale_lookups,
+            'evictions': self._evictions,
+        }
+
+    def memory_report(self) -> Dict[str, Any]:
+        """
+        Returns an approximate breakdown of the memory held by the loaded catalog and the caches.
+
+        Sizes are deep `sys.getsizeof` sums. Per locale and per top-level namespace each
+        object is counted where it is reached, so objects shared between locales (see
+        `deduplicate`) appear in several of them, while `total_bytes` counts them once.
+        Wrappers (LocaleNamespace, LocaleList, NoneWrapper) are created per access and
+        never cached, so they hold no memory between lookups. Evicted locales are not listed.
+
+        :return: A dictionary with:
+                 - `total_bytes`: the whole catalog, shared objects counted once;
+                 - `key_pool_bytes`: the key pool shared by all locales ('compact' storage, 0 otherwise);
+                 - `locales`: locale code -> `bytes`, `leaves` (scalars and plural dicts) and
+                   `namespaces` (top-level key -> `bytes`, `leaves`);
+                 - `caches`: cache name (`translators`, `render`, `negotiation`) -> `entries`, `bytes`.
+        :rtype: Dict[str, Any]
+        """
+
+        translations = self._raw_translations
+        total_seen: Set[int] = set()
+        total_bytes = 0
+        key_pool_bytes = 0
+        locales: Dict[str, Dict[str, Any]] = {}
+        for locale_code, data in translations.items():
+            if data is _EVICTED:
+                continue
+            total_bytes += _deep_sizeof(data, total_seen)
+            if isinstance(data, CompactDict) and not key_pool_bytes:
+                key_pool_bytes = data.tree.pool_nbytes()
+
+            namespaces: Dict[str, Dict[str, int]] = {}
+            if isinstance(data, _DICT_TYPES):
+                for key, value in data.items():
+                    namespaces[key] = {
+                        'bytes': _deep_sizeof(value),
+                        'leaves': sum(1 for _ in _iter_leaves(value)),
+                    }
+            locales[locale_code] = {
+                'bytes': _deep_sizeof(data),
+                'leaves': sum(namespace['leaves'] for namespace in namespaces.values()),
+                'namespaces': namespaces,
+            }
+
+        # Data reachable from the caches is already counted above
+        translators = list(self._locale_translators_cache.values())
+        translators_bytes = sum(
+            sys.getsizeof(translator) + sys.getsizeof(vars(translator))
+            + sys.getsizeof(translator._resolution_order) for translator in translators
+        )
+        render_cache = self.render_cache
+        caches = {
+            'translators': {'entries': len(translators), 'bytes': translators_bytes},
+            'render': {
+                'entries': len(render_cache) if render_cache is not None else 0,
+                'bytes': _deep_sizeof(render_cache._data, total_seen) if render_cache is not None else 0,
+            },
+            'negotiation': {
+                'entries': len(self._negotiation_cache),
+                'bytes': _deep_sizeof(self._negotiation_cache._data, total_seen),
+            },
+        }
+
+        return {
+            'total_bytes': total_bytes + key_pool_bytes,
+            'key_pool_bytes': key_pool_bytes,
+            'locales': locales,
+            'caches': caches,
+        }
+
+    def key_paths(self, locale_code: Optional[str] = None) -> List[str]:
+        """
+        Returns the dotted paths of all leaves of a locale, e.g. ['messages.greeting', 'pages.0.title'].
+
+        Leaves are scalars (including explicit nulls) and plural dicts. This is the flattened
+        key set used to diff locales and usage data against each other.
+
+        :param locale_code: The code of the locale. The default locale if None.
+        :type locale_code: Optional[str]
+        :return: The sorted paths, empty if the locale was not loaded.
+        :rtype: List[str]
+        """
+        code = self.canonical_locale_code(locale_code) if locale_code is not None else self.default_locale
+        data = self._raw_translations.get(code)
+        if data is _EVICTED:
+            data = self._load_evicted([code]).get(code)
+        if not isinstance(data, _DICT_TYPES):
+            return []
+        return sorted('.'.join(map(str, path)) for path, _ in _iter_leaves(data))
+
+    def missing_keys(self) -> Dict[str, Dict[str, int]]:
+        """
+        Returns the localizations that were looked up but not found, in non-strict mode.
+
+        Includes chained access on missing values and out-of-range list indices.
+
+        :return: Locale code -> dotted path -> number of misses.
+        :rtype: Dict[str, Dict[str, int]]
+        """
+        return self.miss_reporter.missing_keys()
+
+    def add_observer(self, observer: LookupObserver) -> None:
+        """
+        Registers an observer notified about every lookup and plural render of all translators.
+
+        See `instrumentation.LookupObserver`; `instrumentation.Instrumentation` is a ready-made one.
+
+        :param observer: The observer to add.
+        :type observer: LookupObserver
+        """
+        self._set_observers(self._observers + [observer])
+
+    def remove_observer(self, observer: LookupObserver) -> None:
+        """
+        Unregisters an observer added with `add_observer`.
+
+        :param observer: The observer to remove.
+        :type observer: LookupObserver
+        :raises ValueError: If the observer was not registered.
+        """
+        observers = list(self._observers)
+        observers.remove(observer)
+        self._set_observers(observers)
+
+    def _set_observers(self, observers: List[LookupObserver]) -> None:
+        with self._write_lock:
+            self._observers = observers
+            if not observers:
+                self._observer = None
+            elif len(observers) == 1:
+                self._observer = observers[0]
+            else:
+                self._observer = ObserverGroup(observers)
+            for translator in self._locale_translators_cache.values():
+                translator._observer = self._observer
+
+    def use_locale(self, locale_code: str) -> ContextManager[LocaleTranslator]:
+        """
+        Context manager making the given locale current for the enclosed block.
+
+        Shortcut for `doti18n.use_locale(locale_code, data=self)`.
+
+        :param locale_code: The code of the desired locale.
+        :type locale_code: str
+        :return: A context manager yielding the now current LocaleTranslator.
+        :rtype: ContextManager[LocaleTranslator]
+        """
+        return use_locale(locale_code, self)
+
     def __contains__(self, locale_code: str) -> bool:
         """
         Checks if a locale with the given code was successfully loaded with a dictionary root.
@@ -134,8 +981,8 @@ class LocaleData:
         :rtype: bool
         """
 
-        normalized_locale_code = locale_code.lower()
-        return isinstance(self._raw_translations.get(normalized_locale_code), dict)
+        normalized_locale_code = self.canonical_locale_code(locale_code)
+        return _is_available(self._raw_translations.get(normalized_locale_code))
 
     @property
     def loaded_locales(self) -> List[str]:
@@ -147,7 +994,7 @@ class LocaleData:
         :rtype: List[str]
         """
 
-        return [code for code, data in self._raw_translations.items() if isinstance(data, dict)]
+        return [code for code, data in self._raw_translations.items() if _is_available(data)]
 
     def get(self, locale_code: str, default: Optional[LocaleTranslator] = None) -> Optional[LocaleTranslator]:
         """
@@ -166,8 +1013,13 @@ class LocaleData:
         :rtype: Optional[LocaleTranslator]
         """
 
-        normalized_locale_code = locale_code.lower()
+        normalized_locale_code = self.canonical_locale_code(locale_code)
         if normalized_locale_code in self:
             return self[normalized_locale_code]
         else:
             return default
+
+
+def _is_available(data: Any) -> bool:
+    """Whether a raw data snapshot entry holds a usable locale, resident or evicted."""
+    return isinstance(data, _DICT_TYPES) or data is _EVICTED
@@ -11,7 +11,14 @@ from typing import (
 )
 from .wrapped import *
 from .utils import *
+from .cache import RenderCache
+from .instrumentation import LookupObserver
+from .misses import (
+    MissReporter,
+    _report_miss
+)
 import logging
+import time
 
 
 logger = logging.getLogger(__name__)
@@ -33,6 +40,48 @@ except ImportError:
             return "other"
 
 
+# Babel plural rules per locale code. Babel guards its locale data with a global lock,
+# so rules are resolved once and then read from this dict without any locking.
+_plural_rules: Dict[str, Callable[[Any], str]] = {}
+
+
+def _get_plural_rule(locale_code: str) -> Callable[[Any], str]:
+    """
+    Returns the (cached) CLDR plural rule function for the given locale code.
+
+    :param locale_code: The locale code (e.g., 'en', 'pt-br').
+    :type locale_code: str
+    :return: A callable mapping a number to its plural category.
+    :rtype: Callable[[Any], str]
+    :raises Exception: Whatever Babel raises for an unknown or invalid locale.
+    """
+    rule = _plural_rules.get(locale_code)
+    if rule is None:
+        rule = _plural_rules.setdefault(locale_code, Locale(*_babel_locale_parts(locale_code)).plural_form)
+    return rule
+
+
+def _babel_locale_parts(locale_code: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    Splits a (lowercased) locale code into the (language, territory, script) arguments of Babel's Locale.
+
+    Babel is case-sensitive, e.g. it knows 'pt_BR' and 'zh_Hant' but not 'pt_br' or 'zh_hant'.
+
+    :param locale_code: The locale code (e.g., 'pt-br', 'zh-hant-hk').
+    :type locale_code: str
+    :return: A (language, territory, script) tuple.
+    :rtype: Tuple[str, Optional[str], Optional[str]]
+    """
+    language, *subtags = locale_code.replace('_', '-').split('-')
+    territory = script = None
+    for subtag in subtags:
+        if len(subtag) == 4 and subtag.isalpha() and script is None and territory is None:
+            script = subtag.title()
+        elif (len(subtag) == 2 and subtag.isalpha() or len(subtag) == 3 and subtag.isdigit()) and territory is None:
+            territory = subtag.upper()
+    return language.lower(), territory, script
+
+
 class LocaleTranslator:
     """
     Represents a set of localizations for a specific locale and provides methods
@@ -47,7 +96,13 @@ class LocaleTranslator:
             current_locale_data: Optional[Dict[str, Any]],
             default_locale_data: Optional[Dict[str, Any]],
             default_locale_code: str,
-            strict: bool = False
+            strict: bool = False,
+            render_cache: Optional[RenderCache] = None,
+            fallback_locales: Optional[List[Tuple[str, Optional[Dict[str, Any]]]]] = None,
+            observer: Optional[LookupObserver] = None,
+            miss_reporter: Optional[MissReporter] = None,
+            index: Optional[Dict[Tuple[Union[str, int], ...], Tuple[Any, str]]] = None,
+            plural_templates: Optional[Dict[Tuple[Union[str, int], ...], Dict[str, Any]]] = None
     ):
         """
         Initializes a LocaleTranslator.
@@ -65,21 +120,68 @@ class LocaleTranslator:
         :param strict: If True, accessing a non-existent key will raise AttributeError.
                        If False (default), it returns None and logs a warning.
         :type strict: bool
+        :param render_cache: Optional cache of rendered plural strings, shared between translators.
+        :type render_cache: Optional[RenderCache]
+        :param fallback_locales: Intermediate (locale_code, data) pairs searched, in order, after the
+                                 current locale and before the default one (e.g., 'pt' and 'es' for 'pt-br').
+        :type fallback_locales: Optional[List[Tuple[str, Optional[Dict[str, Any]]]]]
+        :param observer: Optional observer notified about every lookup and plural render
+                         (see `instrumentation.LookupObserver`). Usually managed by LocaleData.
+        :type observer: Optional[LookupObserver]
+        :param miss_reporter: Optional aggregator of misses in non-strict mode, which deduplicates and
+                              rate-limits their warnings. Without one, every miss is logged.
+        :type miss_reporter: Optional[MissReporter]
+        :param index: Optional precomputed lookup of this translator: path tuple -> (value, locale code
+                      it was found in), fallback locales included (see `artifact.build_index`). If
+                      given, lookups are a single dict access instead of traversals of the data.
+        :type index: Optional[Dict[Tuple[Union[str, int], ...], Tuple[Any, str]]]
+        :param plural_templates: The plural dicts of `index`, with their templates resolved along the
+                                 fallback chain. Required with `index`.
+        :type plural_templates: Optional[Dict[Tuple[Union[str, int], ...], Dict[str, Any]]]
         """
         self.locale_code = locale_code
         # Ensure data is treated as a dictionary, default to empty if None or not dict
-        self._current_locale_data = current_locale_data if isinstance(current_locale_data, dict) else {}
-        self._default_locale_data = default_locale_data if isinstance(default_locale_data, dict) else {}
+        self._current_locale_data = current_locale_data if isinstance(current_locale_data, _DICT_TYPES) else {}
+        self._default_locale_data = default_locale_data if isinstance(default_locale_data, _DICT_TYPES) else {}
         self._default_locale_code = default_locale_code
         self._strict = strict
+        self._render_cache = render_cache
+        self._observer = observer
+        self._miss_reporter = miss_reporter
+        self._index = index
+        self._plural_templates = plural_templates
+
+        # Precomputed lookup order: (locale_code, data) pairs, without duplicates or empty data,
+        # so that every extra fallback level costs one traversal at most
+        resolution_order = []
+        seen = set()
+        for code, data in [
+            (locale_code, self._current_locale_data),
+            *(fallback_locales or []),
+            (default_locale_code, self._default_locale_data),
+        ]:
+            if code not in seen and isinstance(data, _DICT_TYPES) and data:
+                seen.add(code)
+                resolution_order.append((code, data))
+        self._resolution_order: Tuple[Tuple[str, Dict[str, Any]], ...] = tuple(resolution_order)
+
+    @property
+    def fallback_chain(self) -> List[str]:
+        """
+        Returns the locale codes searched for keys, in order (the current locale first).
+
+        :return: A list of locale codes, e.g. ['pt-br', 'pt', 'es', 'en'].
+        :rtype: List[str]
+        """
+        return [code for code, _ in self._resolution_order]
 
     def _get_value_by_path(self, path: List[Union[str, int]]) -> Tuple[Any, Optional[str]]:
         """
         Retrieves the value at the given path, checking the current locale first,
-        then the default locale.
+        then the fallback locales and finally the default locale.
 
         Returns the value found and the locale code where it was found.
-        Uses _NOT_FOUND sentinel if the path does not exist in either locale.
+        Uses _NOT_FOUND sentinel if the path does not exist in any of these locales.
 
         :param path: The list of keys/indices representing as a path (e.g., ['messages', 'hi'] or ['page', 0, 'title']).
         :type path: List[Union[str, int]] # Обновить docstring
@@ -88,15 +190,17 @@ class LocaleTranslator:
         :rtype: Tuple[Any, Optional[str]]
         """
 
-        value_from_current = _get_value_by_path_single(path, self._current_locale_data)
-        if value_from_current is not _NOT_FOUND:  # Check against sentinel
-            return value_from_current, self.locale_code
+        index = self._index
+        if index is not None:
+            entry = index.get(tuple(path))
+            return entry if entry is not None else (_NOT_FOUND, None)
 
-        value_from_default = _get_value_by_path_single(path, self._default_locale_data)
-        if value_from_default is not _NOT_FOUND:  # Check against sentinel
-            return value_from_default, self._default_locale_code
+        for locale_code, data in self._resolution_order:
+            value = _get_value_by_path_single(path, data)
+            if value is not _NOT_FOUND:  # Check against sentinel
+                return value, locale_code
 
-        # If sentinel returned from both, the path was not found
+        # If sentinel returned from all of them, the path was not found
         return _NOT_FOUND, None  # Return sentinel and None locale code
 
     def _get_plural_form_key(self, count: int, locale_code: Optional[str]) -> str:
@@ -117,10 +221,7 @@ class LocaleTranslator:
         # (or the translator's current locale code)
         target_locale_code = locale_code if locale_code else self.locale_code
         try:
-            # Babel's Locale expects underscores for territory (e.g., en_US)
-            locale_obj = Locale(target_locale_code.replace('-', '_'))
-            plural_rule_func = locale_obj.plural_form
-            return plural_rule_func(abs(count))
+            return _get_plural_rule(target_locale_code)(abs(count))
         except Exception as e:
             logger.warning(
                 f"Babel failed to get plural rule function or category for count {abs(count)} "
@@ -134,12 +235,14 @@ class LocaleTranslator:
             path: List[str],
             count: int,
             current_plural_dict: Dict[str, Any],
-            current_plural_locale_code: Optional[str]
+            current_plural_locale_code: Optional[str],
+            form_key: Optional[str] = None
     ) -> Optional[str]:
         """
         Retrieves the plural template string based on the count and locale rules.
-        Searches first in the provided plural dictionary, then in the default locale's
-        corresponding plural dictionary. Returns the template string or None.
+        Searches first in the provided plural dictionary, then in the corresponding plural
+        dictionaries of the locales that follow it in the fallback chain (ending with the
+        default locale). Returns the template string or None.
 
         :param path: The full path to the plural dictionary.
         :type path: List[str]
@@ -151,27 +254,32 @@ class LocaleTranslator:
         :param current_plural_locale_code: The locale code where `current_plural_dict` was found.
                                          Used for getting the plural form key.
         :type current_plural_locale_code: Optional[str]
+        :param form_key: The plural category of `count`, if the caller already knows it.
+        :type form_key: Optional[str]
         :return: The template string for the determined plural form, or the 'other' form,
-                 or None if no suitable template is found in either locale.
+                 or None if no suitable template is found in any locale of the chain.
         :rtype: Optional[str]
         """
 
         # TODO: func looks too complex, maybe need to rework
-        form_key = self._get_plural_form_key(count, current_plural_locale_code)
+        if form_key is None:
+            form_key = self._get_plural_form_key(count, current_plural_locale_code)
         template = current_plural_dict.get(form_key)
         if template is None:
             template = current_plural_dict.get('other')
 
         if template is None:
-            default_plural_dict = _get_value_by_path_single(path, self._default_locale_data)
-            if (
-                    default_plural_dict is not None
-                    and isinstance(default_plural_dict, dict)
-                    and _is_plural_dict(default_plural_dict)
-            ):
-                template = default_plural_dict.get(form_key)
-                if template is None:
-                    template = default_plural_dict.get('other')
+            # Continue down the chain after the locale the plural dict was found in
+            codes = [code for code, _ in self._resolution_order]
+            start = codes.index(current_plural_locale_code) + 1 if current_plural_locale_code in codes else 0
+            for _, data in self._resolution_order[start:]:
+                fallback_plural_dict = _get_value_by_path_single(path, data)
+                if _is_plural_dict(fallback_plural_dict):
+                    template = fallback_plural_dict.get(form_key)
+                    if template is None:
+                        template = fallback_plural_dict.get('other')
+                    if template is not None:
+                        break
 
         return template if isinstance(template, str) else None
 
@@ -201,8 +309,17 @@ class LocaleTranslator:
 
         if isinstance(value, str):
             return value
-        elif isinstance(value, dict):
-            if _is_plural_dict(value):
+        elif isinstance(value, _DICT_TYPES):
+            plural_templates = self._plural_templates
+            if plural_templates is not None:
+                # Classified, and its templates resolved along the fallback chain, at compile time
+                resolved = plural_templates.get(tuple(path))
+                if resolved is not None:
+                    value = resolved
+                is_plural = resolved is not None
+            else:
+                is_plural = _is_plural_dict(value)
+            if is_plural:
                 full_path = '.'.join(map(str, path))
                 return PluralWrapper(
                     func=self._create_plural_handler(path, value, found_locale_code),
@@ -211,16 +328,17 @@ class LocaleTranslator:
                 )
             else:
                 return LocaleNamespace(path, self)
-        elif isinstance(value, list):
+        elif isinstance(value, _LIST_TYPES):
             return LocaleList(value, path, self)
         else:
             # value is not str, dict, or list (e.g., int, float, bool, None)
             if value is None:
                 # This branch is reached when _get_value_by_path found a value (None).
-                full_key_path = '.'.join(map(str, path))
-                logger.warning(
-                    f"Locale '{found_locale_code}': key/index path '{full_key_path}' has an explicit None value."
-                )
+                if logger.isEnabledFor(logging.WARNING):
+                    full_key_path = '.'.join(map(str, path))
+                    logger.warning(
+                        f"Locale '{found_locale_code}': key/index path '{full_key_path}' has an explicit None value."
+                    )
             # Always return the raw simple value (int, float, bool, or the explicit None)
             return value
 
@@ -243,16 +361,58 @@ class LocaleTranslator:
                     f"requires an integer count, not {type(count).__name__}"
                 )
 
-            template = self._get_plural_template(
-                path,
-                count,
-                plural_dict,
-                found_locale_code
-            )
+            observer = self._observer
+            if observer is None:
+                return cached_render(count, kwargs, None)[0]
+
+            start = time.perf_counter()
+            # The category and template of the render, known even if it raises
+            resolved: List[Optional[str]] = [None, None]
+            rendered = None
+            try:
+                rendered = cached_render(count, kwargs, resolved)
+                return rendered[0]
+            finally:
+                seconds = time.perf_counter() - start
+                result, category, template = rendered if rendered is not None else (None, *resolved)
+                observer.on_render(self.locale_code, path, category, result, seconds, template, found_locale_code)
+
+        def cached_render(
+                count: int,
+                kwargs: Dict[str, Any],
+                resolved: Optional[List[Optional[str]]]
+        ) -> Tuple[str, str, str]:
+            """Renders through the render cache, if there is one. Returns (result, category, template)."""
+            cache = self._render_cache
+            if cache is None:
+                return render(count, kwargs, resolved)
+
+            key = cache.make_key(self.locale_code, path, count, kwargs)
+            if key is None:
+                return render(count, kwargs, resolved)
+
+            rendered = cache.get(key, _NOT_FOUND)
+            if rendered is _NOT_FOUND:
+                rendered = render(count, kwargs, resolved)
+                cache.put(key, rendered)
+            return rendered
+
+        def render(
+                count: int,
+                kwargs: Dict[str, Any],
+                resolved: Optional[List[Optional[str]]]
+        ) -> Tuple[str, str, str]:
+            """
+            Formats the plural template for `count` without consulting the render cache.
+            Returns (result, category, template); the category and template also go to `resolved`.
+            """
+            form_key = self._get_plural_form_key(count, found_locale_code)
+            template = self._get_plural_template(path, count, plural_dict, found_locale_code, form_key)
+            if resolved is not None:
+                resolved[:] = form_key, template
 
             full_key_path_str = '.'.join(map(str, path))
             if template is None:
-                form_key = self._get_plural_form_key(count, found_locale_code)
                 raise AttributeError(
                     f"Failed to find plural template for key '{full_key_path_str}' "
                     f"(form '{form_key}', count {count}) in locale '{found_locale_code or self.locale_code}' "
@@ -263,15 +423,13 @@ class LocaleTranslator:
             format_args = {'count': abs(count)}
             format_args.update(kwargs)
             try:
-                return template.format(**format_args)
+                return template.format(**format_args), form_key, template
             except KeyError as e:
-                form_key = self._get_plural_form_key(count, found_locale_code)
                 raise ValueError(
                     f"Formatting error for plural key '{full_key_path_str}' (form '{form_key}'): "
                     f"Missing placeholder {e} in template '{template}'"
                 )
             except AttributeError:
-                form_key = self._get_plural_form_key(count, found_locale_code)
                 raise ValueError(
                     f"Error: Template for key '{full_key_path_str}' form '{form_key}' is not a string."
                 )
@@ -298,10 +456,23 @@ class LocaleTranslator:
         # If you have any ideas how to fix this instead of such a crutch - I'm waiting for your pull-requests.
         # Keep the crutch as it was in the original code, though its placement might need review.
         if path and path[0] == "shape":
-            logger.debug("Intercepted 'shape' access.")
             return None
 
-        value, found_locale_code = self._get_value_by_path(path)  # This now returns _NOT_FOUND if not found
+        observer = self._observer
+        if observer is None:
+            value, found_locale_code = self._get_value_by_path(path)  # This now returns _NOT_FOUND if not found
+        else:
+            start = time.perf_counter()
+            value, found_locale_code = self._get_value_by_path(path)
+            seconds = time.perf_counter() - start
+            if value is _NOT_FOUND:
+                observer.on_lookup(self.locale_code, path, None, seconds)
+            else:
+                resolved = self._handle_resolved_value(value, path, found_locale_code)
+                # Namespaces and lists are steps of a dotted access, only the value it ends at is a lookup
+                if not isinstance(resolved, (LocaleNamespace, LocaleList)):
+                    observer.on_lookup(self.locale_code, path, found_locale_code, seconds)
+                return resolved
 
         # Check if the path was *not* found at all using the sentinel
         if value is _NOT_FOUND:
@@ -321,12 +492,20 @@ class LocaleTranslator:
                         f"in translations (including default '{self._default_locale_code}')."
                     )
             else:
-                # Log warning for path not found
-                logger.warning(
-                    f"Locale '{self.locale_code}': key/index path '{full_key_path}' not found "
-                    f"in translations (including default '{self._default_locale_code}'). None will be returned."
+                # Log warning for path not found (once per path, see MissReporter)
+                _report_miss(
+                    self._miss_reporter,
+                    logger,
+                    self.locale_code,
+                    full_key_path,
+                    "Locale '%s': key/index path '%s' not found "
+                    "in translations (including default '%s'). None will be returned.",
+                    self.locale_code,
+                    full_key_path,
+                    self._default_locale_code
                 )
-                return NoneWrapper(self.locale_code, full_key_path)  # return NoneWrapper when not found
+                # return NoneWrapper when not found
+                return NoneWrapper(self.locale_code, full_key_path, self._miss_reporter)
 
         # If value is *not* the sentinel, it means _get_value_by_path found *something*
         return self._handle_resolved_value(value, path, found_locale_code)
@@ -335,8 +514,7 @@ class LocaleTranslator:
         """
         Handles attribute access for the top level (e.g., `data['en'].messages`).
 
-        Delegates the resolution to `_resolve_value_by_path` unless the attribute
-        exists in the object's attributes.
+        Delegates the resolution to `_resolve_value_by_path`.
 
         :param name: The attribute name (the first key in the path).
         :type name: str
@@ -344,20 +522,8 @@ class LocaleTranslator:
                  LocaleList, plural handler, or None.
         :rtype: Any
         """
-        # Note: This check `if name in dir(self):` can sometimes interfere
-        # with introspection or might not be strictly necessary depending
-        # on how _resolve_value_by_path is structured. The current implementation
-        # of _resolve_value_by_path doesn't check `self`'s own attributes;
-        # it goes straight to the data. Let's keep it for now as it was
-        # in the original code, assuming it handles actual LocaleTranslator
-        # attributes correctly.
-        # However, the shape crutch in _resolve_value_by_path implies __getattr__
-        # *does* lead to _resolve_value_by_path for 'shape'. This area might
-        # need more robust handling if other attribute names cause issues.
-        if name in dir(self):
-            # This branch will likely return a method or property of LocaleTranslator itself
-            return object.__getattribute__(self, name)
-
+        # Python only calls __getattr__ after the regular attribute lookup has failed,
+        # so the translator's own attributes and methods never reach this point.
         return self._resolve_value_by_path([name])
 
     def __call__(self, *args, **kwargs) -> Any:
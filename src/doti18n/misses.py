@@ -0,0 +1,144 @@
+# doti18n/misses.py
+
+import logging
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Tuple
+)
+
+
+class MissReporter:
+    """
+    Aggregates missing localizations reported in non-strict mode.
+
+    Every unique (locale, path) miss is counted. Its warning is logged the first time
+    and, if `interval` is set, again at most once per `interval` seconds with the number
+    of misses since the last report. Message arguments are only formatted when a
+    warning is actually logged.
+
+    At most `max_keys` unique misses are tracked, so keys taken from user input can't
+    grow it without bound. Further new misses are only counted in `dropped`.
+
+    Repeated misses that aren't due for a warning are counted without taking the lock,
+    so the counts are approximate under heavy concurrency.
+    """
+
+    def __init__(self, interval: Optional[float] = None, max_keys: int = 1024):
+        """
+        Initializes a MissReporter.
+
+        :param interval: Minimum number of seconds between two warnings for the same miss.
+                         If None (default), each miss is logged only once.
+        :type interval: Optional[float]
+        :param max_keys: The maximum number of unique misses tracked.
+        :type max_keys: int
+        """
+        self.interval = interval
+        self.max_keys = max_keys
+        self.dropped = 0
+        # (locale_code, path) -> [total count, count since the last warning, time of the last warning]
+        self._misses: Dict[Tuple[str, str], list] = {}
+        self._lock = threading.Lock()
+
+    def report(self, log: logging.Logger, locale_code: str, path: str, message: str, *args: Any) -> None:
+        """
+        Records a miss and logs `message % args` as a warning to `log` if it is due.
+
+        :param log: The logger of the reporting module.
+        :type log: logging.Logger
+        :param locale_code: The locale in which the path was looked up.
+        :type locale_code: str
+        :param path: The dotted path that was not found.
+        :type path: str
+        :param message: The warning, in `logging` %-format.
+        :type message: str
+        :param args: The arguments of `message`.
+        :type args: Any
+        """
+        key = (locale_code, path)
+        now = time.monotonic()
+        entry = self._misses.get(key)
+        if entry is not None and (self.interval is None or now - entry[2] < self.interval):
+            # Already logged and not due, the common case: counted without synchronization
+            entry[0] += 1
+            entry[1] += 1
+            return
+        if entry is None and self.dropped and len(self._misses) >= self.max_keys:
+            self.dropped += 1
+            return
+
+        with self._lock:
+            entry = self._misses.get(key)
+            if entry is None:
+                if len(self._misses) >= self.max_keys:
+                    self.dropped += 1
+                    if self.dropped == 1:
+                        log.warning(
+                            "Tracking %d unique missing localizations, further ones are counted but not logged.",
+                            self.max_keys
+                        )
+                    return
+                self._misses[key] = [1, 0, now]
+                since_last = 0
+            else:
+                entry[0] += 1
+                entry[1] += 1
+                if self.interval is None or now - entry[2] < self.interval:
+                    return
+                since_last = entry[1]
+                entry[1] = 0
+                entry[2] = now
+
+        if not log.isEnabledFor(logging.WARNING):
+            return
+        if since_last:
+            log.warning(message + " (%d more times since the last report)", *args, since_last)
+        else:
+            log.warning(message, *args)
+
+    def missing_keys(self) -> Dict[str, Dict[str, int]]:
+        """
+        Returns how often each tracked path was missed.
+
+        :return: Locale code -> dotted path -> number of misses.
+        :rtype: Dict[str, Dict[str, int]]
+        """
+        summary: Dict[str, Dict[str, int]] = {}
+        with self._lock:
+            for (locale_code, path), entry in self._misses.items():
+                summary.setdefault(locale_code, {})[path] = entry[0]
+        return summary
+
+    def clear(self) -> None:
+        """Forgets all misses, so each is logged again the next time it occurs."""
+        with self._lock:
+            self._misses.clear()
+            self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._misses)
+
+
+def _report_miss(
+        reporter: Optional[MissReporter],
+        log: logging.Logger,
+        locale_code: str,
+        path: str,
+        message: str,
+        *args: Any
+) -> None:
+    """Reports a miss to `reporter`, or logs it right away if there is none (standalone translators)."""
+    if reporter is not None:
+        reporter.report(log, locale_code, path, message, *args)
+    elif log.isEnabledFor(logging.WARNING):
+        log.warning(message, *args)
+
+
+__all__ = [
+    "MissReporter",
+    "_report_miss",
+]
@@ -0,0 +1,85 @@
+# doti18n/negotiation.py
+
+from typing import (
+    Collection,
+    List,
+    Optional,
+    Tuple
+)
+
+
+def parse_accept_language(header: str) -> List[Tuple[str, float]]:
+    """
+    Parses an `Accept-Language` header value into language ranges ordered by preference.
+
+    Ranges are normalized to lowercase with '-' separators. Entries with `q=0`,
+    malformed weights and the wildcard `*` are dropped. Parameters other than `q`
+    are ignored. Ranges with equal weights keep their order from the header.
+
+    :param header: The header value (e.g., 'pt-BR,pt;q=0.9,en;q=0.5').
+    :type header: str
+    :return: A list of (language range, weight) tuples, most preferred first.
+    :rtype: List[Tuple[str, float]]
+    """
+
+    ranges = []
+    for item in header.split(','):
+        language, *params = item.split(';')
+        language = language.strip().lower().replace('_', '-')
+        if not language or language == '*':
+            continue
+
+        weight = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() != 'q':
+                continue
+            try:
+                weight = float(value)
+            except ValueError:
+                weight = 0.0
+            break
+        if not 0 < weight <= 1:
+            continue
+        ranges.append((language, weight))
+
+    # sorted() is stable, so equal weights keep the header order
+    return sorted(ranges, key=lambda pair: -pair[1])
+
+
+def match_locale(candidates: List[str], available: Collection[str]) -> Optional[str]:
+    """
+    Picks the best available locale for the given candidates, in their order of preference.
+
+    For each candidate, tries in turn: an exact match ('zh-hant-hk'), the candidate
+    with trailing subtags removed ('zh-hant', then 'zh'), and any available variant
+    of its language ('zh-hans').
+
+    :param candidates: Normalized locale codes, most preferred first.
+    :type candidates: List[str]
+    :param available: Normalized codes of the available locales.
+    :type available: Collection[str]
+    :return: The matched locale code, or None if nothing matches.
+    :rtype: Optional[str]
+    """
+
+    for candidate in candidates:
+        prefix = candidate
+        while prefix:
+            if prefix in available:
+                return prefix
+            prefix = prefix.rpartition('-')[0]
+
+        language = candidate.split('-', 1)[0]
+
+        variants = sorted(code for code in available if code.split('-', 1)[0] == language)
+        if variants:
+            return variants[0]
+
+    return None
+
+
+__all__ = [
+    "match_locale",
+    "parse_accept_language",
+]
@@ -0,0 +1,258 @@
+# doti18n/profile_load.py
+"""
+Startup load profiler.
+
+Parses every locale file of a directory the way LocaleData does and reports, per file,
+the parse time, the YAML loader, the file size, the number of leaves, the maximum
+depth, the number of plural dicts and the memory of the parsed data, followed by the
+files that cost the most. Also measures the import time of the package itself, with
+and without Babel, in fresh interpreters.
+
+Usage:
+
+    python -m doti18n.profile_load locales/ --top 5 --json profile.json
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional
+)
+
+import yaml
+
+from .locale_data import (
+    LocaleData,
+    _YAML_LOADER
+)
+from .utils import (
+    _deep_sizeof,
+    _is_plural_dict,
+    _iter_leaves
+)
+
+
+def profile_file(filepath: str, compare_libyaml: bool = True) -> Dict[str, Any]:
+    """
+    Parses one locale file and measures it.
+
+    :param filepath: The path to the YAML file.
+    :type filepath: str
+    :param compare_libyaml: Also time the parse with libyaml's CSafeLoader, if PyYAML has it
+                            and LocaleData doesn't already use it.
+    :type compare_libyaml: bool
+    :return: A dictionary with `file`, `size` (bytes), `loader`, `parse_seconds`, `leaves`,
+             `max_depth`, `plural_dicts`, `memory_bytes` (of the parsed data), `libyaml_seconds`
+             (None if not measured) and `error` (None, or why the file can't be used).
+    :rtype: Dict[str, Any]
+    """
+    record: Dict[str, Any] = {
+        'file': filepath,
+        'size': os.path.getsize(filepath),
+        'loader': _YAML_LOADER.__name__,
+        'parse_seconds': None,
+        'leaves': 0,
+        'max_depth': 0,
+        'plural_dicts': 0,
+        'memory_bytes': 0,
+        'libyaml_seconds': None,
+        'error': None,
+    }
+    start = time.perf_counter()
+    try:
+        data = LocaleData._parse_locale_file(filepath)
+    except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+        record['error'] = ' '.join(str(e).split())
+        return record
+    record['parse_seconds'] = time.perf_counter() - start
+
+    c_loader = getattr(yaml, 'CSafeLoader', None)
+    if compare_libyaml and c_loader is not None and c_loader is not _YAML_LOADER:
+        start = time.perf_counter()
+        try:
+            with open(filepath, encoding='utf-8') as f:
+                yaml.load(f, Loader=c_loader)
+        except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+            record['error'] = f"libyaml: {' '.join(str(e).split())}"
+            return record
+        record['libyaml_seconds'] = time.perf_counter() - start
+
+    if data is None:
+        record['error'] = "root is not a dictionary"
+        return record
+
+    for path, value in _iter_leaves(data):
+        record['leaves'] += 1
+        record['max_depth'] = max(record['max_depth'], len(path))
+        if _is_plural_dict(value):
+            record['plural_dicts'] += 1
+    record['memory_bytes'] = _deep_sizeof(data)
+    return record
+
+
+def profile_directory(locales_dir: str, compare_libyaml: bool = True) -> List[Dict[str, Any]]:
+    """
+    Profiles every locale file (.yaml/.yml) of a directory, see `profile_file`.
+
+    :param locales_dir: The localization directory.
+    :type locales_dir: str
+    :param compare_libyaml: See `profile_file`.
+    :type compare_libyaml: bool
+    :return: The records of the files, sorted by file name.
+    :rtype: List[Dict[str, Any]]
+    """
+    return [
+        profile_file(os.path.join(locales_dir, filename), compare_libyaml)
+        for filename in sorted(os.listdir(locales_dir))
+        if filename.lower().endswith((".yaml", ".yml"))
+    ]
+
+
+def measure_import_time(with_babel: bool = True, repeat: int = 3) -> Optional[float]:
+    """
+    Measures how long importing this package takes in a fresh interpreter.
+
+    :param with_babel: If False, Babel is made unimportable, as if it wasn't installed.
+    :type with_babel: bool
+    :param repeat: The number of interpreters started; the fastest import is returned.
+    :type repeat: int
+    :return: The import time in seconds, or None if the import failed.
+    :rtype: Optional[float]
+    """
+    code = "\n".join([
+        "import sys, time",
+        f"sys.path[:0] = {sys.path!r}",
+        "" if with_babel else "sys.modules['babel'] = None",
+        "start = time.perf_counter()",
+        f"import {__package__}",
+        "print(time.perf_counter() - start)",
+    ])
+    times = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+        if result.returncode != 0:
+            return None
+        times.append(float(result.stdout.split()[-1]))
+    return min(times)
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def _format_seconds(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    return f"{seconds:.2f} s" if seconds >= 1 else f"{seconds * 1000:.1f} ms"
+
+
+def format_report(records: List[Dict[str, Any]], top: int = 5) -> str:
+    """
+    Formats the result of `profile_directory` as a table, totals and the top offenders.
+
+    :param records: The file records.
+    :type records: List[Dict[str, Any]]
+    :param top: How many offenders are listed by parse time and by memory.
+    :type top: int
+    :return: The report.
+    :rtype: str
+    """
+    header = ('file', 'size', 'loader', 'parse', 'leaves', 'depth', 'plurals', 'memory')
+    rows = [header]
+    for record in records:
+        rows.append((
+            os.path.basename(record['file']), _format_bytes(record['size']), record['loader'],
+            _format_seconds(record['parse_seconds']), str(record['leaves']), str(record['max_depth']),
+            str(record['plural_dicts']), _format_bytes(record['memory_bytes']),
+        ))
+    widths = [max(len(row[column]) for row in rows) for column in range(len(header))]
+    lines = [
+        '  '.join(cell.ljust(width) if column < 3 else cell.rjust(width)
+                  for column, (cell, width) in enumerate(zip(row, widths))).rstrip()
+        for row in rows
+    ]
+
+    for record in records:
+        if record['error']:
+            lines.append(f"{os.path.basename(record['file'])}: not loaded, {record['error']}")
+
+    parsed = [record for record in records if record['parse_seconds'] is not None]
+    total_seconds = sum(record['parse_seconds'] for record in parsed)
+    total_memory = sum(record['memory_bytes'] for record in parsed)
+    lines.append(
+        f"\nTotal: {len(records)} files, {_format_bytes(sum(record['size'] for record in records))} on disk, "
+        f"parsed in {_format_seconds(total_seconds)}, {_format_bytes(total_memory)} in memory"
+    )
+    libyaml = [record['libyaml_seconds'] for record in parsed if record['libyaml_seconds'] is not None]
+    if libyaml and len(libyaml) == len(parsed):
+        lines.append(f"libyaml (CSafeLoader) would parse them in {_format_seconds(sum(libyaml))}")
+
+    for title, key, format_value, total in (
+            ('parse time', 'parse_seconds', _format_seconds, total_seconds),
+            ('memory', 'memory_bytes', _format_bytes, total_memory),
+    ):
+        lines.append(f"\nTop {min(top, len(parsed))} by {title}:")
+        for record in sorted(parsed, key=lambda item: item[key], reverse=True)[:top]:
+            share = record[key] / total if total else 0.0
+            lines.append(f"  {os.path.basename(record['file'])}: {format_value(record[key])} ({share:.0%})")
+    return '\n'.join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog=f"python -m {__name__}",
+        description="Profile the startup cost of a localization directory."
+    )
+    parser.add_argument('locales_dir')
+    parser.add_argument('--top', type=int, default=5, help="offenders listed by parse time and by memory")
+    parser.add_argument('--no-import-time', action='store_true', help="skip measuring the import time")
+    parser.add_argument('--json', metavar='PATH', help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.locales_dir):
+        print(f"Localization directory '{args.locales_dir}' not found.", file=sys.stderr)
+        return 2
+
+    records = profile_directory(args.locales_dir)
+    report: Dict[str, Any] = {'files': records, 'import_seconds': None}
+    if not args.no_import_time:
+        babel_installed = importlib.util.find_spec('babel') is not None
+        report['import_seconds'] = {
+            'with_babel': measure_import_time(with_babel=True) if babel_installed else None,
+            'without_babel': measure_import_time(with_babel=False),
+        }
+        print(
+            f"Import time of {__package__}: {_format_seconds(report['import_seconds']['with_babel'])} with Babel"
+            f"{'' if babel_installed else ' (not installed)'}, "
+            f"{_format_seconds(report['import_seconds']['without_babel'])} without\n"
+        )
+
+    print(format_report(records, args.top))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+__all__ = [
+    "format_report",
+    "measure_import_time",
+    "profile_directory",
+    "profile_file",
+]
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,150 @@
+# doti18n/usage.py
+
+import random
+import threading
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TYPE_CHECKING
+)
+
+from .instrumentation import LookupObserver
+
+if TYPE_CHECKING:
+    from .locale_data import LocaleData
+
+
+class UsageTracker(LookupObserver):
+    """
+    Records which catalog paths are resolved at runtime, to find keys that are never used.
+
+    Only a `sample_rate` fraction of the lookups is recorded, and at most `max_paths`
+    distinct paths are kept (further new ones are counted in `dropped`). Paths are
+    recorded without their locale, in dotted form ('pages.0.title'). Namespaces and
+    lists reached on the way to a value are not lookups, so only leaf paths are recorded.
+
+    The data can be exported as plain JSON-compatible dicts and merged across processes.
+    """
+
+    EXPORT_VERSION = 1
+
+    def __init__(self, sample_rate: float = 1.0, max_paths: int = 100000):
+        """
+        Initializes a UsageTracker.
+
+        :param sample_rate: The fraction of lookups recorded, between 0 and 1.
+        :type sample_rate: float
+        :param max_paths: The maximum number of distinct paths kept.
+        :type max_paths: int
+        :raises ValueError: If `sample_rate` is not between 0 and 1.
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be between 0 and 1, got {sample_rate}.")
+
+        self.sample_rate = sample_rate
+        self.max_paths = max_paths
+        self.dropped = 0
+        # Dotted path -> number of sampled lookups
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._random = random.random
+
+    def on_lookup(self, locale_code, path, found_locale_code, seconds):
+        if found_locale_code is None:
+            return
+        if self.sample_rate < 1.0 and self._random() >= self.sample_rate:
+            return
+        self._add('.'.join(map(str, path)), 1)
+
+    def _add(self, dotted_path: str, count: int) -> None:
+        with self._lock:
+            current = self._counts.get(dotted_path)
+            if current is not None:
+                self._counts[dotted_path] = current + count
+            elif len(self._counts) < self.max_paths:
+                self._counts[dotted_path] = count
+            else:
+                self.dropped += 1
+
+    def used_paths(self) -> Dict[str, int]:
+        """
+        Returns the recorded paths.
+
+        :return: Dotted path -> number of sampled lookups.
+        :rtype: Dict[str, int]
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    def export(self) -> Dict[str, Any]:
+        """
+        Returns the recorded data in a form that can be stored as JSON and passed to `merge`.
+
+        :return: A dictionary with `version`, `sample_rate`, `dropped` and `paths`.
+        :rtype: Dict[str, Any]
+        """
+        with self._lock:
+            return {
+                'version': self.EXPORT_VERSION,
+                'sample_rate': self.sample_rate,
+                'dropped': self.dropped,
+                'paths': dict(self._counts),
+            }
+
+    def merge(self, exported: Dict[str, Any]) -> None:
+        """
+        Adds the data exported by another tracker (e.g. of another worker process).
+
+        :param exported: The result of `export`.
+        :type exported: Dict[str, Any]
+        :raises ValueError: If the data was exported by an incompatible version.
+        """
+        if exported.get('version') != self.EXPORT_VERSION:
+            raise ValueError(f"Unsupported usage data version: {exported.get('version')!r}.")
+        for dotted_path, count in exported['paths'].items():
+            self._add(dotted_path, count)
+        with self._lock:
+            self.dropped += exported.get('dropped', 0)
+
+    @classmethod
+    def from_exports(cls, exports: Iterable[Dict[str, Any]], max_paths: int = 100000) -> 'UsageTracker':
+        """
+        Creates a tracker holding the merged data of several exports.
+
+        :param exports: Results of `export`.
+        :type exports: Iterable[Dict[str, Any]]
+        :param max_paths: The maximum number of distinct paths kept.
+        :type max_paths: int
+        :return: The merged tracker. Its sample rate is 0, it is not meant to record lookups.
+        :rtype: UsageTracker
+        """
+        tracker = cls(sample_rate=0.0, max_paths=max_paths)
+        for exported in exports:
+            tracker.merge(exported)
+        return tracker
+
+    def unused_keys(self, locale_data: 'LocaleData', locale_code: Optional[str] = None) -> List[str]:
+        """
+        Returns the leaf paths of a locale that were never recorded.
+
+        With sampling, rarely used keys may be reported too; collect data long enough
+        (or merge several processes) before pruning.
+
+        :param locale_data: The catalog to diff against.
+        :type locale_data: LocaleData
+        :param locale_code: The locale whose keys are checked. The default locale if None.
+        :type locale_code: Optional[str]
+        :return: The unused dotted leaf paths, sorted.
+        :rtype: List[str]
+        """
+        with self._lock:
+            used = set(self._counts)
+        return [path for path in locale_data.key_paths(locale_code) if path not in used]
+
+
+__all__ = [
+    "UsageTracker",
+]
@@ -1,16 +1,77 @@
 # doti18n/utils.py
 
+import functools
+import sys
 from typing import (
     Any,
+    Iterator,
     List,
     Optional,
     Dict,
+    Set,
+    Tuple,
     Union
 )
 
+from .compact import (
+    CompactDict,
+    CompactList
+)
+
 
 _NOT_FOUND = object()
 
+# Types the raw localization data can be made of: plain containers or compact storage views
+_DICT_TYPES = (dict, CompactDict)
+_LIST_TYPES = (list, CompactList)
+
+# Deprecated ISO 639 language codes and their BCP-47 replacements
+_DEFAULT_LOCALE_ALIASES = {
+    'iw': 'he',
+    'in': 'id',
+    'ji': 'yi',
+    'jw': 'jv',
+    'mo': 'ro',
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_locale_code(locale_code: str) -> str:
+    """
+    Normalizes the spelling of a locale code: trimmed, lowercase, with '-' as the subtag separator.
+
+    BCP-47 tags are case-insensitive, so 'en_US', 'en-us' and 'EN-US' all become 'en-us'.
+
+    :param locale_code: The locale code in any spelling.
+    :type locale_code: str
+    :return: The normalized locale code.
+    :rtype: str
+    """
+
+    return locale_code.strip().replace('_', '-').lower()
+
+
+def _canonical_locale_code(locale_code: str, aliases: Dict[str, str]) -> str:
+    """
+    Normalizes a locale code and resolves its aliases, see `LocaleData.canonical_locale_code`.
+
+    :param locale_code: The locale code in any spelling.
+    :type locale_code: str
+    :param aliases: Normalized alias -> normalized target code.
+    :type aliases: Dict[str, str]
+    :return: The canonical locale code.
+    :rtype: str
+    """
+
+    canonical = _normalize_locale_code(locale_code)
+    alias = aliases.get(canonical)
+    if alias is not None:
+        return alias
+    language, separator, rest = canonical.partition('-')
+    if language in aliases:
+        return aliases[language] + separator + rest
+    return canonical
+
 
 def _is_plural_dict(data: Any) -> bool:
     """
@@ -28,12 +89,137 @@ def _is_plural_dict(data: Any) -> bool:
     """
 
     if not isinstance(data, dict):
-        return False
+        return isinstance(data, CompactDict) and data.is_plural
 
     plural_keys = {'zero', 'one', 'two', 'few', 'many', 'other'}
     return any(key in data and isinstance(data[key], str) for key in plural_keys)
 
 
+def _iter_leaves(
+        data: Any,
+        path: Tuple[Union[str, int], ...] = ()
+) -> Iterator[Tuple[Tuple[Union[str, int], ...], Any]]:
+    """
+    Yields the path and value of every leaf below `data`, depth first.
+
+    Leaves are scalars (including explicit None) and plural dicts, which are translated
+    as one unit. List items get int path segments, empty dicts and lists yield nothing.
+
+    :param data: The data to walk (dicts, lists, their compact views or scalars).
+    :type data: Any
+    :param path: The path of `data` itself.
+    :type path: Tuple[Union[str, int], ...]
+    :return: An iterator of (path, value) pairs.
+    :rtype: Iterator[Tuple[Tuple[Union[str, int], ...], Any]]
+    """
+
+    if isinstance(data, _DICT_TYPES) and not _is_plural_dict(data):
+        for key, value in data.items():
+            yield from _iter_leaves(value, path + (key,))
+    elif isinstance(data, _LIST_TYPES):
+        for index, value in enumerate(data):
+            yield from _iter_leaves(value, path + (index,))
+    else:
+        yield path, data
+
+
+def _deep_sizeof(data: Any, seen: Optional[Set[int]] = None) -> int:
+    """
+    Returns the approximate memory used by `data` and everything it contains.
+
+    Objects already in `seen` (by id) are not counted again, so objects shared between
+    several structures can be counted once by passing the same set.
+
+    :param data: The data to measure.
+    :type data: Any
+    :param seen: The ids of objects already counted. Updated in place.
+    :type seen: Optional[Set[int]]
+    :return: The size in bytes.
+    :rtype: int
+    """
+
+    if seen is None:
+        seen = set()
+
+    total = 0
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif isinstance(obj, (CompactDict, CompactList)):
+            # The view itself is tiny, count the packed data it stands for
+            total += obj.nbytes() - sys.getsizeof(obj)
+    return total
+
+
+class _FrozenDict(dict):
+    """A dict that refuses modification. Used for catalogs frozen by `LocaleData.freeze`."""
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    setdefault = pop = popitem = clear = update = _readonly
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
+class _FrozenList(list):
+    """A list that refuses modification. Used for catalogs frozen by `LocaleData.freeze`."""
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+
+def _freeze(data: Any, memo: Optional[Dict[int, Any]] = None) -> Any:
+    """
+    Returns a deep read-only copy of `data`, with dicts and lists replaced by their frozen variants.
+
+    Frozen containers are still `dict`/`list` instances, so lookups treat them exactly like the originals.
+    Containers shared within `data` (e.g. by interning) stay shared in the copy.
+
+    :param data: The data to freeze.
+    :type data: Any
+    :param memo: id(original container) -> frozen copy, pass the same dict to keep sharing across calls.
+    :type memo: Optional[Dict[int, Any]]
+    :return: The frozen copy (scalars are returned as is).
+    :rtype: Any
+    """
+
+    if not isinstance(data, (dict, list)):
+        return data
+    if memo is None:
+        memo = {}
+    frozen = memo.get(id(data))
+    if frozen is None:
+        if isinstance(data, dict):
+            frozen = _FrozenDict((key, _freeze(value, memo)) for key, value in data.items())
+        else:
+            frozen = _FrozenList(_freeze(value, memo) for value in data)
+        # `data` stays referenced by the caller, so its id can't be reused meanwhile
+        memo[id(data)] = frozen
+    return frozen
+
+
 def _get_value_by_path_single(path: List[Union[str, int]], data: Optional[Dict[str, Any]]) -> Any:
     """
     Helper method to retrieve a value by path only from a given dictionary.
@@ -47,6 +233,9 @@ def _get_value_by_path_single(path: List[Union[str, int]], data: Optional[Dict[s
 
     """
 
+    if isinstance(data, CompactDict):
+        return data.lookup(path, _NOT_FOUND)
+
     if data is None or not isinstance(data, dict):
         # If data is not even a dict, path cannot start from here unless empty path
         return _NOT_FOUND if path else data  # Return data itself if path is empty
@@ -95,7 +284,17 @@ def _get_value_by_path_single(path: List[Union[str, int]], data: Optional[Dict[s
 
 
 __all__ = [
+    "_DEFAULT_LOCALE_ALIASES",
+    "_DICT_TYPES",
+    "_LIST_TYPES",
+    "_canonical_locale_code",
+    "_FrozenDict",
+    "_FrozenList",
+    "_deep_sizeof",
+    "_freeze",
     "_get_value_by_path_single",
     "_is_plural_dict",
+    "_iter_leaves",
+    "_normalize_locale_code",
     "_NOT_FOUND"
 ]
@@ -6,6 +6,8 @@ from typing import (
     TYPE_CHECKING
 )
 
+from ..misses import _report_miss
+
 if TYPE_CHECKING:
     import doti18n
 
@@ -71,9 +73,16 @@ class LocaleList:
                     f"Index {index} out of bounds for list at path '{full_path_str}' (length {len(self._data)})."
                 )
             else:
-                logger.warning(
-                    f"Locale '{self._translator.locale_code}': Index {index} out of bounds "
-                    f"for list at path '{full_path_str}' (length {len(self._data)}). Returning None."
+                _report_miss(
+                    self._translator._miss_reporter,
+                    logger,
+                    self._translator.locale_code,
+                    f"{full_path_str}.{index}",
+                    "Locale '%s': Index %d out of bounds for list at path '%s' (length %d). Returning None.",
+                    self._translator.locale_code,
+                    index,
+                    full_path_str,
+                    len(self._data)
                 )
                 return None
 
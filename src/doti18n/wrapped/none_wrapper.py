@@ -1,39 +1,61 @@
 # doti18n/wrapped/none_wrapper.py
 
 import logging
+from typing import (
+    Optional,
+    TYPE_CHECKING
+)
+
+from ..misses import _report_miss
+
+if TYPE_CHECKING:
+    from ..misses import MissReporter
 
 
 class NoneWrapper:
-    _instances = {}
+    """
+    Returned in non-strict mode in place of a missing localization.
+
+    Instances are cheap and not shared, so no global state grows with the number
+    of distinct missing paths. Compare with `==`, not `is`.
+    """
 
-    def __new__(cls, locale_code: str, path: str):
+    __slots__ = ('_path', '_locale_code', '_reporter')
+
+    def __init__(self, locale_code: str, path: str, reporter: Optional['MissReporter'] = None):
         """
-        Some advanced Singleton
+        :param locale_code: The locale in which the path was looked up.
+        :type locale_code: str
         :param path: Path to the unresolved localization.
         :type path: str
+        :param reporter: The aggregator further misses are reported to, if any.
+        :type reporter: Optional[MissReporter]
         """
-        if path not in cls._instances:
-            cls._instances[path] = super().__new__(cls)
-        return cls._instances[path]
-
-    def __init__(self, locale_code: str, path: str):
         self._path = path
         self._locale_code = locale_code
+        self._reporter = reporter
 
     def __call__(self, *args, **kwargs):
-        logger.warning(f"Localization for {self._path} is not found.")
+        _report_miss(
+            self._reporter, logger, self._locale_code, self._path,
+            "Localization for %s is not found.", self._path
+        )
 
     def __getattr__(self, name: str):
         # Look `FIXME` in LocaleTranslator._resolve_value_by_path
         if self._path == "shape":
-            logger.debug("Intercepted 'shape' access.")
             return None
+        # Protocol probes (copy, pickle, debuggers) are not localization keys
+        if name.startswith('__') and name.endswith('__'):
+            raise AttributeError(name)
 
-        logger.warning(
-            f"Locale '{self._locale_code}': key/index path '{self._path}' not found. "
-            "None will be returned."
+        path = f"{self._path}.{name}"
+        _report_miss(
+            self._reporter, logger, self._locale_code, path,
+            "Locale '%s': key/index path '%s' not found. None will be returned.",
+            self._locale_code, self._path
         )
-        return NoneWrapper(self._locale_code, f"{self._path}.{name}")
+        return NoneWrapper(self._locale_code, path, self._reporter)
 
     def __bool__(self):
         return False
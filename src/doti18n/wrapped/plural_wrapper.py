@@ -4,6 +4,9 @@ import logging
 from typing import Callable
 
 
+logger = logging.getLogger(__name__)
+
+
 class PluralWrapper:
     """
     Just wraps a plural handler function to make it callable.
@@ -13,7 +16,7 @@ class PluralWrapper:
         self.func = func
         self.path = path
         self.strict = strict
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
 
     def __call__(self, *args, **kwargs):
         return self.func(*args, **kwargs)
@@ -0,0 +1,72 @@
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import unittest
+
+from tests import (
+    BaseLocaleTest,
+    TEST_LOCALES_DIR,
+    LocaleData
+)
+
+
+# noinspection PyArgumentEqualDefault
+class TestAsyncLoading(BaseLocaleTest):
+    """Tests for asyncio-native loading and reloading."""
+
+    def test_aload(self):
+        self.create_locale_file('en', {'key': 'value'})
+        self.create_locale_file('ru', {'key': 'значение'})
+
+        async def main():
+            return await LocaleData.aload(TEST_LOCALES_DIR, default_locale='en', render_cache_size=8)
+
+        locales = asyncio.run(main())
+        self.assertIsInstance(locales, LocaleData)
+        self.assertEqual(sorted(locales.loaded_locales), ['en', 'ru'])
+        self.assertEqual(locales['ru'].key, 'значение')
+        self.assertIsNotNone(locales.render_cache)
+
+    def test_aload_does_not_parse_on_loop_thread(self):
+        self.create_locale_file('en', {'key': 'value'})
+        loading_threads = []
+        original = LocaleData._read_all_translations
+
+        def recording_read(data):
+            loading_threads.append(threading.current_thread())
+            return original(data)
+
+        async def main():
+            locales = await LocaleData.aload(TEST_LOCALES_DIR)
+            await locales.areload()
+            return threading.current_thread()
+
+        LocaleData._read_all_translations = recording_read
+        try:
+            loop_thread = asyncio.run(main())
+        finally:
+            LocaleData._read_all_translations = original
+
+        self.assertEqual(len(loading_threads), 2)
+        self.assertNotIn(loop_thread, loading_threads)
+
+    def test_areload(self):
+        self.create_locale_file('en', {'key': 'old'})
+        locales = self.get_locale_data('en')
+        self.assertEqual(locales['en'].key, 'old')
+        self.create_locale_file('en', {'key': 'new'})
+
+        asyncio.run(locales.areload())
+        self.assertEqual(locales['en'].key, 'new')
+
+    def test_import_does_not_load_asyncio(self):
+        code = "import sys, src.doti18n; print('asyncio' in sys.modules)"
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, cwd=project_root)
+        self.assertEqual(result.stdout.strip(), 'False', result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
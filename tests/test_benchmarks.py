@@ -0,0 +1,125 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from tests import LocaleData
+from benchmarks import compare as benchmark_compare
+from benchmarks import run as benchmark_run
+from benchmarks.generator import generate_catalog
+
+
+class TestBenchmarks(unittest.TestCase):
+    """Smoke tests keeping the benchmark suite runnable."""
+
+    def test_generated_catalog_matches_its_description(self):
+        with tempfile.TemporaryDirectory() as locales_dir:
+            info = generate_catalog(locales_dir, locales=3, keys=300, depth=3, plural_density=0.2, coverage=0.5)
+            self.assertEqual(sorted(os.listdir(locales_dir)), ['de.yaml', 'en.yaml', 'ru.yaml'])
+            self.assertEqual(len(info['leaves']) + len(info['list_leaves']) + len(info['plural_leaves']), 300)
+            self.assertTrue(info['list_leaves'] and info['plural_leaves'] and info['fallback_leaves']['ru'])
+
+            data = LocaleData(locales_dir, default_locale='en')
+            self.assertEqual(len(data.key_paths()), 300)
+            ru = data['ru']
+            for path in info['fallback_leaves']['ru']:
+                value = ru
+                for key in path:
+                    value = getattr(value, key)
+                self.assertTrue(value.startswith('en '))
+
+    def test_run(self):
+        report = benchmark_run.run(locales=2, keys=60, repeat=2, lookups=20)
+        json.dumps(report)
+        self.assertEqual(set(report['benchmarks']), set(benchmark_run.BENCHMARKS))
+        for result in report['benchmarks'].values():
+            self.assertEqual(len(result['samples']), 2)
+            self.assertGreater(result['median'], 0)
+
+
+def _report(params=None, **samples):
+    return {
+        'params': dict({'keys': 100, 'storage': 'dict'}, **(params or {})),
+        'benchmarks': {name: {'unit': 'us', 'samples': values} for name, values in samples.items()},
+    }
+
+
+class TestBenchmarkCompare(unittest.TestCase):
+    """The regression gate on top of the benchmark results."""
+
+    def test_summarize(self):
+        summary = benchmark_compare.summarize([1.0, 2.0, 3.0, 4.0, 100.0])
+        self.assertEqual(summary['median'], 3.0)
+        self.assertEqual((summary['q1'], summary['q3'], summary['iqr']), (2.0, 4.0, 2.0))
+        self.assertEqual(benchmark_compare.summarize([5.0])['iqr'], 0.0)
+
+    def test_doubled_cost_is_a_regression(self):
+        baseline = _report(lookup=[10.0, 10.2, 9.9], load=[1.0, 1.0, 1.0])
+        current = _report(lookup=[20.1, 19.8, 20.0], load=[1.05, 1.0, 1.02])
+        rows = {row['name']: row for row in benchmark_compare.compare(baseline, current, threshold=0.1)}
+        self.assertEqual(rows['lookup']['status'], 'regression')
+        self.assertAlmostEqual(rows['lookup']['change'], 1.0, places=2)
+        self.assertEqual(rows['load']['status'], 'ok')
+
+        improved = benchmark_compare.compare(current, baseline)
+        self.assertEqual(improved[0]['status'], 'improvement')
+
+    def test_noise_and_thresholds(self):
+        # 30% slower, but within the spread of the noisy samples
+        baseline = _report(lookup=[6.0, 10.0, 14.0, 10.0, 8.0, 12.0])
+        current = _report(lookup=[13.0, 9.0, 17.0, 12.0, 14.0, 11.0])
+        self.assertEqual(benchmark_compare.compare(baseline, current)[0]['status'], 'ok')
+
+        baseline = _report(lookup=[10.0, 10.0, 10.0])
+        current = _report(lookup=[11.5, 11.5, 11.5])
+        self.assertEqual(benchmark_compare.compare(baseline, current)[0]['status'], 'regression')
+        rows = benchmark_compare.compare(baseline, current, thresholds={'lookup': 0.2})
+        self.assertEqual(rows[0]['status'], 'ok')
+
+    def test_added_and_removed_benchmarks(self):
+        rows = benchmark_compare.compare(_report(old=[1.0]), _report(new=[1.0]))
+        self.assertEqual([(row['name'], row['status']) for row in rows], [('old', 'missing'), ('new', 'new')])
+
+    def test_params_mismatch(self):
+        self.assertEqual(benchmark_compare.params_mismatch(_report(), _report({'repeat': 9})), {})
+        self.assertEqual(
+            benchmark_compare.params_mismatch(_report(), _report({'keys': 200})),
+            {'keys': (100, 200)}
+        )
+
+    def test_main_fails_with_a_readable_diff(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = {}
+            for name, samples in (('baseline', [10.0, 10.0, 10.0]), ('current', [20.0, 20.0, 20.0])):
+                paths[name] = os.path.join(tmp, f'{name}.json')
+                with open(paths[name], 'w', encoding='utf-8') as f:
+                    json.dump(_report(lookup=samples, load=[1.0]), f)
+
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                status = benchmark_compare.main(['--baseline', paths['baseline'], '--current', paths['current']])
+            self.assertEqual(status, 1)
+            self.assertIn('+100.0%', output.getvalue())
+            self.assertIn('REGRESSION', output.getvalue())
+            self.assertIn('1 benchmark(s) regressed: lookup', output.getvalue())
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                status = benchmark_compare.main([
+                    '--baseline', paths['baseline'], '--current', paths['current'], '--threshold', 'lookup=1.5'
+                ])
+            self.assertEqual(status, 0)
+
+    def test_main_without_a_baseline(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'missing.json')
+            errors = io.StringIO()
+            with contextlib.redirect_stderr(errors):
+                self.assertEqual(benchmark_compare.main(['--baseline', path, '--current', path]), 2)
+            self.assertIn(f"Baseline '{path}' not found", errors.getvalue())
+            self.assertIn('--update', errors.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
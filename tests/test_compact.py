@@ -0,0 +1,157 @@
+import gc
+import logging
+import tracemalloc
+import unittest
+
+from tests import (
+    BaseLocaleTest,
+    TEST_LOCALES_DIR,
+    LocaleData
+)
+from src.doti18n.compact import (
+    CompactDict,
+    CompactList,
+    CompactTree
+)
+from src.doti18n.wrapped import (
+    LocaleList,
+    LocaleNamespace,
+    PluralWrapper
+)
+
+
+class TestCompactTree(unittest.TestCase):
+    """Tests for the array-packed tree itself."""
+
+    DATA = {
+        'title': 'Hello',
+        'count': 3,
+        'flag': False,
+        'empty': None,
+        'nested': {'a': {'b': 'deep'}, 'list': ['x', {'y': 'z'}, ['inner']]},
+        'plural': {'one': 'one item', 'other': '{count} items'},
+        'unicode': 'Привет, 世界',
+        'empty_dict': {},
+        'empty_list': [],
+    }
+
+    def test_lookup_mirrors_plain_dicts(self):
+        root = CompactTree(self.DATA).root
+        self.assertEqual(root.lookup(['title']), 'Hello')
+        self.assertEqual(root.lookup(['count']), 3)
+        self.assertIs(root.lookup(['flag']), False)
+        self.assertIsNone(root.lookup(['empty'], 'missing'))
+        self.assertEqual(root.lookup(['nested', 'a', 'b']), 'deep')
+        self.assertEqual(root.lookup(['nested', 'list', 1, 'y']), 'z')
+        self.assertEqual(root.lookup(['nested', 'list', 2, 0]), 'inner')
+        self.assertEqual(root.lookup(['unicode']), 'Привет, 世界')
+
+        for missing_path in (['nope'], ['title', 'x'], ['nested', 'list', 3], ['nested', 'list', 'y'],
+                             ['nested', 0], ['nested', 'list', -1]):
+            self.assertEqual(root.lookup(missing_path, 'missing'), 'missing', missing_path)
+
+    def test_views(self):
+        root = CompactTree(self.DATA).root
+        nested = root['nested']
+        self.assertIsInstance(nested, CompactDict)
+        self.assertIsInstance(nested['list'], CompactList)
+        self.assertEqual(len(nested['list']), 3)
+        self.assertEqual(nested['list'][-1][0], 'inner')
+        self.assertIn('a', nested)
+        self.assertNotIn('b', nested)
+        self.assertEqual(sorted(nested), ['a', 'list'])
+        self.assertEqual(root.to_dict(), self.DATA)
+        self.assertEqual(root, self.DATA)
+        self.assertTrue(root['plural'].is_plural)
+        self.assertFalse(nested.is_plural)
+        with self.assertRaises(KeyError):
+            root['nope']
+
+    def test_shared_key_pool(self):
+        en = CompactTree({'greeting': 'Hello'})
+        ru = CompactTree({'greeting': 'Привет'}, en._pool)
+        self.assertEqual(len(ru._pool), 1)
+        self.assertEqual(ru.root['greeting'], 'Привет')
+
+
+# noinspection PyArgumentEqualDefault
+class TestCompactStorage(BaseLocaleTest):
+    """Tests for LocaleData with storage='compact'."""
+
+    def setUp(self):
+        self.create_locale_file('en', {
+            'messages': {'greeting': 'Hello', 'farewell': 'Bye', 'nothing': None},
+            'pages': [{'title': 'Home', 'content': 'Welcome'}, {'title': 'About', 'content': 'Us'}],
+            'apples': {'one': '{count} apple', 'other': '{count} apples'},
+        })
+        self.create_locale_file('ru', {
+            'messages': {'greeting': 'Привет'},
+            'pages': [{'title': 'Главная'}],
+            'apples': {'one': '{count} яблоко', 'few': '{count} яблока', 'many': '{count} яблок'},
+        })
+
+    def test_invalid_storage(self):
+        with self.assertRaises(ValueError):
+            LocaleData(TEST_LOCALES_DIR, storage='sqlite')
+
+    def test_lookups_match_dict_storage(self):
+        plain = LocaleData(TEST_LOCALES_DIR, default_locale='en')
+        compact = LocaleData(TEST_LOCALES_DIR, default_locale='en', storage='compact')
+        self.assertIsInstance(compact._raw_translations['en'], CompactDict)
+        self.assertEqual(sorted(compact.loaded_locales), sorted(plain.loaded_locales))
+
+        for locales in (plain, compact):
+            ru = locales['ru']
+            self.assertIsInstance(ru.messages, LocaleNamespace)
+            self.assertEqual(ru.messages.greeting, 'Привет')
+            self.assertEqual(ru.messages.farewell, 'Bye')
+            self.assertIsNone(ru.messages.nothing)
+            self.assertIsInstance(ru.pages, LocaleList)
+            self.assertEqual(len(ru.pages), 1)
+            self.assertEqual(ru.pages[0].title, 'Главная')
+            self.assertEqual(ru.pages[0].content, 'Welcome')
+            self.assertIsInstance(ru.apples, PluralWrapper)
+            self.assertEqual(ru.apples(3), '3 яблока')
+            self.assertEqual(ru.apples(100), '100 яблок')
+            self.assertEqual(locales['en'].apples(1), '1 apple')
+            self.assertEqual(ru.messages.missing, None)
+
+    def test_strict_errors(self):
+        compact = LocaleData(TEST_LOCALES_DIR, default_locale='en', strict=True, storage='compact')
+        with self.assertRaises(AttributeError):
+            compact['ru'].messages.missing
+        with self.assertRaises(IndexError):
+            compact['en'].pages[5]
+
+
+# noinspection PyArgumentEqualDefault
+class TestCompactMemory(BaseLocaleTest):
+    """Memory comparison between the storage backends."""
+
+    def test_compact_uses_less_memory(self):
+        for locale in ('en', 'ru', 'de', 'fr', 'es'):
+            data = {}
+            for key in range(3000):
+                data.setdefault(f'namespace_{key % 30}', {})[f'some_key_{key}'] = f'{locale} text {key}'
+            self.create_locale_file(locale, data)
+
+        logging.disable(logging.INFO)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+        def measure(storage):
+            gc.collect()
+            tracemalloc.start()
+            try:
+                locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', storage=storage)
+                gc.collect()
+                size = tracemalloc.get_traced_memory()[0]
+            finally:
+                tracemalloc.stop()
+            self.assertEqual(locales['ru'].namespace_7.some_key_7, 'ru text 7')
+            return size
+
+        self.assertLess(measure('compact') * 2, measure('dict'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,207 @@
+import contextlib
+import io
+import logging
+import os
+import pickle
+import tempfile
+
+from tests import (
+    BaseLocaleTest,
+    TEST_LOCALES_DIR,
+    LOGGER_LOCALE_DATA,
+    LocaleData
+)
+from src.doti18n import LocaleTranslator
+from src.doti18n.artifact import (
+    ARTIFACT_MAGIC,
+    ARTIFACT_VERSION,
+    _iter_nodes,
+    compile_catalog,
+    read_artifact,
+    write_artifact
+)
+from src.doti18n.cli import main
+
+
+def _render(plural_wrapper, count):
+    try:
+        return plural_wrapper(count)
+    except Exception as e:
+        return type(e), str(e)
+
+
+# noinspection PyArgumentEqualDefault
+class TestCompile(BaseLocaleTest):
+    """Tests for compiled catalog artifacts."""
+
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        self.create_locale_file('en', {
+            'messages': {'greeting': 'Hello', 'farewell': 'Bye', 'nothing': None, 'count': 3},
+            'pages': [{'title': 'Home', 'desc': 'Start'}, {'title': 'About', 'desc': 'Us'}],
+            'apples': {'one': '{count} apple', 'other': '{count} apples'},
+            'notes': {'one': '{count} note', 'other': '{count} notes'},
+            'conflict': {'nested': 'from en'},
+        })
+        self.create_locale_file('pt', {
+            'messages': {'greeting': 'Olá'},
+            'apples': {'one': '{count} maçã', 'other': '{count} maçãs'},
+        })
+        self.create_locale_file('pt-br', {
+            'messages': {'farewell': 'Tchau'},
+            'pages': [{'title': 'Início'}],
+        })
+        self.create_locale_file('ru', {
+            'messages': {'greeting': 'Привет'},
+            # No 'few' and 'many': resolved through 'other'
+            'apples': {'one': '{count} яблоко', 'other': '{count} яблок'},
+            # No 'other' either: falls back to the default locale's dict
+            'notes': {'one': '{count} заметка'},
+            'conflict': 'scalar in ru',
+        })
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.artifact_path = os.path.join(self.tmp.name, 'catalog.bin')
+        write_artifact(compile_catalog(TEST_LOCALES_DIR, 'en'), self.artifact_path)
+
+    def assertSameLookups(self, source: LocaleData, compiled: LocaleData, locale_code: str):
+        """Every reachable path resolves, renders and misses the same in both catalogs."""
+        expected, actual = source[locale_code], compiled[locale_code]
+        paths = {path for data in source._raw_translations.values() for path, _ in _iter_nodes(data)}
+        paths |= {path + ('missing',) for path in list(paths)} | {('missing',), ('pages', 5)}
+        for path in sorted(paths, key=lambda item: tuple(map(str, item))):
+            path = list(path)
+            self.assertEqual(actual._get_value_by_path(path), expected._get_value_by_path(path), path)
+            expected_value = expected._resolve_value_by_path(path)
+            actual_value = actual._resolve_value_by_path(path)
+            self.assertEqual(type(actual_value), type(expected_value), path)
+            if callable(expected_value) and type(expected_value).__name__ == 'PluralWrapper':
+                for count in (0, 1, 2, 5, 21):
+                    self.assertEqual(_render(actual_value, count), _render(expected_value, count), (path, count))
+            elif not hasattr(expected_value, '_path'):
+                self.assertEqual(actual_value, expected_value, path)
+
+    def test_artifact_content(self):
+        artifact = read_artifact(self.artifact_path)
+        self.assertEqual(artifact['version'], ARTIFACT_VERSION)
+        self.assertEqual(artifact['default_locale'], 'en')
+        self.assertEqual(sorted(artifact['indexes']), ['en', 'pt', 'pt-br', 'ru'])
+        self.assertIsNotNone(artifact['intern_stats'])
+
+        index, plural_templates = artifact['indexes']['pt-br']
+        self.assertEqual(index[('messages', 'farewell')], ('Tchau', 'pt-br'))
+        self.assertEqual(index[('messages', 'greeting')], ('Olá', 'pt'))
+        self.assertEqual(index[('pages', 0, 'desc')], ('Start', 'en'))
+        self.assertEqual(set(plural_templates), {('apples',), ('notes',)})
+
+        _, plural_templates = artifact['indexes']['ru']
+        self.assertEqual(plural_templates[('notes',)]['other'], '{count} notes')
+        # Complete plural dicts are shared, not copied
+        _, en_plural_templates = artifact['indexes']['en']
+        self.assertIs(en_plural_templates[('apples',)], artifact['translations']['en']['apples'])
+
+    def test_compiled_catalog_matches_source(self):
+        source = LocaleData(TEST_LOCALES_DIR, 'en')
+        compiled = LocaleData(self.artifact_path, 'en', compiled=True)
+        self.assertEqual(sorted(compiled.loaded_locales), sorted(source.loaded_locales))
+        self.assertEqual(compiled.fallback_chain('pt-BR'), ['pt-br', 'pt', 'en'])
+        for locale_code in ('en', 'pt', 'pt-br', 'ru'):
+            with self.subTest(locale_code=locale_code):
+                self.assertIsNotNone(compiled[locale_code]._index)
+                self.assertSameLookups(source, compiled, locale_code)
+
+        self.assertEqual(compiled['ru'].notes(5), '5 notes')
+        self.assertEqual(compiled['ru'].conflict, 'scalar in ru')
+        self.assertEqual(compiled['pt-br'].pages[0].desc, 'Start')
+
+    def test_strict_misses(self):
+        compiled = LocaleData(self.artifact_path, 'en', compiled=True, strict=True)
+        self.assertRaisesAttributeError("'messages.unknown' not found", lambda: compiled['ru'].messages.unknown)
+        self.assertRaisesIndexError("Index 7 out of bounds", lambda: compiled['ru'].pages[7])
+
+    def test_index_ignored_for_other_settings(self):
+        logging.disable(logging.NOTSET)
+        with self.assertLogsFor(LOGGER_LOCALE_DATA, 'WARNING') as cm:
+            compiled = LocaleData(self.artifact_path, 'ru', compiled=True)
+        self.assertIn("its precomputed indexes are not used", '\n'.join(cm.output))
+        self.assertIsNone(compiled['pt']._index)
+        self.assertSameLookups(LocaleData(TEST_LOCALES_DIR, 'ru'), compiled, 'pt')
+
+        compiled = LocaleData(self.artifact_path, 'en', compiled=True, storage='compact')
+        self.assertIsNone(compiled['ru']._index)
+        self.assertEqual(compiled['ru'].notes(1), '1 заметка')
+
+    def test_freeze_and_reload(self):
+        compiled = LocaleData(self.artifact_path, 'en', compiled=True)
+        compiled.freeze()
+        translator = compiled['pt-br']
+        self.assertIsNotNone(translator._index)
+        self.assertIs(translator._index[('pages',)][0], compiled._raw_translations['pt-br']['pages'])
+        self.assertEqual(translator.pages[0].title, 'Início')
+
+        write_artifact(compile_catalog(TEST_LOCALES_DIR, 'en', fallback_chains={'ru': ['pt']}), self.artifact_path)
+        compiled = LocaleData(self.artifact_path, 'en', compiled=True, fallback_chains={'ru': ['pt']})
+        self.assertEqual(compiled['ru'].messages.farewell, 'Bye')
+        self.assertEqual(compiled['ru'].apples(5), '5 яблок')
+        compiled.reload()
+        self.assertIsNotNone(compiled['ru']._index)
+
+    def test_invalid_artifact(self):
+        bogus = os.path.join(self.tmp.name, 'bogus.bin')
+        with open(bogus, 'wb') as f:
+            f.write(b'messages: {}\n')
+        with self.assertRaises(ValueError):
+            read_artifact(bogus)
+
+        logging.disable(logging.NOTSET)
+        with self.assertLogsFor(LOGGER_LOCALE_DATA, 'ERROR') as cm:
+            locales = LocaleData(bogus, 'en', compiled=True)
+        self.assertIn("is not a compiled doti18n catalog", '\n'.join(cm.output))
+        self.assertEqual(locales.loaded_locales, [])
+
+    def test_corrupted_artifact(self):
+        path = os.path.join(self.tmp.name, 'corrupted.bin')
+        with open(self.artifact_path, 'rb') as f:
+            truncated = f.read()[:100]
+        for content in (
+                truncated,  # EOFError or UnpicklingError
+                ARTIFACT_MAGIC + pickle.dumps(['not', 'a', 'dict']),
+                ARTIFACT_MAGIC + pickle.dumps({'version': ARTIFACT_VERSION}),
+        ):
+            with self.subTest(content=content[:40]):
+                with open(path, 'wb') as f:
+                    f.write(content)
+                with self.assertRaises(Exception):
+                    read_artifact(path)
+                logging.disable(logging.NOTSET)
+                with self.assertLogsFor(LOGGER_LOCALE_DATA, 'ERROR'):
+                    locales = LocaleData(path, 'en', compiled=True)
+                self.assertEqual(locales.loaded_locales, [])
+
+    def test_artifact_is_only_loaded_when_asked_for(self):
+        logging.disable(logging.NOTSET)
+        with self.assertLogsFor(LOGGER_LOCALE_DATA, 'ERROR') as cm:
+            locales = LocaleData(self.artifact_path, 'en')
+        self.assertIn("Pass compiled=True", '\n'.join(cm.output))
+        self.assertEqual(locales.loaded_locales, [])
+
+    def test_standalone_translator_with_index(self):
+        data = {'a': {'b': 'c'}}
+        translator = LocaleTranslator('en', data, data, 'en', index={('a',): (data['a'], 'en')}, plural_templates={})
+        self.assertEqual(type(translator.a).__name__, 'LocaleNamespace')
+        self.assertEqual(type(translator.a.b).__name__, 'NoneWrapper')  # Only what the index holds
+
+    def test_cli(self):
+        output_path = os.path.join(self.tmp.name, 'cli.bin')
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            status = main([
+                'compile', TEST_LOCALES_DIR, '-o', output_path, '--default-locale', 'en', '--fallback', 'ru=pt'
+            ])
+        self.assertEqual(status, 0)
+        self.assertIn("Compiled 4 locales (en, pt, pt-br, ru)", output.getvalue())
+        self.assertEqual(read_artifact(output_path)['fallback_chains'], {'ru': ['pt']})
+
+        with contextlib.redirect_stderr(io.StringIO()):
+            status = main(['compile', os.path.join(self.tmp.name, 'missing'), '-o', output_path])
+        self.assertEqual(status, 1)
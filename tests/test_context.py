@@ -0,0 +1,78 @@
+import asyncio
+import unittest
+
+from tests import (
+    BaseLocaleTest,
+    LocaleTranslator
+)
+from src.doti18n import (
+    current_translator,
+    reset_locale,
+    set_locale,
+    set_locale_data,
+    t,
+    use_locale
+)
+
+
+# noinspection PyArgumentEqualDefault
+class TestCurrentLocale(BaseLocaleTest):
+    """Tests for the contextvars-backed current translator API."""
+
+    def setUp(self):
+        self.create_locale_file('en', {'greeting': 'Hello', 'apples': {'one': '{count} apple', 'other': '{count} apples'}})
+        self.create_locale_file('ru', {'greeting': 'Привет'})
+        self.locales = self.get_locale_data('en')
+        self.addCleanup(set_locale_data, None)
+
+    def test_use_locale_with_explicit_data(self):
+        self.assertIsNone(current_translator())
+        with use_locale('ru', self.locales) as translator:
+            self.assertIsInstance(translator, LocaleTranslator)
+            self.assertIs(current_translator(), self.locales['ru'])
+            self.assertEqual(t.greeting, 'Привет')
+            self.assertEqual(t.apples(2), '2 apples')  # Fallback still applies
+        self.assertIsNone(current_translator())
+
+    def test_use_locale_with_default_data(self):
+        set_locale_data(self.locales)
+        with use_locale('ru'):
+            self.assertEqual(t.greeting, 'Привет')
+
+    def test_locale_data_use_locale(self):
+        with self.locales.use_locale('EN'):
+            self.assertEqual(t.greeting, 'Hello')
+
+    def test_nesting_restores_previous(self):
+        with use_locale('en', self.locales):
+            with use_locale(self.locales['ru']):
+                self.assertEqual(t.greeting, 'Привет')
+            self.assertEqual(t.greeting, 'Hello')
+
+    def test_set_and_reset(self):
+        token = set_locale('ru', self.locales)
+        self.assertEqual(t.greeting, 'Привет')
+        reset_locale(token)
+        self.assertIsNone(current_translator())
+
+    def test_no_active_locale(self):
+        with self.assertRaises(LookupError):
+            t.greeting
+        with self.assertRaises(LookupError):
+            with use_locale('ru'):  # No LocaleData to resolve the code with
+                pass
+
+    def test_isolated_between_tasks(self):
+        async def handler(locale):
+            with use_locale(locale, self.locales):
+                await asyncio.sleep(0)
+                return t.greeting
+
+        async def main():
+            return await asyncio.gather(handler('en'), handler('ru'), handler('en'))
+
+        self.assertEqual(asyncio.run(main()), ['Hello', 'Привет', 'Hello'])
+
+
+if __name__ == '__main__':
+    unittest.main()
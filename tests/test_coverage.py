@@ -0,0 +1,112 @@
+import contextlib
+import io
+import json
+import unittest
+
+from tests import (
+    BaseLocaleTest,
+    TEST_LOCALES_DIR
+)
+from src.doti18n import LocaleData
+from src.doti18n.cli import main
+from src.doti18n.coverage import CoverageMatrix
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+EN = {
+    'messages': {'greeting': 'Hello', 'farewell': 'Bye', 'title': 'Title'},
+    'apples': {'one': '{count} apple', 'other': '{count} apples'},
+    'settings': {'theme': 'Theme', 'language': 'Language'},
+}
+DE = {
+    'messages': {'greeting': 'Hallo', 'title': 'Title'},
+    'apples': {'one': '{count} apple', 'other': '{count} apples'},
+    'settings': {'theme': 'Thema'},
+    'extra': {'unused': 'Extra'},
+}
+
+
+@unittest.skipUnless(numpy, "NumPy is not installed")
+class TestCoverageMatrix(BaseLocaleTest):
+    """Tests for the locale coverage matrix."""
+
+    def setUp(self):
+        self.matrix = CoverageMatrix({'de': DE, 'en': EN, 'broken': None}, 'en')
+
+    def test_key_universe(self):
+        self.assertEqual(self.matrix.locales, ['en', 'de'])
+        self.assertEqual(self.matrix.keys, [
+            'apples', 'extra.unused', 'messages.farewell', 'messages.greeting', 'messages.title',
+            'settings.language', 'settings.theme',
+        ])
+        self.assertEqual(self.matrix.namespaces, ['apples', 'extra', 'messages', 'settings'])
+        self.assertEqual(self.matrix.translated.shape, (7, 2))
+        row = self.matrix.key_index['messages.farewell']
+        self.assertEqual(self.matrix.translated[row].tolist(), [True, False])
+
+    def test_completeness(self):
+        completeness = self.matrix.completeness()
+        self.assertEqual(completeness['en'], 1.0)
+        # The extra key doesn't count
+        self.assertAlmostEqual(completeness['de'], 4 / 6)
+
+    def test_empty_default_locale(self):
+        matrix = CoverageMatrix({'en': {}, 'fr': {'only': 'fr'}}, 'en')
+        self.assertEqual(matrix.completeness(), {'en': 1.0, 'fr': 1.0})
+        self.assertEqual(matrix.summary()['fr']['missing'], 0)
+        self.assertEqual(matrix.summary()['fr']['extra'], 1)
+        self.assertEqual(CoverageMatrix({'en': {}, 'fr': {}}, 'en').completeness(), {'en': 1.0, 'fr': 1.0})
+
+    def test_fallback_rates(self):
+        rates = self.matrix.fallback_rates()
+        self.assertEqual(rates['en'], {'apples': 0.0, 'messages': 0.0, 'settings': 0.0})
+        self.assertEqual(rates['de'], {'apples': 0.0, 'messages': 1 / 3, 'settings': 0.5})
+
+    def test_identical_to_default(self):
+        # The untranslated title and the copied plural dict
+        self.assertEqual(self.matrix.identical_to_default(), {'en': 0, 'de': 2})
+        identical = [key for key, row in zip(self.matrix.keys, self.matrix.identical) if row[1]]
+        self.assertEqual(identical, ['apples', 'messages.title'])
+
+    def test_summary(self):
+        summary = self.matrix.summary()
+        self.assertEqual(
+            {key: summary['de'][key] for key in ('translated', 'missing', 'extra', 'identical')},
+            {'translated': 5, 'missing': 2, 'extra': 1, 'identical': 2}
+        )
+        json.dumps(summary)
+
+    def test_values_are_compared_by_type(self):
+        matrix = CoverageMatrix({'en': {'a': 1, 'b': 'x', 'c': None}, 'de': {'a': '1', 'b': 'x', 'c': None}}, 'en')
+        self.assertEqual(matrix.identical_to_default()['de'], 2)
+
+    def test_from_locale_data(self):
+        self.create_locale_file('en', EN)
+        self.create_locale_file('de', DE)
+        data = LocaleData(TEST_LOCALES_DIR, 'en')
+        matrix = CoverageMatrix.from_locale_data(data)
+        self.assertEqual(matrix.summary(), self.matrix.summary())
+        # The key universe is the union of the flattened key sets
+        self.assertEqual(sorted(matrix.keys), sorted(set(data.key_paths('en')) | set(data.key_paths('de'))))
+
+    def test_cli(self):
+        self.create_locale_file('en', EN)
+        self.create_locale_file('de', DE)
+        with contextlib.redirect_stdout(io.StringIO()) as output, contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(main(['coverage', TEST_LOCALES_DIR]), 0)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(lines[0].split()[:3], ['locale', 'translated', 'missing'])
+        self.assertEqual(lines[2].split(), ['de', '5', '2', '1', '66.7%', '2', 'settings', '50%,', 'messages', '33%'])
+
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(main(['coverage', TEST_LOCALES_DIR, '--json']), 0)
+        report = json.loads(output.getvalue())
+        self.assertEqual(report['keys'], 7)
+        self.assertEqual(report['locales']['de']['fallback_rates']['settings'], 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+import gc
+import logging
+import os
+
+from tests import (
+    BaseLocaleTest,
+    TEST_LOCALES_DIR,
+    LocaleData
+)
+from src.doti18n.locale_data import _EVICTED
+
+
+# noinspection PyArgumentEqualDefault
+class TestEviction(BaseLocaleTest):
+    """Tests for evicting idle locales (max_resident_locales / max_resident_bytes)."""
+
+    LOCALES = {
+        'en': 'Hello',
+        'en-gb': 'Hello, mate',
+        'de': 'Hallo',
+        'fr': 'Bonjour',
+        'es': 'Hola',
+        'pt': 'Olá',
+    }
+
+    def setUp(self):
+        logging.disable(logging.INFO)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        for locale, greeting in self.LOCALES.items():
+            self.create_locale_file(locale, {'greeting': greeting, 'only_en': 'English'} if locale == 'en' else
+                                    {'greeting': greeting})
+
+    def resident(self, locales):
+        return sorted(code for code, data in locales._raw_translations.items() if isinstance(data, dict))
+
+    def test_disabled_by_default(self):
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en')
+        for locale in self.LOCALES:
+            locales[locale]
+        self.assertEqual(len(self.resident(locales)), len(self.LOCALES))
+        self.assertEqual(locales.translator_cache_info()['evictions'], 0)
+
+    def test_count_limit_and_transparent_reload(self):
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', max_resident_locales=2)
+        self.assertEqual(len(self.resident(locales)), 2)
+        self.assertIn('en', self.resident(locales))
+        # Evicted locales are still known
+        self.assertEqual(sorted(locales.loaded_locales), sorted(self.LOCALES))
+        self.assertIn('fr', locales)
+
+        for locale, greeting in self.LOCALES.items():
+            self.assertEqual(locales[locale].greeting, greeting)
+            self.assertEqual(locales[locale].only_en, 'English')
+            self.assertLessEqual(len(self.resident(locales)), 2)
+            self.assertIn(locale, self.resident(locales))
+        self.assertGreater(locales.translator_cache_info()['evictions'], 0)
+
+    def test_least_recently_used_is_evicted(self):
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', max_resident_locales=3)
+        locales['de']
+        locales['fr']
+        locales['de']
+        locales['es']
+        self.assertEqual(self.resident(locales), ['de', 'en', 'es'])
+
+    def test_default_locale_and_its_chain_are_pinned(self):
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en-GB', max_resident_locales=1)
+        for locale in self.LOCALES:
+            locales[locale]
+        self.assertEqual(self.resident(locales), ['en', 'en-gb', 'pt'])
+        self.assertEqual(locales['de'].greeting, 'Hallo')
+
+    def test_fallback_chain_is_reloaded(self):
+        self.create_locale_file('pt-br', {'other': 'Outro'})
+        self.addCleanup(os.remove, os.path.join(TEST_LOCALES_DIR, 'pt-br.yaml'))
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', max_resident_locales=2)
+        locales['pt']
+        locales['de']
+        self.assertNotIn('pt', self.resident(locales))
+
+        self.assertEqual(locales['pt-br'].greeting, 'Olá')
+        self.assertEqual(locales['pt-br'].other, 'Outro')
+        self.assertEqual(locales.fallback_chain('pt-br'), ['pt-br', 'pt', 'en'])
+
+    def test_fallback_evicted_while_building_is_loaded(self):
+        os.remove(os.path.join(TEST_LOCALES_DIR, 'pt.yaml'))
+        self.create_locale_file('pt-br', {'other': 'Outro'})
+        self.addCleanup(os.remove, os.path.join(TEST_LOCALES_DIR, 'pt-br.yaml'))
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', max_resident_locales=2)
+        locales['de']
+        locales['fr']
+        load_evicted = locales._load_evicted
+
+        def reload_and_evict(locale_codes):
+            # Before the chain is loaded, a reload adds the fallback 'pt' and an eviction drops it again
+            locales._load_evicted = load_evicted
+            self.create_locale_file('pt', {'greeting': 'Olá'})
+            locales.reload()
+            locales._evict_idle()
+            self.assertNotIn('pt', self.resident(locales))
+            return load_evicted(locale_codes)
+
+        locales._load_evicted = reload_and_evict
+        self.assertEqual(locales['pt-br'].greeting, 'Olá')
+        self.assertEqual(locales['pt-br'].fallback_chain, ['pt-br', 'pt', 'en'])
+
+    def test_fallback_chain_stays_resident(self):
+        self.create_locale_file('pt-br', {'other': 'Outro'})
+        self.addCleanup(os.remove, os.path.join(TEST_LOCALES_DIR, 'pt-br.yaml'))
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', max_resident_locales=2)
+        locales['pt-br']
+        evictions = locales.translator_cache_info()['evictions']
+        translator = locales['pt-br']
+        for _ in range(5):
+            self.assertIs(locales['pt-br'], translator)
+            self.assertEqual(locales['pt-br'].greeting, 'Olá')
+        self.assertEqual(locales.translator_cache_info()['evictions'], evictions)
+        self.assertEqual(self.resident(locales), ['en', 'pt', 'pt-br'])
+
+    def test_oversized_fallback_chain_is_warned_about_once(self):
+        self.create_locale_file('pt-br', {'other': 'Outro'})
+        self.addCleanup(os.remove, os.path.join(TEST_LOCALES_DIR, 'pt-br.yaml'))
+        logging.disable(logging.NOTSET)
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', max_resident_locales=2)
+        with self.assertLogs('src.doti18n.locale_data', level='WARNING') as logs:
+            for _ in range(3):
+                locales['pt-br']
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("fallback chain of 'pt-br'", logs.output[0])
+
+    def test_freeze_keeps_the_frozen_locales(self):
+        self.create_locale_file('pt-br', {'other': 'Outro'})
+        self.addCleanup(os.remove, os.path.join(TEST_LOCALES_DIR, 'pt-br.yaml'))
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', max_resident_locales=3)
+        locales['pt-br']
+        locales['pt-br']  # Used after its fallback 'pt', which goes first
+        locales['de']
+        self.assertEqual(self.resident(locales), ['de', 'en', 'pt-br'])
+        evictions = locales.translator_cache_info()['evictions']
+
+        if hasattr(gc, 'unfreeze'):
+            self.addCleanup(gc.unfreeze)
+        locales.freeze()
+        # Building 'pt-br' would reload 'pt' unfrozen and evict a frozen locale
+        self.assertEqual(sorted(locales._locale_translators_cache), ['de', 'en'])
+        self.assertEqual(locales.translator_cache_info()['evictions'], evictions)
+        self.assertEqual(sorted(code for code, data in locales._raw_translations.items() if data is not _EVICTED),
+                         ['de', 'en', 'pt-br'])
+        with self.assertRaises(TypeError):
+            locales._raw_translations['pt-br']['other'] = 'changed'
+        self.assertEqual(locales['pt-br'].greeting, 'Olá')
+
+    def test_byte_limit(self):
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', max_resident_bytes=1)
+        self.assertEqual(self.resident(locales), ['en'])
+        self.assertEqual(locales['fr'].greeting, 'Bonjour')
+        self.assertEqual(self.resident(locales), ['en', 'fr'])
+
+    def test_held_translator_survives_eviction(self):
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', max_resident_locales=2)
+        german = locales['de']
+        locales['fr']
+        self.assertNotIn('de', self.resident(locales))
+        self.assertEqual(german.greeting, 'Hallo')
+        self.assertIsNot(locales['de'], german)
+
+    def test_evicted_locale_is_reloaded_from_its_file(self):
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', max_resident_locales=2)
+        locales['de']
+        locales['fr']
+        self.create_locale_file('de', {'greeting': 'Servus'})
+        self.assertEqual(locales['de'].greeting, 'Servus')
+
+    def test_compact_storage(self):
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', storage='compact', max_resident_locales=2)
+        for locale, greeting in self.LOCALES.items():
+            self.assertEqual(locales[locale].greeting, greeting)
+        self.assertEqual(locales['de'].only_en, 'English')
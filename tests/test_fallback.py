@@ -1,6 +1,10 @@
 import unittest
 
-from tests import BaseLocaleTest
+from tests import (
+    BaseLocaleTest,
+    TEST_LOCALES_DIR,
+    LocaleData
+)
 
 
 # noinspection PyArgumentEqualDefault
@@ -101,5 +105,51 @@ class TestFallback(BaseLocaleTest):
         self.assertEqual(locales['ru'].apples(25), '25 English apples')  # Fallback to en 'other'
 
 
+# noinspection PyArgumentEqualDefault
+class TestFallbackChains(BaseLocaleTest):
+    """Tests for multi-level fallback chains."""
+
+    def setUp(self):
+        self.create_locale_file('en', {'a': 'en a', 'b': 'en b', 'c': 'en c', 'd': 'en d',
+                                       'apples': {'one': '{count} en apple', 'other': '{count} en apples'}})
+        self.create_locale_file('es', {'a': 'es a', 'b': 'es b', 'c': 'es c'})
+        self.create_locale_file('pt', {'a': 'pt a', 'b': 'pt b',
+                                       'apples': {'one': '{count} pt maçã'}})
+        self.create_locale_file('pt-BR', {'a': 'pt-br a', 'apples': {'many': '{count} ignored'}})
+        self.create_locale_file('zh', {'a': 'zh a'})
+        self.create_locale_file('zh-Hant', {'b': 'zh-hant b'})
+
+    def test_explicit_chain_with_derived_parent(self):
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', fallback_chains={'PT': ['ES']})
+        translator = locales['pt-BR']
+        self.assertEqual(translator.fallback_chain, ['pt-br', 'pt', 'es', 'en'])
+        self.assertEqual(locales.fallback_chain('pt-br'), ['pt-br', 'pt', 'es', 'en'])
+        self.assertEqual(translator.a, 'pt-br a')
+        self.assertEqual(translator.b, 'pt b')
+        self.assertEqual(translator.c, 'es c')
+        self.assertEqual(translator.d, 'en d')
+
+    def test_derived_chain_skips_missing_levels(self):
+        locales = self.get_locale_data('en')
+        self.assertEqual(locales.fallback_chain('zh-hant-hk'), ['zh-hant-hk', 'zh-hant', 'zh', 'en'])
+        # Not loaded itself, so it is served by its first loaded parent
+        translator = locales['zh-Hant-HK']
+        self.assertIs(translator, locales['zh-hant'])
+        self.assertEqual(translator.a, 'zh a')
+        self.assertEqual(translator.b, 'zh-hant b')
+        self.assertEqual(translator.c, 'en c')
+
+    def test_plural_template_follows_chain(self):
+        locales = self.get_locale_data('en')
+        # 'pt-br' has no 'one'/'other', 'pt' has 'one', 'en' has 'other'
+        self.assertEqual(locales['pt-br'].apples(1), '1 pt maçã')
+        self.assertEqual(locales['pt-br'].apples(2), '2 en apples')
+
+    def test_cycles_are_ignored(self):
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', fallback_chains={'es': ['pt'], 'pt': ['es']})
+        self.assertEqual(locales.fallback_chain('pt'), ['pt', 'es', 'en'])
+        self.assertEqual(locales['es'].fallback_chain, ['es', 'pt', 'en'])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,64 @@
+import copy
+import gc
+import unittest
+
+from tests import BaseLocaleTest
+from src.doti18n.wrapped import LocaleList
+
+
+# noinspection PyArgumentEqualDefault
+class TestFreeze(BaseLocaleTest):
+    """Tests for LocaleData.freeze()."""
+
+    def setUp(self):
+        self.create_locale_file('en', {
+            'greeting': 'Hello',
+            'pages': [{'title': 'Home'}, {'title': 'About'}],
+            'apples': {'one': '{count} apple', 'other': '{count} apples'},
+        })
+        self.create_locale_file('ru', {'greeting': 'Привет'})
+        if hasattr(gc, 'unfreeze'):
+            self.addCleanup(gc.unfreeze)
+
+    def test_lookups_work_after_freeze(self):
+        locales = self.get_locale_data('en')
+        locales.freeze()
+        self.assertEqual(locales['ru'].greeting, 'Привет')
+        self.assertEqual(locales['ru'].pages[1].title, 'About')
+        self.assertIsInstance(locales['en'].pages, LocaleList)
+        self.assertEqual(len(locales['en'].pages), 2)
+        self.assertEqual(locales['ru'].apples(5), '5 apples')
+
+    def test_translators_are_prebuilt(self):
+        locales = self.get_locale_data('en')
+        locales.freeze()
+        self.assertEqual(sorted(locales._locale_translators_cache), ['en', 'ru'])
+
+    def test_raw_data_is_read_only(self):
+        locales = self.get_locale_data('en')
+        locales.freeze()
+        raw = locales._raw_translations['en']
+        with self.assertRaises(TypeError):
+            raw['greeting'] = 'changed'
+        with self.assertRaises(TypeError):
+            raw['pages'].append({})
+        with self.assertRaises(TypeError):
+            raw['apples'].update(one='changed')
+        self.assertEqual(copy.deepcopy(raw), raw)
+
+    @unittest.skipUnless(hasattr(gc, 'freeze'), "gc.freeze() is not available")
+    def test_gc_freeze(self):
+        locales = self.get_locale_data('en')
+        locales.freeze()
+        self.assertGreater(gc.get_freeze_count(), 0)
+
+    def test_reload_after_freeze(self):
+        locales = self.get_locale_data('en')
+        locales.freeze()
+        self.create_locale_file('ru', {'greeting': 'Здравствуйте'})
+        locales.reload()
+        self.assertEqual(locales['ru'].greeting, 'Здравствуйте')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,236 @@
+import logging
+import unittest
+from unittest import mock
+
+from tests import (
+    BaseLocaleTest,
+    LocaleData,
+    TEST_LOCALES_DIR
+)
+from src.doti18n import (
+    Instrumentation,
+    LookupObserver,
+    SlowLookupSampler
+)
+
+
+class RecordingObserver(LookupObserver):
+
+    def __init__(self):
+        self.lookups = []
+        self.renders = []
+        self.templates = []
+
+    def on_lookup(self, locale_code, path, found_locale_code, seconds):
+        self.lookups.append((locale_code, tuple(path), found_locale_code))
+
+    def on_render(self, locale_code, path, category, result, seconds, template=None, found_locale_code=None):
+        self.renders.append((locale_code, tuple(path), category, result))
+        self.templates.append((template, found_locale_code))
+
+
+# noinspection PyArgumentEqualDefault
+class TestInstrumentation(BaseLocaleTest):
+    """Tests for lookup observers and Instrumentation."""
+
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        self.create_locale_file('en', {
+            'messages': {'greeting': 'Hello', 'farewell': 'Bye'},
+            'apples': {'one': '{count} apple', 'other': '{count} apples'},
+        })
+        self.create_locale_file('ru', {
+            'messages': {'greeting': 'Привет'},
+            'apples': {'one': '{count} яблоко', 'few': '{count} яблока', 'many': '{count} яблок'},
+        })
+        self.locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', render_cache_size=16)
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(self.locales['ru']._observer)
+
+    def test_counters(self):
+        stats = Instrumentation()
+        self.locales.add_observer(stats)
+        ru = self.locales['ru']
+
+        ru.messages.greeting
+        ru.messages.farewell
+        ru.messages.missing
+        ru.apples(3)
+        ru.apples(5)
+        ru.apples(5)
+
+        snapshot = stats.snapshot()
+        # greeting, farewell, missing, apples x3
+        self.assertEqual(snapshot['lookups'], 6)
+        self.assertEqual(snapshot['misses'], 1)
+        self.assertEqual(snapshot['fallback_hits'], {'en': 1})
+        self.assertEqual(snapshot['plural_renders'], {'few': 1, 'many': 2})
+        self.assertEqual(set(snapshot['resolution_seconds']), {'messages', 'apples'})
+        self.assertGreater(snapshot['resolution_seconds']['messages'], 0)
+        self.assertGreater(snapshot['render_seconds'], 0)
+
+        stats.reset()
+        self.assertEqual(stats.snapshot()['lookups'], 0)
+
+    def test_observers_reach_existing_and_new_translators(self):
+        existing = self.locales['ru']
+        observer = RecordingObserver()
+        self.locales.add_observer(observer)
+        existing.messages.greeting
+        self.locales['en'].apples(1)
+        self.assertIn(('ru', ('messages', 'greeting'), 'ru'), observer.lookups)
+        self.assertEqual(observer.renders, [('en', ('apples',), 'one', '1 apple')])
+        self.assertEqual(observer.templates, [('{count} apple', 'en')])
+
+        self.locales.reload()
+        self.locales['ru'].messages.farewell
+        self.assertIn(('ru', ('messages', 'farewell'), 'en'), observer.lookups)
+
+    def test_several_observers_and_removal(self):
+        first, second = RecordingObserver(), RecordingObserver()
+        self.locales.add_observer(first)
+        self.locales.add_observer(second)
+        self.locales['ru'].messages.greeting
+        self.assertEqual(first.lookups, second.lookups)
+
+        self.locales.remove_observer(first)
+        self.locales['ru'].messages.greeting
+        self.assertEqual(len(first.lookups), 1)
+        self.assertEqual(len(second.lookups), 2)
+
+        self.locales.remove_observer(second)
+        self.assertIsNone(self.locales['ru']._observer)
+        with self.assertRaises(ValueError):
+            self.locales.remove_observer(second)
+
+    def test_dotted_access_is_one_lookup(self):
+        stats = Instrumentation()
+        observer = RecordingObserver()
+        self.locales.add_observer(stats)
+        self.locales.add_observer(observer)
+        self.locales['ru'].messages.greeting
+        self.assertEqual(observer.lookups, [('ru', ('messages', 'greeting'), 'ru')])
+        self.assertEqual(stats.snapshot()['lookups'], 1)
+        self.assertEqual(stats.snapshot()['misses'], 0)
+
+
+class TestSlowLookupSampler(unittest.TestCase):
+    """Tests for SlowLookupSampler."""
+
+    def test_keeps_slowest(self):
+        sampler = SlowLookupSampler(top_n=2)
+        sampler.on_lookup('ru', ['a'], 'ru', 0.001)
+        sampler.on_lookup('ru', ['b', 0, 'c'], 'en', 0.005)
+        sampler.on_lookup('ru', ['d'], None, 0.003)
+        sampler.on_render('ru', ['apples'], 'few', '3 яблока', 0.0001)
+
+        slowest = sampler.slowest()
+        self.assertEqual([record['path'] for record in slowest], ['b.0.c', 'd'])
+        self.assertEqual(slowest[0], {
+            'kind': 'lookup', 'locale': 'ru', 'path': 'b.0.c', 'depth': 3, 'seconds': 0.005,
+            'found_locale': 'en', 'miss': False, 'fallback': True,
+        })
+        self.assertTrue(slowest[1]['miss'])
+
+    def test_render_records(self):
+        sampler = SlowLookupSampler()
+        sampler.on_render('ru', ['apples'], 'few', '3 яблока', 0.002)
+        sampler.on_render('ru', ['pears'], 'one', None, 0.001)
+        self.assertEqual(sampler.slowest(), [
+            {'kind': 'render', 'locale': 'ru', 'path': 'apples', 'depth': 1, 'seconds': 0.002,
+             'category': 'few', 'error': False, 'length': 8, 'template_length': None,
+             'found_locale': None, 'fallback': False},
+            {'kind': 'render', 'locale': 'ru', 'path': 'pears', 'depth': 1, 'seconds': 0.001,
+             'category': 'one', 'error': True, 'length': None, 'template_length': None,
+             'found_locale': None, 'fallback': False},
+        ])
+
+    def test_intervals(self):
+        with mock.patch('src.doti18n.instrumentation.time.monotonic', side_effect=[0, 1, 2, 11, 12]):
+            sampler = SlowLookupSampler(interval=10)
+            sampler.on_lookup('en', ['a'], 'en', 0.1)
+            sampler.on_lookup('en', ['b'], 'en', 0.2)
+            sampler.on_lookup('en', ['c'], 'en', 0.01)
+            sampler.on_lookup('en', ['d'], 'en', 0.02)
+        self.assertEqual([record['path'] for record in sampler.previous()], ['b', 'a'])
+        self.assertEqual([record['path'] for record in sampler.slowest()], ['d', 'c'])
+
+    def test_threshold_callback(self):
+        breaches = []
+        sampler = SlowLookupSampler(threshold=0.01, callback=breaches.append)
+        sampler.on_lookup('en', ['fast'], 'en', 0.001)
+        sampler.on_lookup('en', ['slow'], 'en', 0.05)
+        self.assertEqual([record['path'] for record in breaches], ['slow'])
+
+
+# noinspection PyArgumentEqualDefault
+class TestSlowLookupSamplerIntegration(BaseLocaleTest):
+    """SlowLookupSampler registered on a LocaleData."""
+
+    def test_real_lookups(self):
+        self.create_locale_file('en', {
+            'pages': [{'title': 'Home'}],
+            'apples': {'one': 'apple', 'other': 'apples'},
+            'broken': {'one': '{name}', 'other': '{name}'},
+        })
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en')
+        sampler = SlowLookupSampler(top_n=100, threshold=-1, callback=lambda record: None)
+        locales.add_observer(sampler)
+        locales['en'].pages[0].title
+        locales['en'].apples(2)
+        with self.assertRaises(TypeError):
+            locales['en'].apples('two')
+        with self.assertRaises(ValueError):
+            locales['en'].broken(1)
+
+        paths = {(record['kind'], record['path']) for record in sampler.slowest()}
+        self.assertEqual(paths, {
+            ('lookup', 'pages.0.title'), ('lookup', 'apples'), ('render', 'apples'), ('lookup', 'broken'), ('render', 'broken'),
+        })
+        self.assertTrue(next(r for r in sampler.slowest() if r['kind'] == 'render' and r['path'] == 'broken')['error'])
+
+    def test_observed_render_resolves_the_template_once(self):
+        self.create_locale_file('en', {'apples': {'one': '{count} apple', 'other': '{count} apples'}})
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', render_cache_size=16)
+        observer = RecordingObserver()
+        locales.add_observer(observer)
+        translator = locales['en']
+        with mock.patch.object(translator, '_get_plural_template', wraps=translator._get_plural_template) as resolve:
+            self.assertEqual(translator.apples(2), '2 apples')
+            self.assertEqual(resolve.call_count, 1)
+            # Render cache hit
+            self.assertEqual(translator.apples(2), '2 apples')
+            self.assertEqual(resolve.call_count, 1)
+        self.assertEqual(observer.renders, [('en', ('apples',), 'other', '2 apples')] * 2)
+        self.assertEqual(observer.templates, [('{count} apples', 'en')] * 2)
+
+    def test_observed_render_error_is_not_masked(self):
+        self.create_locale_file('en', {'broken': {'one': '{name}', 'other': '{name}'}})
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en')
+        observer = RecordingObserver()
+        locales.add_observer(observer)
+        with self.assertRaisesRegex(ValueError, "Missing placeholder"):
+            locales['en'].broken(2)
+        self.assertEqual(observer.renders, [('en', ('broken',), 'other', None)])
+        self.assertEqual(observer.templates, [('{name}', 'en')])
+
+    def test_render_records_template_and_fallback(self):
+        self.create_locale_file('en', {
+            'apples': {'one': '{count} apple', 'other': '{count} apples'},
+            'pears': {'one': '{count} pear', 'other': '{count} pears'},
+        })
+        self.create_locale_file('ru', {'apples': {'one': '{count} яблоко', 'few': '{count} яблока'}})
+        sampler = SlowLookupSampler()
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en')
+        locales.add_observer(sampler)
+        locales['ru'].apples(3)
+        locales['ru'].pears(2)
+        renders = {record['path']: record for record in sampler.slowest() if record['kind'] == 'render'}
+        self.assertEqual(renders['apples']['template_length'], len('{count} яблока'))
+        self.assertEqual(renders['apples']['length'], len('3 яблока'))
+        self.assertFalse(renders['apples']['fallback'])
+        self.assertEqual(renders['pears']['template_length'], len('{count} pears'))
+        self.assertEqual(renders['pears']['found_locale'], 'en')
+        self.assertTrue(renders['pears']['fallback'])
@@ -0,0 +1,86 @@
+import unittest
+
+from tests import (
+    BaseLocaleTest,
+    TEST_LOCALES_DIR,
+    LocaleData
+)
+from src.doti18n.interning import (
+    Interner,
+    intern_translations
+)
+
+
+class TestInterner(unittest.TestCase):
+    """Tests for the interning pass itself."""
+
+    def test_result_is_equal(self):
+        data = {'a': {'b': [1, 1.0, True, None, 'x']}, 'c': 'x', 'd': {}}
+        self.assertEqual(Interner().intern(data), data)
+
+    def test_keys_values_and_subtrees_are_shared(self):
+        en = {'brand': ''.join(['Do', 'ti']), 'nav': [{'path': '/'}, {'path': '/'}], 'same': {'x': 'y'}}
+        de = {'brand': ''.join(['Do', 'ti']), 'nav': [{'path': '/'}], 'same': {'x': 'y'}}
+        interned, stats = intern_translations({'en': en, 'de': de, 'broken': None})
+
+        self.assertEqual(interned, {'en': en, 'de': de, 'broken': None})
+        self.assertIs(interned['en']['brand'], interned['de']['brand'])
+        self.assertIs(interned['en']['nav'][0], interned['en']['nav'][1])
+        self.assertIs(interned['en']['nav'][0], interned['de']['nav'][0])
+        self.assertIs(interned['en']['same'], interned['de']['same'])
+        en_keys = {id(key) for key in interned['en']}
+        self.assertTrue(all(id(key) in en_keys for key in interned['de']))
+
+        self.assertGreater(stats['values_deduplicated'], 0)
+        self.assertGreater(stats['subtrees_deduplicated'], 0)
+        self.assertGreater(stats['bytes_saved'], 0)
+
+    def test_equal_scalars_of_different_types_are_kept_apart(self):
+        interned = Interner().intern({'a': 1, 'b': True, 'c': 1.0, 'd': [1], 'e': [True]})
+        self.assertIs(interned['b'], True)
+        self.assertIsInstance(interned['c'], float)
+        self.assertIs(interned['e'][0], True)
+        self.assertIsNot(interned['d'], interned['e'])
+
+
+# noinspection PyArgumentEqualDefault
+class TestDeduplicatedLocaleData(BaseLocaleTest):
+    """Tests for LocaleData(deduplicate=True)."""
+
+    def setUp(self):
+        self.create_locale_file('en', {
+            'brand': 'Doti', 'menu': [{'title': 'Home', 'path': '/'}], 'apples': {'one': 'apple', 'other': 'apples'}
+        })
+        self.create_locale_file('fr', {
+            'brand': 'Doti', 'menu': [{'title': 'Accueil', 'path': '/'}], 'apples': {'one': 'apple', 'other': 'apples'}
+        })
+
+    def test_lookups_and_stats(self):
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', deduplicate=True)
+        self.assertGreater(locales.intern_stats['bytes_saved'], 0)
+        self.assertIs(locales._raw_translations['fr']['apples'], locales._raw_translations['en']['apples'])
+        self.assertEqual(locales['fr'].menu[0].title, 'Accueil')
+        self.assertEqual(locales['fr'].menu[0].path, '/')
+        self.assertEqual(locales['fr'].apples(2), 'apples')
+
+    def test_disabled_by_default(self):
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en')
+        self.assertIsNone(locales.intern_stats)
+
+    def test_freeze_keeps_sharing(self):
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', deduplicate=True)
+        locales.freeze()
+        self.assertIs(locales._raw_translations['fr']['apples'], locales._raw_translations['en']['apples'])
+        self.assertEqual(locales['fr'].apples(1), 'apple')
+
+    def test_reloaded_locale_shares_with_resident_ones(self):
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', deduplicate=True, max_resident_locales=1)
+        self.assertNotIsInstance(locales._raw_translations['fr'], dict)  # Evicted
+        self.assertEqual(locales['fr'].menu[0].title, 'Accueil')
+        fr, en = locales._raw_translations['fr'], locales._raw_translations['en']
+        self.assertIs(fr['apples'], en['apples'])
+        self.assertIs(fr['menu'][0]['path'], en['menu'][0]['path'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import contextlib
+import io
+import json
+import os
+import unittest
+
+from tests import (
+    BaseLocaleTest,
+    TEST_LOCALES_DIR
+)
+from src.doti18n.cli import main
+from src.doti18n.lint import lint_catalog
+
+try:
+    import babel
+except ImportError:
+    babel = None
+
+
+# noinspection PyArgumentEqualDefault
+class TestLint(BaseLocaleTest):
+    """Tests for the catalog linter."""
+
+    def setUp(self):
+        for filename in os.listdir(TEST_LOCALES_DIR):
+            os.remove(os.path.join(TEST_LOCALES_DIR, filename))
+        self.create_locale_file('en', {
+            'messages': {'greeting': 'Hello, {name}!', 'farewell': 'Bye', 'total': '{count} of {limit}'},
+            'pages': [{'title': 'Home'}, {'title': 'About'}],
+            'apples': {'one': '{count} apple', 'other': '{count} apples'},
+            'settings': {'theme': 'Theme', 'language': 'Language'},
+        })
+        self.create_locale_file('ru', {
+            'messages': {'greeting': 'Привет, {nmae}!', 'total': '{count} из {limit}', 'unused': 'Лишнее'},
+            'pages': [{'title': 'Главная'}],
+            'apples': {'one': 'яблоко', 'few': '{count} яблока', 'other': '{count} яблок'},
+            'settings': 'Настройки',
+        })
+
+    def issues(self, locale_code=None, kind=None, **kwargs):
+        return [
+            (issue['path'], issue['message']) for issue in lint_catalog(TEST_LOCALES_DIR, 'en', **kwargs)
+            if (locale_code is None or issue['locale'] == locale_code) and (kind is None or issue['kind'] == kind)
+        ]
+
+    def test_missing_and_extra_keys(self):
+        self.assertEqual(self.issues('ru', 'missing'), [
+            ('messages.farewell', "value of 'en' is missing"),
+            ('pages.1', "namespace (1 key) of 'en' is missing"),
+        ])
+        self.assertEqual(self.issues('ru', 'extra'), [('messages.unused', "value not in 'en'")])
+
+    def test_type_mismatch_hides_the_branch(self):
+        issues = self.issues('ru', 'type')
+        self.assertEqual(len(issues), 1)
+        self.assertEqual(issues[0][0], 'settings')
+        self.assertIn("is a value, but a namespace in 'en'", issues[0][1])
+        # Nothing reported below it
+        self.assertFalse([path for path, _ in self.issues('ru') if path.startswith('settings.')])
+
+    def test_placeholders(self):
+        self.assertEqual(self.issues('ru', 'placeholder'), [
+            ('messages.greeting', "uses placeholders {nmae} that 'en' doesn't pass"),
+            ('messages.greeting', "drops placeholders {name} of 'en'"),
+        ])
+
+        self.create_locale_file('de', {'messages': {'greeting': 'Hallo, {name!'}})
+        issues = self.issues('de', 'placeholder')
+        self.assertEqual(len(issues), 1)
+        self.assertTrue(issues[0][1].startswith("invalid template"))
+
+    @unittest.skipIf(babel is None, "Babel is not installed")
+    def test_plural_categories(self):
+        self.assertEqual(self.issues('ru', 'plural'), [
+            ('apples', "lacks plural categories many (rendered with 'other')"),
+        ])
+        self.assertEqual(self.issues('en', 'plural'), [])
+
+        self.create_locale_file('pl', {'apples': {'one': 'jabłko', 'few': 'jabłka'}})
+        self.assertIn("no 'other' form", self.issues('pl', 'plural')[0][1])
+
+    def test_errors_and_keys(self):
+        with open(os.path.join(TEST_LOCALES_DIR, 'fr.yaml'), 'w', encoding='utf-8') as f:
+            f.write("- not a dict\n")
+        with open(os.path.join(TEST_LOCALES_DIR, 'es.yml'), 'w', encoding='utf-8') as f:
+            f.write("messages: {greeting: [unclosed\n")
+        with open(os.path.join(TEST_LOCALES_DIR, 'de.yaml'), 'wb') as f:
+            f.write(b"\xff\xfemessages: {}\n")
+        self.create_locale_file('it', {404: 'Non trovato'})
+
+        self.assertIn("is not a dictionary", self.issues('fr', 'error')[0][1])
+        self.assertIn("can't be loaded", self.issues('es', 'error')[0][1])
+        self.assertIn("can't be loaded", self.issues('de', 'error')[0][1])
+        self.assertEqual(self.issues('it', 'key'), [('404', "int key 404 can't be looked up, quote it to make it a string")])
+
+        os.remove(os.path.join(TEST_LOCALES_DIR, 'en.yaml'))
+        self.assertEqual(self.issues('en', 'error'), [('', "no file for the default locale")])
+
+    def test_parallel_matches_serial(self):
+        for code in ('de', 'fr', 'pt-BR'):
+            self.create_locale_file(code, {'messages': {'greeting': '{name}'}, 'apples': {'other': 'x'}})
+        self.assertEqual(lint_catalog(TEST_LOCALES_DIR, jobs=2), lint_catalog(TEST_LOCALES_DIR, jobs=1))
+        self.assertIn('pt-br', {issue['locale'] for issue in lint_catalog(TEST_LOCALES_DIR, jobs=1)})
+
+    def test_cli(self):
+        with contextlib.redirect_stdout(io.StringIO()) as output, contextlib.redirect_stderr(io.StringIO()) as summary:
+            status = main(['lint', TEST_LOCALES_DIR, '-j', '1'])
+        self.assertEqual(status, 1)
+        self.assertIn("ru: missing: messages.farewell: value of 'en' is missing", output.getvalue())
+        self.assertIn("2 missing", summary.getvalue())
+
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            status = main(['lint', TEST_LOCALES_DIR, '-j', '1', '--json', '--ignore', 'missing'])
+        issues = json.loads(output.getvalue())
+        self.assertEqual(status, 1)
+        self.assertTrue(issues)
+        self.assertNotIn('missing', {issue['kind'] for issue in issues})
+
+        self.create_locale_file('ru', {
+            'messages': {'greeting': '{name}', 'farewell': 'Пока', 'total': '{count} {limit}'},
+            'pages': [{'title': 'a'}, {'title': 'b'}],
+            'apples': {'one': '{count}', 'few': '{count}', 'many': '{count}', 'other': '{count}'},
+            'settings': {'theme': 'Тема', 'language': 'Язык'},
+        })
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()) as summary:
+            self.assertEqual(main(['lint', TEST_LOCALES_DIR]), 0)
+        self.assertIn("no issues", summary.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+from tests import (
+    BaseLocaleTest,
+    TEST_LOCALES_DIR,
+    LocaleData
+)
+
+
+# noinspection PyArgumentEqualDefault
+class TestLocaleCodes(BaseLocaleTest):
+    """Tests for locale code normalization and aliases."""
+
+    def setUp(self):
+        self.create_locale_file('en', {'greeting': 'Hello'})
+        self.create_locale_file('pt_BR', {'greeting': 'Olá'})
+        self.create_locale_file('he', {'greeting': 'שלום'})
+        self.create_locale_file('nb', {'greeting': 'Hei'})
+
+    def test_spellings_share_translator(self):
+        locales = self.get_locale_data('EN')
+        self.assertIn('pt-br', locales.loaded_locales)
+        translator = locales['pt-BR']
+        for spelling in ('pt_BR', 'pt-br', 'PT-BR', ' pt_br '):
+            self.assertIs(locales[spelling], translator)
+            self.assertIn(spelling, locales)
+        self.assertEqual(translator.greeting, 'Olá')
+        self.assertEqual(locales.translator_cache_info()['size'], 1)
+
+    def test_builtin_aliases(self):
+        locales = self.get_locale_data('en')
+        self.assertEqual(locales.canonical_locale_code('iw'), 'he')
+        self.assertEqual(locales.canonical_locale_code('iw_IL'), 'he-il')
+        self.assertIs(locales['iw'], locales['he'])
+        self.assertEqual(locales['IW'].greeting, 'שלום')
+
+    def test_configured_aliases(self):
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', aliases={'no': 'nb'})
+        self.assertIs(locales['no'], locales['nb'])
+        self.assertIn('NO', locales)
+        self.assertEqual(locales.negotiate('no-NO, en;q=0.5').greeting, 'Hei')
+        self.assertEqual(locales.get('no').greeting, 'Hei')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -27,6 +27,21 @@ class TestLocaleDataApi(BaseLocaleTest):
         self.assertIsInstance(translator_non_existent, LocaleTranslator)
         self.assertEqual(translator_non_existent.some_key, None)  # Accessing non-existent key in non-strict default
 
+    def test_unknown_locales_share_default_translator(self):
+        self.create_locale_file('en', {'key': 'value'})
+        self.create_locale_file('ru', {'key': 'значение'})
+        locales = self.get_locale_data('en')
+        locales['ru']
+
+        for i in range(100):
+            self.assertIs(locales[f'xx-{i}'], locales['en'])
+        self.assertEqual(locales['unknown'].key, 'value')
+
+        info = locales.translator_cache_info()
+        self.assertEqual(info['size'], 2)
+        self.assertEqual(info['max_size'], len(locales._raw_translations))
+        self.assertEqual(info['unknown_lookups'], 101)
+
     # noinspection PyTypeChecker
     def test_contains(self):
         self.create_locale_file('en', {'key': 'value'})
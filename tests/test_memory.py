@@ -0,0 +1,135 @@
+import gc
+import logging
+import tracemalloc
+import unittest
+
+from tests import (
+    BaseLocaleTest,
+    TEST_LOCALES_DIR,
+    LocaleData
+)
+from src.doti18n.wrapped import NoneWrapper
+
+
+# noinspection PyArgumentEqualDefault
+class TestMemory(BaseLocaleTest):
+    """Memory regression tests."""
+
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+    def measure_retained(self, func):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            func()
+            gc.collect()
+            return tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+
+    def test_misses_do_not_accumulate(self):
+        self.create_locale_file('en', {'existing': 'value'})
+        self.create_locale_file('ru', {'existing': 'значение'})
+        locales = self.get_locale_data('en')
+        translators = [locales['en'], locales['ru']]
+
+        def miss_many_keys(offset):
+            for i in range(offset, offset + 20000):
+                # User-driven keys, chained access and several locales
+                getattr(translators[i % 2], f'missing_{i}').nested.deeper
+
+        # The miss reporter keeps a bounded number of unique misses, after that nothing accumulates
+        miss_many_keys(0)
+        self.assertEqual(len(locales.miss_reporter), locales.miss_reporter.max_keys)
+        self.assertLess(self.measure_retained(lambda: miss_many_keys(20000)), 64 * 1024)
+
+    def test_none_wrapper_is_compact(self):
+        self.assertFalse(hasattr(NoneWrapper, '_instances'))
+        value = NoneWrapper('en', 'missing')
+        self.assertFalse(hasattr(value, '__dict__'))
+        self.assertEqual(value, NoneWrapper('en', 'missing'))
+        self.assertNotEqual(value, NoneWrapper('ru', 'missing'))
+
+    def test_protocol_probes_do_not_chain(self):
+        value = NoneWrapper('en', 'missing')
+        self.assertFalse(hasattr(value, '__deepcopy__'))
+        self.assertEqual(value.anything._path, 'missing.anything')
+
+
+# noinspection PyArgumentEqualDefault
+class TestMemoryReport(BaseLocaleTest):
+    """Tests for LocaleData.memory_report."""
+
+    def setUp(self):
+        logging.disable(logging.INFO)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        self.create_locale_file('en', {
+            'title': 'Title',
+            'messages': {'greeting': 'Hello', 'farewell': 'Bye', 'nothing': None},
+            'pages': [{'title': 'Home'}, {'title': 'About'}],
+            'apples': {'one': 'apple', 'other': 'apples'},
+        })
+        self.create_locale_file('de', {'messages': {'greeting': 'Hallo'}})
+
+    def test_structure_and_leaf_counts(self):
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', render_cache_size=16)
+        locales['en'].apples(2)
+        report = locales.memory_report()
+
+        en = report['locales']['en']
+        self.assertEqual(en['leaves'], 7)
+        self.assertEqual(
+            {name: namespace['leaves'] for name, namespace in en['namespaces'].items()},
+            {'title': 1, 'messages': 3, 'pages': 2, 'apples': 1}
+        )
+        self.assertGreater(en['namespaces']['messages']['bytes'], en['namespaces']['title']['bytes'])
+        self.assertGreater(en['bytes'], sum(namespace['bytes'] for namespace in en['namespaces'].values()))
+        self.assertEqual(report['locales']['de']['leaves'], 1)
+        # Small ints, None and short strings are shared by CPython, so the total may be a bit less
+        self.assertLessEqual(
+            report['total_bytes'],
+            sum(locale['bytes'] for locale in report['locales'].values()) + report['key_pool_bytes']
+        )
+        self.assertEqual(report['caches']['translators']['entries'], 1)
+        self.assertEqual(report['caches']['render']['entries'], 1)
+        self.assertGreater(report['caches']['render']['bytes'], 0)
+
+    def test_shared_objects_are_counted_once_in_total(self):
+        self.create_locale_file('fr', {'messages': {'greeting': 'Hello', 'farewell': 'Bye', 'nothing': None}})
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', deduplicate=True)
+        report = locales.memory_report()
+        self.assertLess(report['total_bytes'], sum(locale['bytes'] for locale in report['locales'].values()))
+
+    def test_compact_storage(self):
+        report = LocaleData(TEST_LOCALES_DIR, default_locale='en', storage='compact').memory_report()
+        self.assertGreater(report['key_pool_bytes'], 0)
+        self.assertEqual(report['locales']['en']['leaves'], 7)
+        self.assertGreater(report['locales']['en']['namespaces']['messages']['bytes'], 0)
+
+    def test_catalog_memory_regression(self):
+        for locale in ('en', 'de', 'fr'):
+            data = {}
+            for key in range(2000):
+                data.setdefault(f'namespace_{key % 20}', {})[f'some_key_{key}'] = f'{locale} text number {key}'
+            self.create_locale_file(locale, data)
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            locales = LocaleData(TEST_LOCALES_DIR, default_locale='en')
+            gc.collect()
+            traced = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+        self.assertLess(traced / (3 * 2000), 512)
+        reported = locales.memory_report()['total_bytes']
+        self.assertGreater(reported, traced * 0.5)
+        self.assertLess(reported, traced * 1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from tests import (
+    BaseLocaleTest,
+    LocaleData,
+    TEST_LOCALES_DIR,
+    LOGGER_LOCALE_TRANSLATOR,
+    LOGGER_WRAPPED_LIST
+)
+from src.doti18n import MissReporter
+
+
+# noinspection PyArgumentEqualDefault
+class TestMissReporting(BaseLocaleTest):
+    """Tests for deduplicated, rate-limited miss warnings."""
+
+    def setUp(self):
+        self.create_locale_file('en', {'greeting': 'Hello', 'pages': ['Home', 'About']})
+        self.create_locale_file('ru', {'greeting': 'Привет'})
+
+    def test_each_miss_is_logged_once(self):
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en')
+        with self.assertLogs(LOGGER_LOCALE_TRANSLATOR, level='WARNING') as log_cm:
+            for _ in range(5):
+                locales['ru'].missing
+                locales['en'].missing
+            locales['ru'].other
+        self.assertEqual(len(log_cm.output), 3)
+        self.assertIn("Locale 'ru': key/index path 'missing' not found in translations", log_cm.output[0])
+
+        self.assertEqual(locales.missing_keys(), {'ru': {'missing': 5, 'other': 1}, 'en': {'missing': 5}})
+
+    def test_chained_and_list_misses_are_aggregated(self):
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en')
+        logging.disable(logging.WARNING)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        for _ in range(3):
+            locales['en'].missing.nested.deeper
+            self.assertIsNone(locales['en'].pages[5])
+
+        self.assertEqual(locales.missing_keys(), {'en': {
+            'missing': 3, 'missing.nested': 3, 'missing.nested.deeper': 3, 'pages.5': 3
+        }})
+
+    def test_list_miss_warning(self):
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en')
+        with self.assertLogs(LOGGER_WRAPPED_LIST, level='WARNING') as log_cm:
+            locales['en'].pages[2]
+            locales['en'].pages[2]
+        self.assertEqual(len(log_cm.output), 1)
+        self.assertIn("Index 2 out of bounds for list at path 'pages' (length 2)", log_cm.output[0])
+
+    def test_interval(self):
+        reporter = MissReporter(interval=60)
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', miss_reporter=reporter)
+        with mock.patch('src.doti18n.misses.time.monotonic', side_effect=[0, 10, 20, 61, 62]):
+            with self.assertLogs(LOGGER_LOCALE_TRANSLATOR, level='WARNING') as log_cm:
+                for _ in range(5):
+                    locales['en'].missing
+        self.assertEqual(len(log_cm.output), 2)
+        self.assertIn("(3 more times since the last report)", log_cm.output[1])
+        self.assertEqual(locales.missing_keys(), {'en': {'missing': 5}})
+
+    def test_bounded(self):
+        reporter = MissReporter(max_keys=2)
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', miss_reporter=reporter)
+        logging.disable(logging.WARNING)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        for i in range(5):
+            getattr(locales['en'], f'missing_{i}')
+        self.assertEqual(len(reporter), 2)
+        self.assertEqual(reporter.dropped, 3)
+
+        reporter.clear()
+        self.assertEqual(locales.missing_keys(), {})
+
+    def test_kept_across_reloads(self):
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en')
+        logging.disable(logging.WARNING)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        locales['en'].missing
+        locales.reload()
+        locales['en'].missing
+        self.assertEqual(locales.missing_keys(), {'en': {'missing': 2}})
+
+    def test_concurrent_repeated_miss(self):
+        threads, iterations = 16, 500
+        reporter = MissReporter()
+        locales = LocaleData(TEST_LOCALES_DIR, default_locale='en', miss_reporter=reporter)
+        lock = reporter._lock
+        acquisitions = []
+
+        class CountingLock:
+            def __enter__(self):
+                acquisitions.append(1)
+                return lock.__enter__()
+
+            def __exit__(self, *exc_info):
+                return lock.__exit__(*exc_info)
+
+        reporter._lock = CountingLock()
+        barrier = threading.Barrier(threads)
+
+        def hammer(_):
+            barrier.wait()
+            for _ in range(iterations):
+                locales['en'].missing
+
+        with self.assertLogs(LOGGER_LOCALE_TRANSLATOR, level='WARNING') as log_cm:
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                list(executor.map(hammer, range(threads)))
+        self.assertEqual(len(log_cm.output), 1)
+        # Only the first misses, racing to insert the key, take the lock
+        self.assertLessEqual(len(acquisitions), threads)
+        # Counted without the lock, so approximate
+        count = locales.missing_keys()['en']['missing']
+        self.assertLessEqual(count, threads * iterations)
+        self.assertGreater(count, threads * iterations // 2)
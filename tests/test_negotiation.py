@@ -0,0 +1,78 @@
+import unittest
+
+from tests import BaseLocaleTest
+from src.doti18n.negotiation import (
+    match_locale,
+    parse_accept_language
+)
+
+
+class TestParseAcceptLanguage(unittest.TestCase):
+    """Tests for Accept-Language parsing."""
+
+    def test_weights_and_order(self):
+        self.assertEqual(
+            parse_accept_language('fr-CH, fr;q=0.9, en;q=0.8, de;q=0.7, *;q=0.5'),
+            [('fr-ch', 1.0), ('fr', 0.9), ('en', 0.8), ('de', 0.7)]
+        )
+
+    def test_unsorted_and_equal_weights(self):
+        self.assertEqual(
+            parse_accept_language('en;q=0.5, ru, de;q=0.5, pt_BR'),
+            [('ru', 1.0), ('pt-br', 1.0), ('en', 0.5), ('de', 0.5)]
+        )
+
+    def test_invalid_entries_are_dropped(self):
+        self.assertEqual(parse_accept_language('en;q=0, ru;q=abc, de;q=2, , es'), [('es', 1.0)])
+        self.assertEqual(parse_accept_language(''), [])
+
+    def test_extra_parameters_are_ignored(self):
+        self.assertEqual(
+            parse_accept_language('fr;q=0.5;level=1, de;q=0.9, en;level=1, es;level=1;q=0.7, it;level=1;q=0'),
+            [('en', 1.0), ('de', 0.9), ('es', 0.7), ('fr', 0.5)]
+        )
+
+
+class TestMatchLocale(unittest.TestCase):
+    """Tests for matching candidates against available locales."""
+
+    def test_exact_language_and_variant(self):
+        available = ['en', 'pt', 'zh-hant', 'es-mx']
+        self.assertEqual(match_locale(['pt'], available), 'pt')
+        self.assertEqual(match_locale(['pt-br'], available), 'pt')
+        self.assertEqual(match_locale(['es'], available), 'es-mx')
+        self.assertEqual(match_locale(['zh-hant-hk'], available), 'zh-hant')
+        self.assertEqual(match_locale(['de', 'en-gb'], available), 'en')
+        self.assertIsNone(match_locale(['de'], available))
+
+
+# noinspection PyArgumentEqualDefault
+class TestNegotiate(BaseLocaleTest):
+    """Tests for LocaleData.negotiate."""
+
+    def test_negotiate(self):
+        self.create_locale_file('en', {'greeting': 'Hello'})
+        self.create_locale_file('ru', {'greeting': 'Привет'})
+        self.create_locale_file('pt-BR', {'greeting': 'Olá'})
+        locales = self.get_locale_data('en')
+
+        self.assertIs(locales.negotiate('ru-RU,ru;q=0.9,en;q=0.8'), locales['ru'])
+        self.assertIs(locales.negotiate('de;q=0.9, pt;q=0.8'), locales['pt-br'])
+        self.assertIs(locales.negotiate('de, fr'), locales['en'])
+        self.assertIs(locales.negotiate(['de', 'RU']), locales['ru'])
+        self.assertEqual(locales.negotiate('ru').greeting, 'Привет')
+
+    def test_results_are_cached(self):
+        self.create_locale_file('en', {'greeting': 'Hello'})
+        self.create_locale_file('ru', {'greeting': 'Привет'})
+        locales = self.get_locale_data('en')
+
+        for _ in range(10):
+            locales.negotiate('ru;q=0.9, en;q=0.8')
+        stats = locales._negotiation_cache.stats()
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hits'], 9)
+
+
+if __name__ == '__main__':
+    unittest.main()
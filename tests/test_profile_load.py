@@ -0,0 +1,91 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+from unittest import mock
+
+from tests import (
+    BaseLocaleTest,
+    TEST_LOCALES_DIR
+)
+from src.doti18n import profile_load
+
+
+class TestProfileLoad(BaseLocaleTest):
+    """Tests for the startup load profiler."""
+
+    def setUp(self):
+        self.create_locale_file('en', {
+            'messages': {'greeting': 'Hello', 'nothing': None},
+            'pages': [{'title': 'Home', 'meta': {'tags': ['a', 'b']}}],
+            'apples': {'one': 'apple', 'other': 'apples'},
+        })
+        self.create_locale_file('ru', {'messages': {'greeting': 'Привет'}})
+        with open(os.path.join(TEST_LOCALES_DIR, 'broken.yml'), 'w', encoding='utf-8') as f:
+            f.write("key: [unclosed\n")
+        self.addCleanup(os.remove, os.path.join(TEST_LOCALES_DIR, 'broken.yml'))
+
+    def test_profile_file(self):
+        record = profile_load.profile_file(os.path.join(TEST_LOCALES_DIR, 'en.yaml'))
+        self.assertEqual(record['loader'], 'SafeLoader')
+        self.assertEqual(record['size'], os.path.getsize(os.path.join(TEST_LOCALES_DIR, 'en.yaml')))
+        self.assertEqual(record['leaves'], 6)
+        self.assertEqual(record['max_depth'], 5)  # pages.0.meta.tags.0
+        self.assertEqual(record['plural_dicts'], 1)
+        self.assertGreater(record['parse_seconds'], 0)
+        self.assertGreater(record['memory_bytes'], 0)
+        self.assertIsNone(record['error'])
+
+    def test_errors_are_recorded(self):
+        record = profile_load.profile_file(os.path.join(TEST_LOCALES_DIR, 'broken.yml'))
+        self.assertIsNone(record['parse_seconds'])
+        self.assertNotIn('\n', record['error'])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            filepath = os.path.join(tmp, 'list.yaml')
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write("- item\n")
+            self.assertEqual(profile_load.profile_file(filepath)['error'], "root is not a dictionary")
+
+            filepath = os.path.join(tmp, 'utf16.yaml')
+            with open(filepath, 'wb') as f:
+                f.write(b"\xff\xfekey: value\n")
+            self.assertIn("can't decode", profile_load.profile_file(filepath)['error'])
+
+    def test_libyaml_errors_are_recorded(self):
+        class FailingLoader:
+            def __init__(self, stream):
+                raise profile_load.yaml.YAMLError("unsupported")
+
+        with mock.patch.object(profile_load.yaml, 'CSafeLoader', FailingLoader, create=True):
+            record = profile_load.profile_file(os.path.join(TEST_LOCALES_DIR, 'en.yaml'))
+        self.assertEqual(record['error'], "libyaml: unsupported")
+        self.assertIsNone(record['libyaml_seconds'])
+
+    def test_report_lists_top_offenders(self):
+        records = profile_load.profile_directory(TEST_LOCALES_DIR)
+        self.assertEqual([os.path.basename(record['file']) for record in records], ['broken.yml', 'en.yaml', 'ru.yaml'])
+
+        report = profile_load.format_report(records, top=1)
+        self.assertIn("broken.yml: not loaded", report)
+        self.assertIn("Total: 3 files", report)
+        top_memory = report.split("Top 1 by memory:\n")[1].splitlines()
+        self.assertEqual(len(top_memory), 1)
+        self.assertTrue(top_memory[0].strip().startswith("en.yaml:"))
+
+    def test_import_time(self):
+        self.assertGreater(profile_load.measure_import_time(with_babel=False, repeat=1), 0)
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = os.path.join(tmp, 'profile.json')
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                status = profile_load.main([TEST_LOCALES_DIR, '--no-import-time', '--json', json_path])
+            self.assertEqual(status, 0)
+            self.assertIn("Top 2 by parse time:", output.getvalue())
+            with open(json_path, encoding='utf-8') as f:
+                self.assertEqual(len(json.load(f)['files']), 3)
+
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(profile_load.main([os.path.join(TEST_LOCALES_DIR, 'missing')]), 2)
@@ -0,0 +1,102 @@
+import unittest
+
+from tests import (
+    BaseLocaleTest,
+    TEST_LOCALES_DIR,
+    LocaleData
+)
+from src.doti18n.cache import LRUCache, RenderCache
+
+
+# noinspection PyArgumentEqualDefault
+class TestRenderCache(BaseLocaleTest):
+    """Tests for the opt-in cache of rendered plural strings."""
+
+    def get_cached_locale_data(self, size=16):
+        return LocaleData(TEST_LOCALES_DIR, default_locale='en', render_cache_size=size)
+
+    def test_disabled_by_default(self):
+        self.create_locale_file('en', {'apples': {'one': '{count} apple', 'other': '{count} apples'}})
+        locales = self.get_locale_data('en')
+        self.assertIsNone(locales.render_cache)
+        self.assertEqual(locales['en'].apples(2), '2 apples')
+
+    def test_repeated_render_hits_cache(self):
+        self.create_locale_file('en', {'apples': {'one': '{count} apple', 'other': '{count} apples'}})
+        locales = self.get_cached_locale_data()
+        self.assertEqual(locales['en'].apples(3), '3 apples')
+        self.assertEqual(locales['en'].apples(3), '3 apples')
+        self.assertEqual(locales['en'].apples(1), '1 apple')
+
+        stats = locales.render_cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 2)
+        self.assertEqual(stats['size'], 2)
+
+    def test_kwargs_are_part_of_key(self):
+        self.create_locale_file('en', {'items': {'one': '{count} {name}', 'other': '{count} {name}s'}})
+        locales = self.get_cached_locale_data()
+        self.assertEqual(locales['en'].items(2, name='book'), '2 books')
+        self.assertEqual(locales['en'].items(2, name='pen'), '2 pens')
+        self.assertEqual(locales['en'].items(2, name='book'), '2 books')
+        self.assertEqual(locales.render_cache.stats()['hits'], 1)
+
+    def test_equal_values_of_other_types_are_distinct_keys(self):
+        self.create_locale_file('en', {'items': {'one': '{count} item {flag}', 'other': '{count} items {flag}'}})
+        locales = self.get_cached_locale_data()
+        self.assertEqual(locales['en'].items(2, flag=1), '2 items 1')
+        self.assertEqual(locales['en'].items(2, flag=True), '2 items True')
+        self.assertEqual(locales['en'].items(2, flag=1.0), '2 items 1.0')
+        self.assertEqual(locales.render_cache.stats()['hits'], 0)
+
+    def test_translator_built_across_a_reload_does_not_fill_the_new_cache(self):
+        self.create_locale_file('en', {'apples': {'one': '{count} old apple', 'other': '{count} old apples'}})
+        locales = self.get_cached_locale_data()
+        fallback_locales = locales._fallback_locales
+        reloaded = None
+
+        def reload_while_building(locale_code, raw_translations=None):
+            # Runs after the translator read the data snapshot
+            if reloaded is None:
+                self.create_locale_file('en', {'apples': {'one': '{count} apple', 'other': '{count} apples'}})
+                locales.reload()
+            return fallback_locales(locale_code, raw_translations)
+
+        locales._fallback_locales = reload_while_building
+        stale = locales['en']
+        reloaded = True
+        self.assertEqual(stale.apples(2), '2 old apples')
+        self.assertEqual(len(locales.render_cache), 0)
+        self.assertEqual(locales['en'].apples(2), '2 apples')
+
+    def test_unhashable_kwargs_bypass_cache(self):
+        self.create_locale_file('en', {'items': {'one': '{count} {names}', 'other': '{count} {names}'}})
+        locales = self.get_cached_locale_data()
+        self.assertEqual(locales['en'].items(2, names=['a']), "2 ['a']")
+        stats = locales.render_cache.stats()
+        self.assertEqual(stats['uncacheable'], 1)
+        self.assertEqual(stats['size'], 0)
+
+    def test_size_bound(self):
+        self.create_locale_file('en', {'apples': {'one': '{count} apple', 'other': '{count} apples'}})
+        locales = self.get_cached_locale_data(size=2)
+        for count in range(10):
+            locales['en'].apples(count)
+        self.assertEqual(len(locales.render_cache), 2)
+
+    def test_lru_eviction_order(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            RenderCache(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
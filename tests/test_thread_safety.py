@@ -0,0 +1,106 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from tests import BaseLocaleTest
+from src.doti18n.wrapped import NoneWrapper
+
+
+# noinspection PyArgumentEqualDefault
+class TestThreadSafety(BaseLocaleTest):
+    """Stress tests for concurrent lookups and reloads."""
+
+    THREADS = 16
+    ITERATIONS = 500
+
+    def run_in_threads(self, func):
+        barrier = threading.Barrier(self.THREADS)
+
+        def worker(index):
+            barrier.wait()
+            return func(index)
+
+        with ThreadPoolExecutor(max_workers=self.THREADS) as executor:
+            return list(executor.map(worker, range(self.THREADS)))
+
+    def test_concurrent_getitem_returns_single_translator(self):
+        self.create_locale_file('en', {'key': 'value'})
+        self.create_locale_file('ru', {'key': 'значение'})
+        locales = self.get_locale_data('en')
+
+        results = self.run_in_threads(lambda i: locales['ru' if i % 2 else 'RU'])
+        self.assertEqual(len({id(translator) for translator in results}), 1)
+        self.assertIs(results[0], locales['ru'])
+
+    def test_concurrent_lookups(self):
+        self.create_locale_file('en', {
+            'greeting': 'Hello',
+            'nested': {'items': [{'name': 'first'}, {'name': 'second'}]},
+            'apples': {'one': '{count} apple', 'other': '{count} apples'},
+        })
+        self.create_locale_file('ru', {'greeting': 'Привет'})
+        locales = self.get_locale_data('en')
+
+        def hammer(index):
+            locale = 'ru' if index % 2 else 'en'
+            for i in range(self.ITERATIONS):
+                translator = locales[locale]
+                expected_greeting = 'Привет' if locale == 'ru' else 'Hello'
+                if translator.greeting != expected_greeting:
+                    return False
+                if translator.nested.items[i % 2].name != ('first', 'second')[i % 2]:
+                    return False
+                if locales['en'].apples(i) != (f'{i} apple' if i == 1 else f'{i} apples'):
+                    return False
+            return True
+
+        self.assertTrue(all(self.run_in_threads(hammer)))
+
+    def test_concurrent_missing_keys(self):
+        self.create_locale_file('en', {})
+        locales = self.get_locale_data('en')
+
+        results = self.run_in_threads(lambda i: locales['en'].concurrently_missing_key)
+        for value in results:
+            self.assertIsInstance(value, NoneWrapper)
+            self.assertEqual(value, results[0])
+            self.assertEqual(value, None)
+
+    def test_reload_while_reading(self):
+        self.create_locale_file('en', {'key': 'old'})
+        locales = self.get_locale_data('en')
+        stop = threading.Event()
+        seen = set()
+
+        def reader():
+            while not stop.is_set():
+                seen.add(locales['en'].key)
+
+        readers = [threading.Thread(target=reader) for _ in range(4)]
+        for thread in readers:
+            thread.start()
+        try:
+            self.create_locale_file('en', {'key': 'new'})
+            for _ in range(20):
+                locales.reload()
+        finally:
+            stop.set()
+            for thread in readers:
+                thread.join()
+
+        self.assertEqual(locales['en'].key, 'new')
+        self.assertTrue(seen <= {'old', 'new'})
+
+    def test_reload_resets_translator_cache(self):
+        self.create_locale_file('en', {'key': 'old'})
+        locales = self.get_locale_data('en')
+        old_translator = locales['en']
+        self.create_locale_file('en', {'key': 'new'})
+        locales.reload()
+        self.assertIsNot(locales['en'], old_translator)
+        self.assertEqual(locales['en'].key, 'new')
+        self.assertEqual(old_translator.key, 'old')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import json
+import logging
+from unittest import mock
+
+from tests import (
+    BaseLocaleTest,
+    LocaleData,
+    TEST_LOCALES_DIR
+)
+from src.doti18n import UsageTracker
+
+
+# noinspection PyArgumentEqualDefault
+class TestUsageTracker(BaseLocaleTest):
+    """Tests for key usage tracking."""
+
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        self.create_locale_file('en', {
+            'messages': {'greeting': 'Hello', 'farewell': 'Bye', 'nothing': None},
+            'pages': [{'title': 'Home'}, {'title': 'About'}],
+            'apples': {'one': 'apple', 'other': 'apples'},
+            'empty': {},
+        })
+        self.create_locale_file('ru', {'messages': {'greeting': 'Привет'}})
+        self.locales = LocaleData(TEST_LOCALES_DIR, default_locale='en')
+
+    def test_key_paths(self):
+        self.assertEqual(self.locales.key_paths(), [
+            'apples', 'messages.farewell', 'messages.greeting', 'messages.nothing', 'pages.0.title', 'pages.1.title',
+        ])
+        self.assertEqual(self.locales.key_paths('RU'), ['messages.greeting'])
+        self.assertEqual(self.locales.key_paths('xx'), [])
+
+    def test_records_resolved_paths(self):
+        tracker = UsageTracker()
+        self.locales.add_observer(tracker)
+        self.locales['ru'].messages.greeting
+        self.locales['ru'].messages.farewell  # Fallback hits count too
+        self.locales['en'].pages[1].title
+        self.locales['en'].apples(3)
+        self.locales['en'].messages.missing
+
+        self.assertEqual(tracker.used_paths(), {
+            'messages.greeting': 1, 'messages.farewell': 1, 'pages.1.title': 1, 'apples': 1,
+        })
+        self.assertEqual(
+            tracker.unused_keys(self.locales),
+            ['messages.nothing', 'pages.0.title']
+        )
+
+    def test_sampling(self):
+        tracker = UsageTracker(sample_rate=0.5)
+        self.locales.add_observer(tracker)
+        with mock.patch.object(tracker, '_random', side_effect=[0.1, 0.9, 0.4, 0.6]):
+            for _ in range(4):
+                self.locales['en'].apples
+        self.assertEqual(tracker.used_paths(), {'apples': 2})
+
+        with self.assertRaises(ValueError):
+            UsageTracker(sample_rate=2)
+
+    def test_bounded(self):
+        tracker = UsageTracker(max_paths=2)
+        self.locales.add_observer(tracker)
+        self.locales['en'].messages.greeting
+        self.locales['en'].apples
+        self.locales['en'].pages[0].title
+        self.assertEqual(tracker.used_paths(), {'messages.greeting': 1, 'apples': 1})
+        self.assertEqual(tracker.dropped, 1)
+
+    def test_export_and_merge(self):
+        first, second = UsageTracker(), UsageTracker()
+        first.on_lookup('en', ['apples'], 'en', 0.0)
+        second.on_lookup('ru', ['apples'], 'en', 0.0)
+        second.on_lookup('ru', ['messages', 'greeting'], 'ru', 0.0)
+
+        exported = json.loads(json.dumps(first.export()))
+        merged = UsageTracker.from_exports([exported, second.export()])
+        self.assertEqual(merged.used_paths(), {'apples': 2, 'messages.greeting': 1})
+        self.assertIn('pages.0.title', merged.unused_keys(self.locales))
+
+        with self.assertRaises(ValueError):
+            merged.merge({'version': 0, 'paths': {}})